@@ -27,6 +27,7 @@ export function AuthProvider({ children }) {
         } catch (error) {
           
           localStorage.removeItem('token');
+          localStorage.removeItem('refresh_token');
           setToken(null);
           setUser(null);
         }
@@ -53,6 +54,7 @@ export function AuthProvider({ children }) {
       }
       
       localStorage.setItem('token', response.access_token);
+      localStorage.setItem('refresh_token', response.refresh_token);
       setToken(response.access_token);
       
       // Obtener datos del usuario desde el token
@@ -86,7 +88,9 @@ export function AuthProvider({ children }) {
 
   const logout = () => {
     console.log("AuthContext - Logging out."); // Nuevo
+    authService.logout(localStorage.getItem('token'));
     localStorage.removeItem('token');
+    localStorage.removeItem('refresh_token');
     setToken(null);
     setUser(null);
     setIsLoading(false);
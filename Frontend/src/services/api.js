@@ -23,4 +23,45 @@ api.interceptors.request.use(
   }
 );
 
+// El access token dura pocos minutos: ante un 401 se renueva una sola vez con el
+// refresh token, compartiendo la petición entre llamadas concurrentes
+let refreshPromise = null;
+
+const refreshAccessToken = async () => {
+  const refreshToken = localStorage.getItem('refresh_token');
+  if (!refreshToken) {
+    throw new Error('No refresh token');
+  }
+  const response = await axios.post(`${API_URL.replace(/\/$/, '')}/auth/refresh`, {
+    refresh_token: refreshToken,
+  });
+  localStorage.setItem('token', response.data.access_token);
+  localStorage.setItem('refresh_token', response.data.refresh_token);
+  return response.data.access_token;
+};
+
+api.interceptors.response.use(
+  (response) => response,
+  async (error) => {
+    const original = error.config;
+    const isAuthRoute = original?.url?.replace(/^\//, '').startsWith('auth/');
+    if (error.response?.status !== 401 || !original || original._retry || isAuthRoute) {
+      return Promise.reject(error);
+    }
+    original._retry = true;
+    try {
+      refreshPromise = refreshPromise || refreshAccessToken();
+      const token = await refreshPromise;
+      original.headers.Authorization = `Bearer ${token}`;
+      return api(original);
+    } catch (refreshError) {
+      localStorage.removeItem('token');
+      localStorage.removeItem('refresh_token');
+      return Promise.reject(error);
+    } finally {
+      refreshPromise = null;
+    }
+  }
+);
+
 export default api;
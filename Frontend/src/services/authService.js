@@ -14,6 +14,14 @@ const authService = {
     return response.data;
   },
 
+  // Revoca la sesión en el servidor; si falla, el cierre local sigue adelante
+  logout: (token) => {
+    if (!token) return;
+    api.post('/auth/logout', null, {
+      headers: { Authorization: `Bearer ${token}` },
+    }).catch(() => {});
+  },
+
   register: async (userData) => {
     // Si userData es una instancia de FormData, Axios automáticamente establece el Content-Type a multipart/form-data
     const response = await api.post('/auth/register', userData, {
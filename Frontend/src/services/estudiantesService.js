@@ -8,7 +8,7 @@ const estudiantesService = {
     const response = await api.get('users/', { params });
     // Filtrar por rol de estudiante si la API devuelve todos los usuarios
     // const estudiantes = response.data.filter(user => user.id_rol === ID_ROL_ESTUDIANTE);
-    return response.data; // Devolver todos los usuarios por ahora
+    return response.data.items; // Devolver todos los usuarios por ahora
   },
 
   createEstudiante: async (userData) => {
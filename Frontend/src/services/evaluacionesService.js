@@ -3,7 +3,7 @@ import api from './api';
 const evaluacionesService = {
   getEvaluacionesByProject: async (projectId) => {
     const response = await api.get(`evaluaciones/project/${projectId}`);
-    return response.data;
+    return response.data.items;
   },
 
   getEvaluacionesByUser: async (userId) => {
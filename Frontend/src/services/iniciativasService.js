@@ -5,7 +5,7 @@ const API_URL = 'http://localhost:8000/api/v1/iniciativas';  // cambiado de /api
 const iniciativasService = {
   getIniciativas: async (params) => {
     const response = await api.get('iniciativas/', { params });
-    return response.data;
+    return response.data.items;
   },
 
   createIniciativa: async (iniciativaData) => {
@@ -3,12 +3,12 @@ import api from './api';
 const proyectosEstudiantesService = {
   getProyectosForStudent: async (studentId) => {
     const response = await api.get(`proyectos-estudiantes/student/${studentId}`);
-    return response.data;
+    return response.data.items;
   },
 
   getStudentsForProject: async (projectId) => {
     const response = await api.get(`proyectos-estudiantes/project/${projectId}`);
-    return response.data;
+    return response.data.items;
   },
 
   createProjectStudent: async (projectStudentData) => {
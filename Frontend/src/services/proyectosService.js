@@ -6,7 +6,7 @@ const proyectosService = {
   getProyectos: async (params) => {
     const response = await api.get('proyectos/', { params });
     
-    return response.data;
+    return response.data.items;
   },
 
   createProyecto: async (projectData) => {
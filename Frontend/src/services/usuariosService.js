@@ -36,7 +36,7 @@ const usuariosService = {
 
   getUsuarios: async (params) => {
     const response = await api.get('users/', { params });
-    return response.data;
+    return response.data.items;
   },
 };
 
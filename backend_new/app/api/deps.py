@@ -1,15 +1,19 @@
 from typing import Generator
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
-from app.db.session import AsyncSessionLocal
+from app.db.unit_of_work import unit_of_work
 from app.core.config import settings
 from app.core.security import ALGORITHM
-from app.models.user import User
+from app.core.cache import principal_cache
+from app.core.revocation import revoked_sessions
+from app.core.roles import COORDINADOR
+from app.crud.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageRequest
+from app.crud.user import user as crud_user
+from app.schemas.user import UserSnapshot
 from app.schemas.token import TokenPayload # This schema will be created next
 
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -17,44 +21,65 @@ reusable_oauth2 = OAuth2PasswordBearer(
 )
 
 async def get_db() -> Generator:
-    session = AsyncSessionLocal()
-    try:
+    """
+    The request's unit of work: every write of the request commits together at
+    the end. Depend on it with scope="function" so the commit happens before the
+    response is sent, not after. No connection is taken until the first query;
+    call release_connection() after reads that precede slow non-DB work.
+    """
+    async with unit_of_work() as session:
         yield session
-    finally:
-        await session.close()
 
-async def get_current_user(
-    db: AsyncSession = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> User:
+def get_page(
+    cursor: str | None = Query(None, description="`next_cursor` of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    skip: int | None = Query(None, ge=0, deprecated=True, description="OFFSET paging, ignored with `cursor`"),
+) -> PageRequest:
+    return PageRequest(limit=limit, cursor=cursor, skip=skip)
+
+async def get_token_payload(token: str = Depends(reusable_oauth2)) -> TokenPayload:
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[ALGORITHM]
         )
         token_data = TokenPayload(**payload)
     except (jwt.JWTError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    result = await db.execute(select(User).where(User.id_usuario == token_data.sub))
-    user = result.scalar_one_or_none()
+        raise credentials_exception
+    # Sessions closed through /auth/logout
+    if token_data.sid is not None and revoked_sessions.is_revoked(token_data.sid):
+        raise credentials_exception
+    return token_data
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_db, scope="function"), token_data: TokenPayload = Depends(get_token_payload)
+) -> UserSnapshot:
+    cached = principal_cache.get(token_data.sub)
+    if cached is not None:
+        return cached
+
+    epoch = principal_cache.epoch()
+    user = await crud_user.get(db, token_data.sub)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    snapshot = UserSnapshot.model_validate(user)
+    principal_cache.set(token_data.sub, snapshot, epoch=epoch)
+    return snapshot
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: UserSnapshot = Depends(get_current_user),
+) -> UserSnapshot:
     # User is considered active if they exist and are authenticated
     return current_user
 
 async def get_current_active_coordinator(
-    current_user: User = Depends(get_current_active_user),
-) -> User:
-    # Assuming role ID for coordinator is 1 (based on init_db.py)
-    if current_user.id_rol != 1:
+    current_user: UserSnapshot = Depends(get_current_active_user),
+) -> UserSnapshot:
+    if current_user.id_rol != COORDINADOR:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="The user doesn't have enough privileges"
         )
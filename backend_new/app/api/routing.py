@@ -0,0 +1,41 @@
+import functools
+import inspect
+
+from fastapi.routing import APIRoute
+from starlette.responses import Response
+
+from app.db.batch_loader import load_relationships
+from app.db.load_plan import load_plan, loading_by, planned_model
+
+
+class BatchLoadingRoute(APIRoute):
+    """
+    Route whose response gets its nested relationships loaded in batches (see
+    app.db.batch_loader) after the endpoint returns and before it is serialized,
+    while the request's session is still open. An endpoint marked with
+    @eager_load(Model) loads that model by its response_model's plan instead
+    (see app.db.load_plan), and the batch loader only fills in what's left.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        # Sync endpoints run in a worker thread and can't use the async session
+        if inspect.iscoroutinefunction(endpoint):
+            endpoint = self._loading_relationships(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+        self.planned_model = planned_model(endpoint)
+
+    def _loading_relationships(self, endpoint):
+        # wraps() keeps the signature FastAPI reads the endpoint's dependencies from
+        @functools.wraps(endpoint)
+        async def call(*args, **kwargs):
+            if self.planned_model is None:
+                content = await endpoint(*args, **kwargs)
+            else:
+                # Built on first use, once every model is mapped; cached afterwards
+                with loading_by(load_plan(self.planned_model, self.response_model)):
+                    content = await endpoint(*args, **kwargs)
+            if self.response_model is not None and not isinstance(content, Response):
+                await load_relationships(content, self.response_model)
+            return content
+
+        return call
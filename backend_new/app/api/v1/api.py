@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, users, initiatives, documentos_iniciativa, projects, project_students, milestones, criteria, evaluations, comments, messages, notifications, audits, roles, postulaciones
+from app.api.v1.endpoints import auth, users, initiatives, documentos_iniciativa, projects, project_students, milestones, criteria, evaluations, comments, messages, notifications, audits, roles, postulaciones, metrics
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
@@ -18,3 +18,4 @@ api_router.include_router(notifications.router, prefix="/notificaciones", tags=[
 api_router.include_router(audits.router, prefix="/auditoria", tags=["audits"])
 api_router.include_router(roles.router, prefix="", tags=["roles"])
 api_router.include_router(postulaciones.router, prefix="/postulaciones", tags=["postulaciones"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
@@ -2,58 +2,76 @@ import os
 import uuid # Para generar nombres de archivo únicos
 from datetime import timedelta
 from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form # Modificado
+from fastapi import APIRouter, Depends, HTTPException, Request, status, UploadFile, File, Form # Modificado
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
-from app.core.security import verify_password, create_access_token
+from app.api.deps import get_db, get_token_payload
+from app.api.routing import BatchLoadingRoute
+from app.core.security import create_access_token
+from app.core.revocation import revoked_sessions
+from app.core.rate_limit import client_ip, login_throttle, LoginThrottled
+from app.core.hashing import password_hasher, PasswordHasherBusy
 from app.core.config import settings
 from app.crud.user import user as crud_user
-from app.schemas.token import Token
+from app.crud.token import token as crud_token
+from app.db.unit_of_work import after_commit, release_connection
+from app.schemas.token import Token, TokenPayload, RefreshRequest
 from app.schemas.user import UserCreate, User # Modificado
 from app.schemas.login_response import TokenResponse # New import
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
 # Directorio donde se guardarán las fotos
 UPLOAD_DIR = "static/uploads" # Debe coincidir con el app.mount en main.py
 
 @router.post("/login", response_model=TokenResponse) # Changed response_model
 async def login_access_token(
-    db: AsyncSession = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
+    request: Request, db: AsyncSession = Depends(get_db, scope="function"), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible token login, get an an access token for future requests
     """
     try:
-        user = await crud_user.get_user_by_email(db, email=form_data.username)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect email or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # Verificar la contraseña
-        if not verify_password(form_data.password, user.password):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect email or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Throttled attempts are refused before any bcrypt work
+        await login_throttle.admit(form_data.username, client_ip(request))
+        async with login_throttle.verification():
+            user = await crud_user.get_user_by_email(db, email=form_data.username)
+            if not user:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Incorrect email or password",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            # No connection held through bcrypt; the writes below take one again
+            await release_connection(db)
+
+            # Verificar la contraseña
+            verified, new_hash = await password_hasher.verify_and_update(form_data.password, user.password)
+            if not verified:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Incorrect email or password",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
         
+        user_id, id_rol = user.id_usuario, user.id_rol
+        # Stored hash uses another bcrypt cost (BCRYPT_ROUNDS changed): upgrade it now
+        if new_hash:
+            await crud_user.update_password_hash(db, user_id, new_hash)
+        session_id, refresh_token = await crud_token.create_session(db, user_id)
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         response_data = TokenResponse(
             access_token=create_access_token(
-                user.id_usuario, expires_delta=access_token_expires
+                user_id, expires_delta=access_token_expires, session_id=session_id
             ),
+            refresh_token=refresh_token,
             token_type="bearer",
-            id_rol=user.id_rol
+            id_rol=id_rol
         )
         return response_data
-    except HTTPException:
-        # Re-raise HTTP exceptions (like authentication failures)
+    except (HTTPException, PasswordHasherBusy, LoginThrottled):
+        # Re-raise HTTP exceptions (like authentication failures) and load shedding
         raise
     except Exception as e:
         # Log the error and return a generic error message
@@ -65,10 +83,56 @@ async def login_access_token(
             detail=f"Internal server error during login: {str(e)}"
         )
 
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_access_token(
+    body: RefreshRequest, db: AsyncSession = Depends(get_db, scope="function")
+) -> Any:
+    """
+    Exchange a refresh token for a new access token. The refresh token is rotated,
+    so the one sent can't be used again.
+    """
+    rotated = await crud_token.rotate_session(db, body.refresh_token)
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    session_id, user_id, refresh_token = rotated
+    user = await crud_user.get(db, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return TokenResponse(
+        access_token=create_access_token(
+            user.id_usuario, expires_delta=access_token_expires, session_id=session_id
+        ),
+        refresh_token=refresh_token,
+        token_type="bearer",
+        id_rol=user.id_rol
+    )
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    db: AsyncSession = Depends(get_db, scope="function"), token_data: TokenPayload = Depends(get_token_payload)
+) -> None:
+    """
+    Revoke the current session: its refresh token and every access token issued for it
+    """
+    if token_data.sid is None:
+        return
+    expires_at = await crud_token.revoke_session(db, token_data.sid, token_data.sub)
+    if expires_at is not None:
+        after_commit(db, lambda: revoked_sessions.add(token_data.sid, expires_at))
+
 @router.post("/register", response_model=User)
 async def register_user(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     nombre: str = Form(...),
     email: str = Form(...),
     password: str = Form(...),
@@ -92,6 +156,8 @@ async def register_user(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Un usuario con este email ya existe en el sistema.",
             )
+        # The photo is saved and the password hashed without holding a connection
+        await release_connection(db)
 
         foto_url = None
         if foto and foto.filename: # Asegurarse de que hay un archivo y un nombre de archivo
@@ -125,8 +191,10 @@ async def register_user(
             foto=foto_url # Guardar la URL de la foto
         )
         
-        user = await crud_user.create_user(db, user_in_db)
+        user = await crud_user.create(db, user_in_db)
         return user
+    except (HTTPException, PasswordHasherBusy):
+        raise
     except Exception as e:
         print(f"Error during user registration: {e}") # Para depuración
         raise HTTPException(
@@ -2,30 +2,33 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_db, get_current_active_user, get_page
+from app.api.routing import BatchLoadingRoute
+from app.core.roles import COORDINADOR
 from app.crud.comment import comment as crud_comment
+from app.crud.pagination import PageRequest
 from app.schemas.comment import Comment, CommentCreate, CommentUpdate
+from app.schemas.page import Page
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
-@router.get("/project/{project_id}", response_model=list[Comment])
+@router.get("/project/{project_id}", response_model=Page[Comment])
 async def read_comments_by_project(
     project_id: int,
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    db: AsyncSession = Depends(get_db, scope="function"),
+    page: PageRequest = Depends(get_page),
     current_user: Any = Depends(get_current_active_user), # Requires authentication
 ) -> Any:
     """
     Retrieve comments for a specific project.
     """
-    comments = await crud_comment.get_comments_by_project(db, project_id=project_id, skip=skip, limit=limit)
+    comments = await crud_comment.get_comments_by_project(db, project_id=project_id, page=page)
     return comments
 
 @router.post("/", response_model=Comment)
 async def create_comment(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     comment_in: CommentCreate,
     current_user: Any = Depends(get_current_active_user), # Any active user can create comments
 ) -> Any:
@@ -34,13 +37,13 @@ async def create_comment(
     """
     # Ensure the comment is linked to the current user
     comment_in.id_usuario = current_user.id_usuario
-    comment = await crud_comment.create_comment(db, comment_in)
+    comment = await crud_comment.create(db, comment_in)
     return comment
 
 @router.put("/{comment_id}", response_model=Comment)
 async def update_comment(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     comment_id: int,
     comment_in: CommentUpdate,
     current_user: Any = Depends(get_current_active_user), # Only creator or coordinator can update
@@ -48,7 +51,7 @@ async def update_comment(
     """
     Update a comment.
     """
-    comment = await crud_comment.get_comment(db, comment_id=comment_id)
+    comment = await crud_comment.get(db, comment_id)
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -56,26 +59,26 @@ async def update_comment(
         )
     
     # Check if current user is the creator or a coordinator
-    if comment.id_usuario != current_user.id_usuario and current_user.id_rol != 1: # Assuming 1 is coordinator role
+    if comment.id_usuario != current_user.id_usuario and current_user.id_rol != COORDINADOR:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions to update this comment",
         )
     
-    comment = await crud_comment.update_comment(db, comment_id=comment_id, comment_in=comment_in)
+    comment = await crud_comment.update(db, comment_id, comment_in)
     return comment
 
 @router.delete("/{comment_id}", response_model=Comment)
 async def delete_comment(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     comment_id: int,
     current_user: Any = Depends(get_current_active_user), # Only creator or coordinator can delete
 ) -> Any:
     """
     Delete a comment.
     """
-    comment = await crud_comment.get_comment(db, comment_id=comment_id)
+    comment = await crud_comment.get(db, comment_id)
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -83,11 +86,11 @@ async def delete_comment(
         )
     
     # Check if current user is the creator or a coordinator
-    if comment.id_usuario != current_user.id_usuario and current_user.id_rol != 1: # Assuming 1 is coordinator role
+    if comment.id_usuario != current_user.id_usuario and current_user.id_rol != COORDINADOR:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions to delete this comment",
         )
     
-    comment = await crud_comment.delete_comment(db, comment_id=comment_id)
+    comment = await crud_comment.remove(db, comment_id)
     return comment
\ No newline at end of file
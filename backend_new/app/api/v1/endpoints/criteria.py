@@ -2,42 +2,44 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_active_user, get_current_active_coordinator
+from app.api.deps import get_db, get_current_active_user, get_current_active_coordinator, get_page
+from app.api.routing import BatchLoadingRoute
 from app.crud.criterion import criterion as crud_criterion
+from app.crud.pagination import PageRequest
 from app.schemas.criterion import Criterion, CriterionCreate, CriterionUpdate
+from app.schemas.page import Page
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
-@router.get("/", response_model=list[Criterion])
+@router.get("/", response_model=Page[Criterion])
 async def read_criteria(
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    db: AsyncSession = Depends(get_db, scope="function"),
+    page: PageRequest = Depends(get_page),
     current_user: Any = Depends(get_current_active_user), # Requires authentication
 ) -> Any:
     """
     Retrieve criteria.
     """
-    criteria = await crud_criterion.get_criteria(db, skip=skip, limit=limit)
+    criteria = await crud_criterion.get_multi(db, page=page)
     return criteria
 
 @router.post("/", response_model=Criterion)
 async def create_criterion(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     criterion_in: CriterionCreate,
     current_user: Any = Depends(get_current_active_coordinator), # Only coordinators can create criteria
 ) -> Any:
     """
     Create new criterion.
     """
-    criterion = await crud_criterion.create_criterion(db, criterion_in)
+    criterion = await crud_criterion.create(db, criterion_in)
     return criterion
 
 @router.put("/{criterion_id}", response_model=Criterion)
 async def update_criterion(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     criterion_id: int,
     criterion_in: CriterionUpdate,
     current_user: Any = Depends(get_current_active_coordinator), # Only coordinators can update criteria
@@ -45,30 +47,30 @@ async def update_criterion(
     """
     Update a criterion.
     """
-    criterion = await crud_criterion.get_criterion(db, criterion_id=criterion_id)
+    criterion = await crud_criterion.get(db, criterion_id)
     if not criterion:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Criterion not found",
         )
-    criterion = await crud_criterion.update_criterion(db, criterion_id=criterion_id, criterion_in=criterion_in)
+    criterion = await crud_criterion.update(db, criterion_id, criterion_in)
     return criterion
 
 @router.delete("/{criterion_id}", response_model=Criterion)
 async def delete_criterion(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     criterion_id: int,
     current_user: Any = Depends(get_current_active_coordinator), # Only coordinators can delete criteria
 ) -> Any:
     """
     Delete a criterion.
     """
-    criterion = await crud_criterion.get_criterion(db, criterion_id=criterion_id)
+    criterion = await crud_criterion.get(db, criterion_id)
     if not criterion:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Criterion not found",
         )
-    criterion = await crud_criterion.delete_criterion(db, criterion_id=criterion_id)
+    criterion = await crud_criterion.remove(db, criterion_id)
     return criterion
\ No newline at end of file
@@ -4,39 +4,42 @@ from typing import Any, List # Importar List
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form # Modificado
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_active_user, get_current_active_coordinator
+from app.api.deps import get_db, get_current_active_user, get_current_active_coordinator, get_page
+from app.api.routing import BatchLoadingRoute
 from app.crud.initiative import iniciative as crud_initiative
+from app.crud.pagination import PageRequest
 from app.crud.documento_iniciativa import documento_iniciativa as crud_documento_iniciativa # Nuevo
+from app.db.unit_of_work import release_connection
 from app.schemas.initiative import Initiative, InitiativeCreate, InitiativeUpdate
 from app.schemas.documento_iniciativa import DocumentoIniciativaCreate # Nuevo
+from app.schemas.page import Page
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
 # Directorio donde se guardarán los archivos
 UPLOAD_DIR = "static/uploads" # Debe coincidir con el app.mount en main.py
 
-@router.get("/", response_model=list[Initiative])
+@router.get("/", response_model=Page[Initiative])
 async def read_initiatives(
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    db: AsyncSession = Depends(get_db, scope="function"),
+    page: PageRequest = Depends(get_page),
 ) -> Any:
     """
     Retrieve initiatives.
     """
-    initiatives = await crud_initiative.get_initiatives(db, skip=skip, limit=limit)
+    initiatives = await crud_initiative.get_multi(db, page=page)
     return initiatives
 
 @router.get("/{initiative_id}", response_model=Initiative)
 async def read_initiative_by_id(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     initiative_id: int,
 ) -> Any:
     """
     Get initiative by ID.
     """
-    initiative = await crud_initiative.get_initiative(db, initiative_id=initiative_id)
+    initiative = await crud_initiative.get(db, initiative_id)
     if not initiative:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -47,7 +50,7 @@ async def read_initiative_by_id(
 @router.post("/", response_model=Initiative)
 async def create_initiative(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     nombre: str = Form(...),
     descripcion: str = Form(...),
     categoria: str = Form(...),
@@ -66,9 +69,10 @@ async def create_initiative(
             impacto=impacto,
             id_usuario=current_user.id_usuario
         )
-        
-        initiative = await crud_initiative.create_initiative(db, initiative_in_db)
 
+        # Files are saved before any write, so no connection is held while they are
+        await release_connection(db)
+        saved_documents = []
         if documents:
             os.makedirs(UPLOAD_DIR, exist_ok=True) # Asegurarse de que el directorio exista
             for doc_file in documents:
@@ -81,14 +85,17 @@ async def create_initiative(
                         buffer.write(await doc_file.read())
                     
                     doc_url = f"/static/uploads/{unique_filename}"
-                    
-                    documento_in = DocumentoIniciativaCreate(
-                        id_iniciativa=initiative.id_iniciativa,
-                        nombre_archivo=doc_file.filename,
-                        ruta_archivo=doc_url,
-                        tipo=doc_file.content_type # O un tipo más específico si se requiere
-                    )
-                    await crud_documento_iniciativa.create_documento(db, documento_in)
+                    saved_documents.append((doc_file, doc_url))
+
+        initiative = await crud_initiative.create(db, initiative_in_db)
+        for doc_file, doc_url in saved_documents:
+            documento_in = DocumentoIniciativaCreate(
+                id_iniciativa=initiative.id_iniciativa,
+                nombre_archivo=doc_file.filename,
+                ruta_archivo=doc_url,
+                tipo=doc_file.content_type # O un tipo más específico si se requiere
+            )
+            await crud_documento_iniciativa.create(db, documento_in)
         
         return initiative
     except Exception as e:
@@ -2,29 +2,31 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_db, get_current_active_user, get_page
+from app.api.routing import BatchLoadingRoute
 from app.crud.message import message as crud_message
+from app.crud.pagination import PageRequest
 from app.schemas.message import Message, MessageCreate, MessageUpdate
+from app.schemas.page import Page
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
-@router.get("/me", response_model=list[Message])
+@router.get("/me", response_model=Page[Message])
 async def read_my_messages(
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    db: AsyncSession = Depends(get_db, scope="function"),
+    page: PageRequest = Depends(get_page),
     current_user: Any = Depends(get_current_active_user), # Requires authentication
 ) -> Any:
     """
     Retrieve messages for the current authenticated user (sent and received).
     """
-    messages = await crud_message.get_messages_by_user(db, user_id=current_user.id_usuario, skip=skip, limit=limit)
+    messages = await crud_message.get_messages_by_user(db, user_id=current_user.id_usuario, page=page)
     return messages
 
 @router.post("/", response_model=Message)
 async def create_message(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     message_in: MessageCreate,
     current_user: Any = Depends(get_current_active_user), # Any active user can send messages
 ) -> Any:
@@ -32,13 +34,13 @@ async def create_message(
     Create new message.
     """
     message_in.id_remitente = current_user.id_usuario # Set sender to current user
-    message = await crud_message.create_message(db, message_in)
+    message = await crud_message.create(db, message_in)
     return message
 
 @router.put("/{message_id}", response_model=Message)
 async def update_message(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     message_id: int,
     message_in: MessageUpdate,
     current_user: Any = Depends(get_current_active_user), # Only sender/receiver can update (e.g., mark as read)
@@ -46,7 +48,7 @@ async def update_message(
     """
     Update a message (e.g., mark as read).
     """
-    message = await crud_message.get_message(db, message_id=message_id)
+    message = await crud_message.get(db, message_id)
     if not message:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -60,20 +62,20 @@ async def update_message(
             detail="Not enough permissions to update this message",
         )
     
-    message = await crud_message.update_message(db, message_id=message_id, message_in=message_in)
+    message = await crud_message.update(db, message_id, message_in)
     return message
 
 @router.delete("/{message_id}", response_model=Message)
 async def delete_message(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     message_id: int,
     current_user: Any = Depends(get_current_active_user), # Only sender/receiver can delete
 ) -> Any:
     """
     Delete a message.
     """
-    message = await crud_message.get_message(db, message_id=message_id)
+    message = await crud_message.get(db, message_id)
     if not message:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -87,5 +89,5 @@ async def delete_message(
             detail="Not enough permissions to delete this message",
         )
     
-    message = await crud_message.delete_message(db, message_id=message_id)
+    message = await crud_message.remove(db, message_id)
     return message
\ No newline at end of file
@@ -0,0 +1,29 @@
+from typing import Any
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_active_coordinator
+from app.core.hashing import password_hasher
+from app.core.cache import principal_cache
+from app.core.rate_limit import login_throttle
+from app.core.revocation import revoked_sessions
+from app.db.instrumentation import query_stats
+from app.db.pool import pool_stats
+from app.db.session import engine
+
+router = APIRouter()
+
+@router.get("/")
+async def read_metrics(
+    current_user: Any = Depends(get_current_active_coordinator), # Only coordinators can view metrics
+) -> Any:
+    """
+    Runtime metrics of this worker.
+    """
+    return {
+        "db_pool": pool_stats(engine),
+        "sql": query_stats.stats(),
+        "password_hasher": password_hasher.stats(),
+        "principal_cache": principal_cache.stats(),
+        "login_throttle": login_throttle.stats(),
+        "revoked_sessions": len(revoked_sessions),
+    }
@@ -2,29 +2,32 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_db, get_current_active_user, get_page
+from app.api.routing import BatchLoadingRoute
+from app.core.roles import COORDINADOR
 from app.crud.notification import notification as crud_notification
+from app.crud.pagination import PageRequest
 from app.schemas.notification import Notification, NotificationCreate, NotificationUpdate
+from app.schemas.page import Page
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
-@router.get("/me", response_model=list[Notification])
+@router.get("/me", response_model=Page[Notification])
 async def read_my_notifications(
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    db: AsyncSession = Depends(get_db, scope="function"),
+    page: PageRequest = Depends(get_page),
     current_user: Any = Depends(get_current_active_user), # Requires authentication
 ) -> Any:
     """
     Retrieve notifications for the current authenticated user.
     """
-    notifications = await crud_notification.get_notifications_by_user(db, user_id=current_user.id_usuario, skip=skip, limit=limit)
+    notifications = await crud_notification.get_notifications_by_user(db, user_id=current_user.id_usuario, page=page)
     return notifications
 
 @router.post("/", response_model=Notification)
 async def create_notification(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     notification_in: NotificationCreate,
     current_user: Any = Depends(get_current_active_user), # Any active user can create notifications (e.g., system notifications)
 ) -> Any:
@@ -32,13 +35,13 @@ async def create_notification(
     Create new notification.
     """
     # TODO: Add logic to verify if current_user is allowed to create notifications for other users
-    notification = await crud_notification.create_notification(db, notification_in)
+    notification = await crud_notification.create(db, notification_in)
     return notification
 
 @router.put("/{notification_id}", response_model=Notification)
 async def update_notification(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     notification_id: int,
     notification_in: NotificationUpdate,
     current_user: Any = Depends(get_current_active_user), # Only recipient or coordinator can update (e.g., mark as read)
@@ -46,7 +49,7 @@ async def update_notification(
     """
     Update a notification (e.g., mark as read).
     """
-    notification = await crud_notification.get_notification(db, notification_id=notification_id)
+    notification = await crud_notification.get(db, notification_id)
     if not notification:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -54,26 +57,26 @@ async def update_notification(
         )
     
     # Only recipient or coordinator can update the notification
-    if notification.id_usuario != current_user.id_usuario and current_user.id_rol != 1: # Assuming 1 is coordinator role
+    if notification.id_usuario != current_user.id_usuario and current_user.id_rol != COORDINADOR:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions to update this notification",
         )
     
-    notification = await crud_notification.update_notification(db, notification_id=notification_id, notification_in=notification_in)
+    notification = await crud_notification.update(db, notification_id, notification_in)
     return notification
 
 @router.delete("/{notification_id}", response_model=Notification)
 async def delete_notification(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     notification_id: int,
     current_user: Any = Depends(get_current_active_user), # Only recipient or coordinator can delete
 ) -> Any:
     """
     Delete a notification.
     """
-    notification = await crud_notification.get_notification(db, notification_id=notification_id)
+    notification = await crud_notification.get(db, notification_id)
     if not notification:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -81,11 +84,11 @@ async def delete_notification(
         )
     
     # Only recipient or coordinator can delete the notification
-    if notification.id_usuario != current_user.id_usuario and current_user.id_rol != 1: # Assuming 1 is coordinator role
+    if notification.id_usuario != current_user.id_usuario and current_user.id_rol != COORDINADOR:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions to delete this notification",
         )
     
-    notification = await crud_notification.delete_notification(db, notification_id=notification_id)
+    notification = await crud_notification.remove(db, notification_id)
     return notification
\ No newline at end of file
@@ -1,74 +1,76 @@
-from typing import Any, List
+from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app import crud, models, schemas
-from app.api import deps
+from sqlalchemy.ext.asyncio import AsyncSession
 
-router = APIRouter()
+from app.api.deps import get_db, get_current_active_user, get_page
+from app.api.routing import BatchLoadingRoute
+from app.core.roles import COORDINADOR, ESTUDIANTE
+from app.crud.crud_postulacion import postulacion as crud_postulacion
+from app.crud.pagination import PageRequest
+from app.db.load_plan import eager_load
+from app.models.postulacion import Postulacion as PostulacionModel
+from app.schemas.page import Page
+from app.schemas.postulacion import Postulacion, PostulacionCreate, PostulacionUpdate
 
-@router.post("/", response_model=schemas.Postulacion)
-def create_postulacion(
+router = APIRouter(route_class=BatchLoadingRoute)
+
+@router.post("/", response_model=Postulacion)
+async def create_postulacion(
     *,
-    db: Session = Depends(deps.get_db),
-    postulacion_in: schemas.PostulacionCreate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    db: AsyncSession = Depends(get_db, scope="function"),
+    postulacion_in: PostulacionCreate,
+    current_user: Any = Depends(get_current_active_user),
 ) -> Any:
     """
     Create new postulacion.
     """
-    if current_user.id_rol != 2: # 2 is Estudiante
+    if current_user.id_rol != ESTUDIANTE:
         raise HTTPException(status_code=403, detail="Only students can apply to initiatives")
     
     # Check if already applied
-    existing = db.query(models.Postulacion).filter(
-        models.Postulacion.id_iniciativa == postulacion_in.id_iniciativa,
-        models.Postulacion.id_estudiante == current_user.id_usuario
-    ).first()
-    if existing:
+    if await crud_postulacion.has_applied(db, postulacion_in.id_iniciativa, current_user.id_usuario):
         raise HTTPException(status_code=400, detail="You have already applied to this initiative")
 
-    postulacion = crud.postulacion.create_with_student(
-        db=db, obj_in=postulacion_in, id_estudiante=current_user.id_usuario
+    postulacion = await crud_postulacion.create_with_student(
+        db, obj_in=postulacion_in, id_estudiante=current_user.id_usuario
     )
     return postulacion
 
-@router.get("/", response_model=List[schemas.Postulacion])
-def read_postulaciones(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_user: models.User = Depends(deps.get_current_active_user),
+@router.get("/", response_model=Page[Postulacion])
+@eager_load(PostulacionModel)
+async def read_postulaciones(
+    db: AsyncSession = Depends(get_db, scope="function"),
+    page: PageRequest = Depends(get_page),
+    current_user: Any = Depends(get_current_active_user),
 ) -> Any:
     """
     Retrieve postulaciones.
     """
-    if current_user.id_rol == 1: # Coordinador
-        postulaciones = crud.postulacion.get_multi(db, skip=skip, limit=limit)
-    elif current_user.id_rol == 2: # Estudiante
-        postulaciones = crud.postulacion.get_by_student(db, id_estudiante=current_user.id_usuario, skip=skip, limit=limit)
+    if current_user.id_rol == COORDINADOR:
+        postulaciones = await crud_postulacion.get_multi(db, page=page)
+    elif current_user.id_rol == ESTUDIANTE:
+        postulaciones = await crud_postulacion.get_by_student(db, id_estudiante=current_user.id_usuario, page=page)
     else:
         # Empresa or others might see postulaciones to their initiatives? For now restrict or empty
-        postulaciones = []
+        postulaciones = Page(items=[])
         
     return postulaciones
 
-@router.put("/{id}", response_model=schemas.Postulacion)
-def update_postulacion(
+@router.put("/{id}", response_model=Postulacion)
+async def update_postulacion(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     id: int,
-    postulacion_in: schemas.PostulacionUpdate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    postulacion_in: PostulacionUpdate,
+    current_user: Any = Depends(get_current_active_user),
 ) -> Any:
     """
     Update a postulacion (Accept/Reject).
     """
-    postulacion = crud.postulacion.get(db=db, id=id)
-    if not postulacion:
-        raise HTTPException(status_code=404, detail="Postulacion not found")
-    
-    if current_user.id_rol != 1: # Only Coordinador can update status
+    if current_user.id_rol != COORDINADOR: # Only Coordinador can update status
          raise HTTPException(status_code=403, detail="Not enough permissions")
 
-    postulacion = crud.postulacion.update(db=db, db_obj=postulacion, obj_in=postulacion_in)
+    postulacion = await crud_postulacion.update(db, id, postulacion_in)
+    if not postulacion:
+        raise HTTPException(status_code=404, detail="Postulacion not found")
     return postulacion
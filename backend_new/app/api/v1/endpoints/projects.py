@@ -2,41 +2,46 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_active_user, get_current_active_coordinator
+from app.api.deps import get_db, get_current_active_user, get_current_active_coordinator, get_page
+from app.api.routing import BatchLoadingRoute
 from app.crud.project import project as crud_project
+from app.crud.pagination import PageRequest
+from app.db.load_plan import eager_load
+from app.models.project import Project as ProjectModel
 from app.schemas.project import Project, ProjectCreate, ProjectUpdate
+from app.schemas.page import Page
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
-@router.get("/", response_model=list[Project])
+@router.get("/", response_model=Page[Project])
+@eager_load(ProjectModel)
 async def read_projects(
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    db: AsyncSession = Depends(get_db, scope="function"),
+    page: PageRequest = Depends(get_page),
 ) -> Any:
     """
     Retrieve projects.
     """
-    projects = await crud_project.get_projects(db, skip=skip, limit=limit)
+    projects = await crud_project.get_multi(db, page=page)
     return projects
 
 @router.post("/", response_model=Project)
 async def create_project(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     project_in: ProjectCreate,
     current_user: Any = Depends(get_current_active_coordinator), # Only coordinators can create projects
 ) -> Any:
     """
     Create new project.
     """
-    project = await crud_project.create_project(db, project_in)
+    project = await crud_project.create(db, project_in)
     return project
 
 @router.put("/{project_id}", response_model=Project)
 async def update_project(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     project_id: int,
     project_in: ProjectUpdate,
     current_user: Any = Depends(get_current_active_coordinator), # Only coordinators can update projects
@@ -44,30 +49,30 @@ async def update_project(
     """
     Update a project.
     """
-    project = await crud_project.get_project(db, project_id=project_id)
+    project = await crud_project.get(db, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    project = await crud_project.update_project(db, project_id=project_id, project_in=project_in)
+    project = await crud_project.update(db, project_id, project_in)
     return project
 
 @router.delete("/{project_id}", response_model=Project)
 async def delete_project(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     project_id: int,
     current_user: Any = Depends(get_current_active_coordinator), # Only coordinators can delete projects
 ) -> Any:
     """
     Delete a project.
     """
-    project = await crud_project.get_project(db, project_id=project_id)
+    project = await crud_project.get(db, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    project = await crud_project.delete_project(db, project_id=project_id)
+    project = await crud_project.remove(db, project_id)
     return project
\ No newline at end of file
@@ -1,21 +1,14 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
+from fastapi import APIRouter
 
-from app.api.deps import get_db
-from app.models.role import Role as DBRole # Alias to avoid conflict with schema Role
+from app.core.roles import role_registry
 from app.schemas.role import Role # Pydantic schema for response
 
 router = APIRouter()
 
 @router.get("/roles", response_model=List[Role])
-async def read_roles(
-    db: AsyncSession = Depends(get_db),
-) -> Any:
+async def read_roles() -> Any:
     """
-    Retrieve all roles.
+    Retrieve all roles. Served from the registry loaded at startup, without a query.
     """
-    result = await db.execute(select(DBRole))
-    roles = result.scalars().all()
-    return roles
+    return role_registry.all()
@@ -4,37 +4,41 @@ from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File,
 from typing import List, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_db, get_current_active_user, get_page
+from app.api.routing import BatchLoadingRoute
+from app.core.roles import COORDINADOR
 from app.crud.user import user as crud_user
+from app.crud.pagination import PageRequest
+from app.db.unit_of_work import release_connection
 from app.schemas.user import User, UserUpdate
+from app.schemas.page import Page
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
 # Directorio donde se guardarán las fotos
 UPLOAD_DIR = "static/uploads"
 
-@router.get("/", response_model=List[User])
+@router.get("/", response_model=Page[User])
 async def read_users(
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    db: AsyncSession = Depends(get_db, scope="function"),
+    page: PageRequest = Depends(get_page),
 ) -> Any:
     """
     Retrieve users.
     """
-    users = await crud_user.get_users(db, skip=skip, limit=limit)
+    users = await crud_user.get_multi(db, page=page)
     return users
 
 @router.get("/{user_id}", response_model=User)
 async def read_user(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     user_id: int,
 ) -> Any:
     """
     Get user by ID.
     """
-    user = await crud_user.get_user(db, user_id=user_id)
+    user = await crud_user.get(db, user_id)
     if not user:
         raise HTTPException(
             status_code=404,
@@ -45,7 +49,7 @@ async def read_user(
 @router.put("/{user_id}", response_model=User)
 async def update_user(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     user_id: int,
     current_user: Any = Depends(get_current_active_user),
     nombre: Optional[str] = Form(None),
@@ -65,7 +69,7 @@ async def update_user(
     Update user by ID. Users can only update their own profile unless they are coordinators.
     """
     # Check if user exists
-    db_user = await crud_user.get_user(db, user_id=user_id)
+    db_user = await crud_user.get(db, user_id)
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -73,11 +77,13 @@ async def update_user(
         )
     
     # Check permissions: users can only update their own profile, coordinators can update any
-    if current_user.id_usuario != user_id and current_user.id_rol != 1:
+    if current_user.id_usuario != user_id and current_user.id_rol != COORDINADOR:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to update this user.",
         )
+    # Files are saved without holding a connection; the update takes one again
+    await release_connection(db)
     
     # Handle photo upload
     foto_url = db_user.foto  # Keep existing photo if no new one is uploaded
@@ -164,7 +170,7 @@ async def update_user(
     user_update = UserUpdate(**update_data)
     
     # Update user
-    updated_user = await crud_user.update_user(db, user_id=user_id, user_in=user_update)
+    updated_user = await crud_user.update(db, user_id, user_update)
     if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
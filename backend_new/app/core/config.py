@@ -5,9 +5,64 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
     DATABASE_URL: str = "postgresql://postgres:admin@db:5432/plataforma_desarrollo"
+    # Apply pending migrations at startup (one worker at a time). When false, startup
+    # fails until `alembic upgrade head` has been run.
+    MIGRATE_ON_STARTUP: bool = True
+    # Connection pool, per worker process: workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    # must stay below Postgres max_connections. Watch db_pool in /metrics when sizing.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT_SECONDS: float = 10  # wait for a free connection before failing the request
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # reopen connections older than this (idle timeouts, failovers)
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARM_CONNECTIONS: int = 5  # opened by the startup warm-up, before the first request needs them
+    # DATABASE_URL points at PgBouncer in transaction mode: no pool in the app and no
+    # per-connection statement caching (see app.db.session). The pool settings above
+    # are then unused; size PgBouncer's default_pool_size instead.
+    DB_POOLER_MODE: bool = False
+    # Longest a single statement may run (Postgres statement_timeout), by route class:
+    # GET without credentials, GET with credentials, anything else, and routes that opt
+    # in with Depends(route_class(EXPORT)). 0 disables it. Timeouts answer 504.
+    DB_STATEMENT_TIMEOUT_PUBLIC_READ_MS: int = 2000
+    DB_STATEMENT_TIMEOUT_READ_MS: int = 5000
+    DB_STATEMENT_TIMEOUT_WRITE_MS: int = 10000
+    DB_STATEMENT_TIMEOUT_EXPORT_MS: int = 60000
+    # SQL instrumentation (app.db.instrumentation) replaces echo. Slow statements are
+    # always logged; per-request query count/DB time is logged for a sample of requests.
+    SQL_ECHO: bool = False
+    SQL_SLOW_QUERY_MS: float = 200
+    SQL_STATS_SAMPLE_RATE: float = 0.1
+    SQL_SLOWEST_PER_REQUEST: int = 3
+    SQL_DEBUG_HEADERS: bool = False  # track every request and return Server-Timing / X-DB-* headers
     SECRET_KEY: str = "super-secret-key"  # Default, should be overridden by .env or environment variables
     ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Password hashing (bcrypt runs in a worker pool, off the event loop)
+    PASSWORD_HASH_EXECUTOR: str = "thread"  # thread | process
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # pending hash/verify jobs before shedding load with 503
+    BCRYPT_ROUNDS: int = 12  # pick with calibrate_bcrypt.py; stored hashes are upgraded on login
+    # Authenticated user cache used by get_current_user (per worker)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    # Login admission control, checked before any password is verified.
+    # Buckets are per worker unless RATE_LIMIT_STORE=redis; the concurrency cap is always per worker.
+    RATE_LIMIT_STORE: str = "memory"  # memory | redis
+    RATE_LIMIT_REDIS_URL: str = "redis://redis:6379/0"
+    LOGIN_ACCOUNT_BURST: int = 5
+    LOGIN_ACCOUNT_PER_MINUTE: float = 5
+    LOGIN_IP_BURST: int = 20
+    LOGIN_IP_PER_MINUTE: float = 60
+    LOGIN_MAX_CONCURRENT_VERIFICATIONS: int = 8
+    # Addresses (or CIDR ranges) of the reverse proxies / load balancers in front of the
+    # app. A request coming from one of them is attributed to the address it appended
+    # to X-Forwarded-For, so the per-IP login bucket is the client's, not the proxy's.
+    # Leave empty only when clients connect directly: otherwise every login shares
+    # the proxy's bucket. Set as a JSON list, e.g. TRUSTED_PROXIES='["10.0.0.0/8"]'.
+    TRUSTED_PROXIES: list[str] = []
+    # How often each worker reloads logouts handled by other workers
+    AUTH_STATE_REFRESH_SECONDS: int = 30
     API_V1_STR: str = "/api/v1"
     BACKEND_CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:8000"] # Frontend URL
 
@@ -0,0 +1,125 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password, verify_and_update_password
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many hash/verify jobs are already waiting for a worker."""
+
+
+def _timed_call(fn: Callable, *args) -> tuple[float, float, Any]:
+    # Runs inside the worker; time.monotonic is system-wide so it is comparable across processes.
+    started_at = time.monotonic()
+    result = fn(*args)
+    return started_at, time.monotonic(), result
+
+
+# Cost-4 bcrypt hash of "warm-up": cheap to verify, but loads the bcrypt backend
+_WARM_UP_HASH = "$2b$04$rgJxrKsjJtAfwZsLyofnRu16I7SD.ZllTm.j9K/DlSFpAklEKv8AK"
+
+
+class PasswordHasher:
+    """
+    Async facade over bcrypt. Every hash/verify runs in a bounded thread or process
+    pool so a login storm never blocks the event loop.
+    """
+
+    def __init__(self, executor: str = "thread", workers: int = 4, max_queue: int = 64):
+        self.executor_kind = executor
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._max_pending = 0
+        self._wait_seconds = 0.0
+        self._run_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        if self._pending >= self.max_queue:
+            self._rejected += 1
+            raise PasswordHasherBusy()
+
+        self._pending += 1
+        self._submitted += 1
+        self._max_pending = max(self._max_pending, self._pending)
+        submitted_at = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            started_at, finished_at, result = await loop.run_in_executor(
+                self._get_executor(), _timed_call, fn, *args
+            )
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._pending -= 1
+
+        self._completed += 1
+        self._wait_seconds += max(started_at - submitted_at, 0.0)
+        self._run_seconds += finished_at - started_at
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        # Rehashing happens in the same worker call, only for stale hashes
+        return await self._run(verify_and_update_password, plain_password, hashed_password)
+
+    async def warm_up(self) -> None:
+        """Start every worker and load bcrypt in it before the first login needs it."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(*(
+            loop.run_in_executor(executor, verify_password, "warm-up", _WARM_UP_HASH)
+            for _ in range(self.workers)
+        ))
+
+    def stats(self) -> dict:
+        completed = self._completed or 1
+        return {
+            "executor": self.executor_kind,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "pending": self._pending,
+            "max_pending": self._max_pending,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "avg_wait_ms": round(self._wait_seconds / completed * 1000, 2),
+            "avg_run_ms": round(self._run_seconds / completed * 1000, 2),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    executor=settings.PASSWORD_HASH_EXECUTOR,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -0,0 +1,38 @@
+import bisect
+
+# Upper bounds in milliseconds, roughly doubling
+DEFAULT_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram. Counts are cumulative per bucket (like Prometheus
+    `le` buckets), so two snapshots can be subtracted and percentiles estimated.
+    """
+
+    def __init__(self, buckets_ms: tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._counts = [0] * (len(buckets_ms) + 1)  # last slot is +Inf
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self._counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+        self._count += 1
+        self._sum_ms += ms
+        self._max_ms = max(self._max_ms, ms)
+
+    def stats(self) -> dict:
+        buckets = {}
+        running = 0
+        for bound, count in zip((*self.buckets_ms, "+Inf"), self._counts):
+            running += count
+            buckets[str(bound)] = running
+        return {
+            "count": self._count,
+            "avg_ms": round(self._sum_ms / (self._count or 1), 3),
+            "max_ms": round(self._max_ms, 3),
+            "buckets_ms": buckets,
+        }
@@ -0,0 +1,40 @@
+import time
+from typing import Hashable, Iterable
+
+
+class RevocationSet:
+    """
+    Session ids (`sid` claim) that were logged out. An entry only has to live until
+    the last access token issued for that session expires, so the set stays small.
+    Rebuilt from the `tokens` table at startup and re-synced periodically so logouts
+    handled by other workers are picked up.
+    """
+
+    def __init__(self):
+        self._expires_at: dict[Hashable, float] = {}
+
+    def load(self, rows: Iterable[tuple[Hashable, float]]) -> None:
+        # Merged rather than replaced: a revocation never goes away before it expires,
+        # and a logout recorded locally may not be visible to a sync already in flight
+        now = time.time()
+        merged = {sid: expires_at for sid, expires_at in self._expires_at.items() if expires_at > now}
+        merged.update((sid, expires_at) for sid, expires_at in rows if expires_at > now)
+        self._expires_at = merged
+
+    def add(self, sid: Hashable, expires_at: float) -> None:
+        self._expires_at[sid] = expires_at
+
+    def is_revoked(self, sid: Hashable) -> bool:
+        expires_at = self._expires_at.get(sid)
+        if expires_at is None:
+            return False
+        if expires_at < time.time():
+            del self._expires_at[sid]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+
+revoked_sessions = RevocationSet()
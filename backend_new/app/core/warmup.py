@@ -0,0 +1,133 @@
+"""
+Startup warm-up. Without it the first requests a new worker serves pay for opening
+database connections, compiling their statements, the first run of their validators
+and serializers, and starting the password hashing workers. The warm-up does that
+work in the background right after startup; /health/ready answers 503 until it is
+done, so a load balancer only routes traffic to warm workers.
+"""
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.crud.user import user as crud_user
+from app.db.pool import InstrumentedPool
+from app.db.session import engine
+from app.db.unit_of_work import unit_of_work
+
+logger = logging.getLogger(__name__)
+
+# Hot read routes, requested in-process: routing, dependencies, statement compilation
+# (LIMIT is a bound parameter, so limit=1 compiles the same statement) and the
+# response model all run once
+HOT_PATHS = (
+    "/iniciativas/?limit=1",
+    "/proyectos/?limit=1",
+)
+
+
+async def _open_connections(target: AsyncEngine) -> None:
+    if not isinstance(target.pool, InstrumentedPool):
+        # NullPool behind a transaction pooler: nothing to keep open
+        return
+    count = min(settings.DB_POOL_WARM_CONNECTIONS, target.pool.size())
+    # Held at the same time so each one is a new connection; they stay idle in the pool
+    async with AsyncExitStack() as stack:
+        await asyncio.gather(*(stack.enter_async_context(target.connect()) for _ in range(count)))
+
+
+async def _get(app, path_with_query: str) -> int:
+    path, _, query = path_with_query.partition("?")
+    path = f"{settings.API_V1_STR}{path}"
+    status = 0
+    requested = False
+    never = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await never.wait()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"warmup")],
+        "client": None,
+        "server": None,
+    }
+    await app(scope, receive, send)
+    return status
+
+
+async def _hot_requests(app) -> None:
+    for path in HOT_PATHS:
+        status = await _get(app, path)
+        if status >= 400:
+            logger.warning("Warm-up request %s answered %s", path, status)
+    # Login's lookup; its write (the refresh session) compiles on the first real login
+    async with unit_of_work() as session:
+        await crud_user.get_user_by_email(session, "warm-up@invalid")
+
+
+class Warmup:
+    """Runs the warm-up phases once and tells readiness checks whether it is over."""
+
+    def __init__(self):
+        self._task: asyncio.Task | None = None
+        self._ready = False
+        self._failed = False
+        self._phase_ms: dict[str, float] = {}
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    async def _phase(self, name: str, work, *args) -> None:
+        started_at = time.perf_counter()
+        await work(*args)
+        self._phase_ms[name] = round((time.perf_counter() - started_at) * 1000, 1)
+
+    async def _run(self, app) -> None:
+        try:
+            await self._phase("connections", _open_connections, engine)
+            await self._phase("requests", _hot_requests, app)
+            await self._phase("password_hasher", password_hasher.warm_up)
+        except Exception:
+            # A cold worker still serves correctly; don't keep it out of rotation
+            self._failed = True
+            logger.exception("Warm-up failed, serving cold")
+        self._ready = True
+        logger.info("Warm-up finished %s", self._phase_ms)
+
+    def start(self, app) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(app))
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> dict:
+        return {"ready": self._ready, "failed": self._failed, "phase_ms": self._phase_ms}
+
+
+warmup = Warmup()
@@ -0,0 +1,186 @@
+"""
+Generic async repository, one per model. Every method is a single statement and
+only flushes; the request's unit of work commits.
+
+Reads take optional `columns` (a projection: rows with just those attributes
+instead of entities) and loader `options` (eager loads such as selectinload(...)).
+Writes are INSERT/UPDATE/DELETE ... RETURNING, and the *_many variants handle any
+number of rows in one statement. Entity-specific queries live in the CRUD modules
+on top of these.
+"""
+from typing import Any, Generic, Mapping, Sequence, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Select, delete, func, insert, inspect, select, true, tuple_, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.base import ExecutableOption
+
+from app.crud.pagination import PageRequest, paginate
+from app.schemas.page import Page
+
+ModelType = TypeVar("ModelType")
+CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
+UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+
+Columns = Sequence[InstrumentedAttribute] | None
+Options = Sequence[ExecutableOption]
+# A primary key value, or a tuple of them for a composite key
+Ident = Any
+
+
+class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    def __init__(self, model: type[ModelType]):
+        self.model = model
+        mapper = inspect(model)
+        # Primary key attributes in mapper order; also the default keyset of get_multi
+        self.primary_key: tuple[InstrumentedAttribute, ...] = tuple(
+            getattr(model, mapper.get_property_by_column(column).key) for column in mapper.primary_key
+        )
+
+    def select(self, *where: ColumnElement[bool], columns: Columns = None, options: Options = ()) -> Select:
+        statement = select(*columns) if columns else select(self.model)
+        if options:
+            statement = statement.options(*options)
+        return statement.where(*where)
+
+    def _ident(self, id: Ident) -> ColumnElement[bool]:
+        if len(self.primary_key) == 1:
+            return self.primary_key[0] == id
+        return tuple_(*self.primary_key) == tuple_(*id)
+
+    @staticmethod
+    def _data(obj_in: BaseModel | Mapping[str, Any], **dump_options) -> dict[str, Any]:
+        return obj_in.model_dump(**dump_options) if isinstance(obj_in, BaseModel) else dict(obj_in)
+
+    # Reads
+
+    async def get(
+        self,
+        db: AsyncSession,
+        id: Ident,
+        *,
+        where: ColumnElement[bool] = true(),
+        columns: Columns = None,
+        options: Options = (),
+    ) -> ModelType | Row | None:
+        return await self.get_by(db, self._ident(id), where, columns=columns, options=options)
+
+    async def get_by(
+        self, db: AsyncSession, *where: ColumnElement[bool], columns: Columns = None, options: Options = ()
+    ) -> ModelType | Row | None:
+        """The one row matching `where` (a unique column), or None."""
+        result = await db.execute(self.select(*where, columns=columns, options=options))
+        return result.one_or_none() if columns else result.scalar_one_or_none()
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *where: ColumnElement[bool],
+        page: PageRequest = PageRequest(),
+        key: Sequence[InstrumentedAttribute] | None = None,
+        descending: bool = False,
+        columns: Columns = None,
+        options: Options = (),
+    ) -> Page:
+        """
+        One keyset page (see app.crud.pagination), by primary key unless `key` names
+        another unique, indexed ordering. A projection must include the key columns.
+        """
+        statement = self.select(*where, columns=columns, options=options)
+        return await paginate(db, statement, key or self.primary_key, page, descending=descending)
+
+    async def get_all(
+        self,
+        db: AsyncSession,
+        *where: ColumnElement[bool],
+        order_by: Sequence[Any] = (),
+        limit: int | None = None,
+        offset: int | None = None,
+        columns: Columns = None,
+        options: Options = (),
+    ) -> list[ModelType] | list[Row]:
+        """Every matching row, for lists their filter keeps small (or that set `limit`)."""
+        statement = self.select(*where, columns=columns, options=options)
+        statement = statement.order_by(*(order_by or self.primary_key)).limit(limit).offset(offset)
+        result = await db.execute(statement)
+        return list(result.all() if columns else result.scalars().all())
+
+    async def count(self, db: AsyncSession, *where: ColumnElement[bool]) -> int:
+        result = await db.execute(select(func.count()).select_from(self.model).where(*where))
+        return result.scalar_one()
+
+    async def count_by(self, db: AsyncSession, column: InstrumentedAttribute, *where: ColumnElement[bool]) -> dict[Any, int]:
+        """Rows per value of `column`, in one GROUP BY instead of a count per value."""
+        result = await db.execute(select(column, func.count()).where(*where).group_by(column))
+        return dict(result.all())
+
+    # Writes
+
+    async def create(self, db: AsyncSession, obj_in: CreateSchemaType | Mapping[str, Any], **values: Any) -> ModelType:
+        """INSERT ... RETURNING. `values` are set by the server, not the client (owner, status)."""
+        result = await db.execute(
+            insert(self.model).values({**self._data(obj_in), **values}).returning(self.model)
+        )
+        return result.scalar_one()
+
+    async def create_many(
+        self, db: AsyncSession, objs_in: Sequence[CreateSchemaType | Mapping[str, Any]], **values: Any
+    ) -> list[ModelType]:
+        """One multi-row INSERT ... RETURNING; the rows come back in input order."""
+        if not objs_in:
+            return []
+        result = await db.execute(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True),
+            [{**self._data(obj_in), **values} for obj_in in objs_in],
+        )
+        return list(result.scalars().all())
+
+    async def update(
+        self,
+        db: AsyncSession,
+        id: Ident,
+        obj_in: UpdateSchemaType | Mapping[str, Any],
+        *,
+        where: ColumnElement[bool] = true(),
+    ) -> ModelType | None:
+        """
+        UPDATE ... RETURNING of the fields set in `obj_in`. `where` (e.g. an ownership
+        check) is part of the statement; returns None when no row satisfies it.
+        """
+        data = self._data(obj_in, exclude_unset=True)
+        if not data:
+            return await self.get(db, id, where=where)
+        result = await db.execute(
+            update(self.model).where(self._ident(id), where).values(**data).returning(self.model)
+        )
+        return result.scalar_one_or_none()
+
+    async def update_many(self, db: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Per-row values by primary key (each mapping carries it): one executemany UPDATE."""
+        if rows:
+            await db.execute(update(self.model), list(rows))
+
+    async def update_where(self, db: AsyncSession, values: Mapping[str, Any], *where: ColumnElement[bool]) -> int:
+        """The same values on every matching row; returns how many changed."""
+        result = await db.execute(update(self.model).where(*where).values(**values))
+        return result.rowcount
+
+    async def remove(self, db: AsyncSession, id: Ident, *, where: ColumnElement[bool] = true()) -> ModelType | None:
+        # Dependent rows go through the foreign keys' ON DELETE rules
+        result = await db.execute(delete(self.model).where(self._ident(id), where).returning(self.model))
+        return result.scalar_one_or_none()
+
+    async def remove_many(self, db: AsyncSession, ids: Sequence[Ident]) -> int:
+        if not ids:
+            return 0
+        if len(self.primary_key) == 1:
+            condition = self.primary_key[0].in_(ids)
+        else:
+            condition = tuple_(*self.primary_key).in_([tuple(id) for id in ids])
+        return await self.remove_where(db, condition)
+
+    async def remove_where(self, db: AsyncSession, *where: ColumnElement[bool]) -> int:
+        result = await db.execute(delete(self.model).where(*where))
+        return result.rowcount
@@ -1,55 +1,27 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.crud.base import CRUDBase
+from app.crud.pagination import PageRequest
 from app.models.postulacion import Postulacion
+from app.schemas.page import Page
 from app.schemas.postulacion import PostulacionCreate, PostulacionUpdate
 
 class CRUDPostulacion(CRUDBase[Postulacion, PostulacionCreate, PostulacionUpdate]):
-    def create_with_student(
-        self, db: Session, *, obj_in: PostulacionCreate, id_estudiante: int
-    ) -> Postulacion:
-        db_obj = Postulacion(
-            id_iniciativa=obj_in.id_iniciativa,
-            id_estudiante=id_estudiante,
-            mensaje=obj_in.mensaje,
-            estado="pendiente"
-        )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+    async def create_with_student(self, db: AsyncSession, obj_in: PostulacionCreate, id_estudiante: int) -> Postulacion:
+        return await self.create(db, obj_in, id_estudiante=id_estudiante, estado="pendiente")
 
-    def get_by_student(
-        self, db: Session, *, id_estudiante: int, skip: int = 0, limit: int = 100
-    ) -> List[Postulacion]:
-        return (
-            db.query(self.model)
-            .filter(Postulacion.id_estudiante == id_estudiante)
-            .offset(skip)
-            .limit(limit)
-            .all()
+    async def has_applied(self, db: AsyncSession, id_iniciativa: int, id_estudiante: int) -> bool:
+        count = await self.count(
+            db, Postulacion.id_iniciativa == id_iniciativa, Postulacion.id_estudiante == id_estudiante
         )
+        return count > 0
 
-    def get_by_initiative(
-        self, db: Session, *, id_iniciativa: int, skip: int = 0, limit: int = 100
-    ) -> List[Postulacion]:
-        return (
-            db.query(self.model)
-            .filter(Postulacion.id_iniciativa == id_iniciativa)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-    
-    def get_multi_by_status(
-        self, db: Session, *, estado: str, skip: int = 0, limit: int = 100
-    ) -> List[Postulacion]:
-        return (
-            db.query(self.model)
-            .filter(Postulacion.estado == estado)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+    async def get_by_student(self, db: AsyncSession, id_estudiante: int, page: PageRequest = PageRequest()) -> Page:
+        return await self.get_multi(db, Postulacion.id_estudiante == id_estudiante, page=page)
+
+    async def get_by_initiative(self, db: AsyncSession, id_iniciativa: int, page: PageRequest = PageRequest()) -> Page:
+        return await self.get_multi(db, Postulacion.id_iniciativa == id_iniciativa, page=page)
+
+    async def get_multi_by_status(self, db: AsyncSession, estado: str, page: PageRequest = PageRequest()) -> Page:
+        return await self.get_multi(db, Postulacion.estado == estado, page=page)
 
 postulacion = CRUDPostulacion(Postulacion)
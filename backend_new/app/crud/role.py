@@ -0,0 +1,30 @@
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.role import Role
+
+class CRUDRole:
+    async def get_all(self, db: AsyncSession):
+        result = await db.execute(select(Role.id_rol, Role.nombre, Role.descripcion).order_by(Role.id_rol))
+        return result.all()
+
+    async def seed_roles(self, db: AsyncSession, roles: list[dict]):
+        """
+        Every role row, after inserting those of `roles` missing by name. Existing rows
+        are left as they are, so descriptions edited by an admin survive a restart.
+        """
+        rows = await self.get_all(db)
+        existing = {row.nombre for row in rows}
+        missing = [role for role in roles if role["nombre"] not in existing]
+        if not missing:
+            return rows
+        try:
+            async with db.begin_nested():
+                await db.execute(insert(Role), missing)
+        except IntegrityError:
+            # Another worker starting at the same time seeded them first
+            pass
+        return await self.get_all(db)
+
+role = CRUDRole()
@@ -1,31 +1,93 @@
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
+from sqlalchemy import update
+from app.core.config import settings
+from app.core.security import create_refresh_token, hash_token
+from app.crud.base import CRUDBase
 from app.models.token import Token
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+class CRUDToken(CRUDBase[Token, BaseModel, BaseModel]):
+    # Tokens are stored as sha256 digests and looked up through the index on `token`
 
-class CRUDToken:
     async def create_token(self, db: AsyncSession, user_id: int, token_str: str, token_type: str = "auth", expires_at: datetime | None = None) -> Token:
-        db_token = Token(
-            id_usuario=user_id,
-            token=token_str,
-            tipo=token_type,
-            fecha_expiracion=expires_at
-        )
-        db.add(db_token)
-        await db.commit()
-        await db.refresh(db_token)
-        return db_token
+        return await self.create(db, {
+            "id_usuario": user_id,
+            "token": hash_token(token_str),
+            "tipo": token_type,
+            "fecha_expiracion": expires_at,
+        })
 
     async def get_token_by_token_str(self, db: AsyncSession, token_str: str) -> Token | None:
-        result = await db.execute(select(Token).where(Token.token == token_str))
-        return result.scalar_one_or_none()
+        return await self.get_by(db, Token.token == hash_token(token_str))
 
     async def delete_token(self, db: AsyncSession, token_id: int) -> Token | None:
-        db_token = await db.get(Token, token_id)
-        if not db_token:
+        return await self.remove(db, token_id)
+
+    def _refresh_expiry(self) -> datetime:
+        return datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+    async def create_session(self, db: AsyncSession, user_id: int) -> tuple[int, str]:
+        """
+        Store a new refresh token. Returns the session id (the `sid` claim of access
+        tokens) and the plain refresh token, which is never stored.
+        """
+        refresh_token = create_refresh_token()
+        db_token = await self.create_token(
+            db, user_id, refresh_token, token_type="refresh", expires_at=self._refresh_expiry()
+        )
+        return db_token.id_token, refresh_token
+
+    async def rotate_session(self, db: AsyncSession, refresh_token: str) -> tuple[int, int, str] | None:
+        """
+        Swap a valid refresh token for a new one in a single statement, so each refresh
+        token can only be used once. Returns (session id, user id, new refresh token).
+        """
+        new_refresh_token = create_refresh_token()
+        result = await db.execute(
+            update(Token)
+            .where(
+                Token.token == hash_token(refresh_token),
+                Token.tipo == "refresh",
+                Token.fecha_expiracion > datetime.utcnow(),
+            )
+            .values(token=hash_token(new_refresh_token), fecha_expiracion=self._refresh_expiry())
+            .returning(Token.id_token, Token.id_usuario)
+        )
+        row = result.one_or_none()
+        if row is None:
             return None
-        await db.delete(db_token)
-        await db.commit()
-        return db_token
+        return row.id_token, row.id_usuario, new_refresh_token
+
+    async def revoke_session(self, db: AsyncSession, session_id: int, user_id: int) -> float | None:
+        """
+        Mark the session as revoked. The row only has to outlive the access tokens already
+        issued for it; returns that moment as a timestamp, or None if there was nothing to revoke.
+        """
+        expires_at = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        result = await db.execute(
+            update(Token)
+            .where(Token.id_token == session_id, Token.id_usuario == user_id, Token.tipo == "refresh")
+            .values(tipo="revoked", fecha_expiracion=expires_at)
+            .returning(Token.id_token)
+        )
+        row = result.one_or_none()
+        return _timestamp(expires_at) if row else None
+
+    async def get_revoked_sessions(self, db: AsyncSession) -> list[tuple[int, float]]:
+        rows = await self.get_all(
+            db,
+            Token.tipo == "revoked",
+            Token.fecha_expiracion > datetime.utcnow(),
+            columns=(Token.id_token, Token.fecha_expiracion),
+        )
+        return [(id_token, _timestamp(expires_at)) for id_token, expires_at in rows]
+
+    async def delete_expired_tokens(self, db: AsyncSession) -> None:
+        await self.remove_where(db, Token.fecha_expiracion < datetime.utcnow())
+
+def _timestamp(value: datetime) -> float:
+    # fecha_expiracion holds naive UTC datetimes; naive .timestamp() would assume local time
+    return value.replace(tzinfo=timezone.utc).timestamp()
 
-token = CRUDToken()
\ No newline at end of file
+token = CRUDToken(Token)
@@ -1,79 +1,44 @@
+from typing import Any, Mapping
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload # Import selectinload
+from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash
-
-class CRUDUser:
-    async def get_user(self, db: AsyncSession, user_id: int) -> User | None:
-        result = await db.execute(
-            select(User).options(selectinload(User.role)).where(User.id_usuario == user_id)
-        )
-        return result.scalar_one_or_none()
+from app.core.hashing import password_hasher
+from app.core.cache import principal_cache
+from app.core.roles import COORDINADOR
+from app.db.unit_of_work import after_commit, release_connection
 
+class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     async def get_user_by_email(self, db: AsyncSession, email: str) -> User | None:
-        result = await db.execute(
-            select(User).options(selectinload(User.role)).where(User.email == email)
-        )
-        return result.scalar_one_or_none()
-
-    async def get_users(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> list[User]:
-        result = await db.execute(
-            select(User).options(selectinload(User.role)).offset(skip).limit(limit)
-        )
-        return result.scalars().all()
+        return await self.get_by(db, User.email == email)
 
-    async def create_user(self, db: AsyncSession, user: UserCreate) -> User:
-        hashed_password = get_password_hash(user.password)
-        db_user = User(
-            nombre=user.nombre,
-            email=user.email,
+    async def create(self, db: AsyncSession, obj_in: UserCreate) -> User:
+        await release_connection(db)
+        hashed_password = await password_hasher.hash(obj_in.password)
+        return await super().create(
+            db,
+            obj_in,
             password=hashed_password,
-            telefono=user.telefono,
-            github=user.github,
-            tecnologias=user.tecnologias,
-            foto=user.foto,
-            hoja_vida=user.hoja_vida, # Campo añadido
-            bio=user.bio,
-            sitio_web=user.sitio_web,
-            direccion=user.direccion,
-            identificador_fiscal=user.identificador_fiscal,
-            id_rol=user.id_rol if user.id_rol is not None else 1
-        )
-        db.add(db_user)
-        await db.commit()
-        await db.refresh(db_user)
-        # After committing, re-query the user to load the 'role' relationship
-        loaded_user = await db.execute(
-            select(User).options(selectinload(User.role)).where(User.id_usuario == db_user.id_usuario)
+            id_rol=obj_in.id_rol if obj_in.id_rol is not None else COORDINADOR,
         )
-        return loaded_user.scalar_one()
 
-    async def update_user(self, db: AsyncSession, user_id: int, user_in: UserUpdate) -> User | None:
-        db_user = await self.get_user(db, user_id)
-        if not db_user:
-            return None
-        
-        update_data = user_in.model_dump(exclude_unset=True)
+    async def update(self, db: AsyncSession, id: int, obj_in: UserUpdate | Mapping[str, Any], **kwargs) -> User | None:
+        update_data = self._data(obj_in, exclude_unset=True)
         if "password" in update_data and update_data["password"]:
-            update_data["password"] = get_password_hash(update_data["password"])
-        
-        for key, value in update_data.items():
-            setattr(db_user, key, value)
-        
-        await db.commit()
-        # After committing, re-query the user to load the 'role' relationship
-        # This avoids the "MissingGreenlet" error during response serialization
-        updated_user = await self.get_user(db, user_id)
-        return updated_user
+            await release_connection(db)
+            update_data["password"] = await password_hasher.hash(update_data["password"])
+        db_user = await super().update(db, id, update_data, **kwargs)
+        if db_user is not None:
+            after_commit(db, lambda: principal_cache.invalidate(id))
+        return db_user
+
+    async def update_password_hash(self, db: AsyncSession, user_id: int, hashed_password: str) -> None:
+        await self.update_where(db, {"password": hashed_password}, User.id_usuario == user_id)
 
-    async def delete_user(self, db: AsyncSession, user_id: int) -> User | None:
-        db_user = await self.get_user(db, user_id)
-        if not db_user:
-            return None
-        await db.delete(db_user)
-        await db.commit()
+    async def remove(self, db: AsyncSession, id: int, **kwargs) -> User | None:
+        db_user = await super().remove(db, id, **kwargs)
+        if db_user is not None:
+            after_commit(db, lambda: principal_cache.invalidate(id))
         return db_user
 
-user = CRUDUser()
\ No newline at end of file
+user = CRUDUser(User)
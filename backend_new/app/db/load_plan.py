@@ -0,0 +1,160 @@
+"""
+Eager-loading plans derived from response models. For an ORM model and the schema a
+route serializes it with, the plan is the columns that schema reads (load_only) and
+a selectinload, itself narrowed the same way, for every nested model it reads from a
+relationship. A route opts in with @eager_load(Model) under its @router decorator;
+while its endpoint runs, every select of that model gets the plan's options, so
+what is fetched follows the response_model instead of loader options written by hand.
+
+Plans are built once per (model, response model) pair. Whatever a plan leaves out
+(fields a schema reads from properties, recursive schemas) is still loaded in full
+or by the batch loader (app.db.batch_loader) before serialization.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterator
+
+from pydantic import BaseModel
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import InstrumentedAttribute, Session, load_only, selectinload
+from sqlalchemy.orm.interfaces import ONETOMANY
+from sqlalchemy.sql.base import ExecutableOption
+
+from app.db.batch_loader import _attribute_names, _models_in, _relationship
+
+_ENDPOINT_ATTRIBUTE = "__eager_load__"
+
+
+@dataclass(frozen=True, slots=True)
+class LoadPlan:
+    model: type
+    # The model's columns the schema reads; None when it can't tell (load them all)
+    columns: tuple[InstrumentedAttribute, ...] | None
+    options: tuple[ExecutableOption, ...]
+
+
+_current: ContextVar[LoadPlan | None] = ContextVar("load_plan", default=None)
+
+
+def _from_attributes(schema: type[BaseModel]) -> bool:
+    return bool(schema.model_config.get("from_attributes"))
+
+
+def _entity_schemas(annotation: Any) -> set[type[BaseModel]]:
+    """The schemas ORM objects are validated with in a response (inside Page, List, ...)."""
+    schemas = set()
+    for schema in _models_in(annotation):
+        if _from_attributes(schema):
+            schemas.add(schema)
+        else:
+            for field in schema.model_fields.values():
+                schemas |= _entity_schemas(field.annotation)
+    return schemas
+
+
+def _plan(model: type, schema: type[BaseModel], path: frozenset = frozenset()) -> LoadPlan:
+    mapper = inspect(model)
+    path = path | {(model, schema)}
+    columns = {getattr(model, mapper.get_property_by_column(column).key) for column in mapper.primary_key}
+    complete = True
+    options = []
+    for name, field in schema.model_fields.items():
+        nested = [nested for nested in _models_in(field.annotation) if _from_attributes(nested)]
+        if nested:
+            relationship = _relationship(mapper, name, field)
+            if relationship is None:
+                complete = False
+                continue
+            # The parent's side of the join, e.g. the foreign key of a many-to-one
+            for local, _ in relationship.local_remote_pairs:
+                if mapper.local_table.c.contains_column(local):
+                    columns.add(getattr(model, mapper.get_property_by_column(local).key))
+            target, target_schema = relationship.mapper.class_, nested[0]
+            if (target, target_schema) in path:
+                # Recursive schema: left to the batch loader
+                continue
+            child = _plan(target, target_schema, path)
+            child_options = list(child.options)
+            if child.columns is not None and relationship.direction is ONETOMANY:
+                # The children's foreign key, to group them under their parents
+                remote = [
+                    getattr(target, relationship.mapper.get_property_by_column(column).key)
+                    for _, column in relationship.local_remote_pairs
+                ]
+                child_options[0] = load_only(*child.columns, *remote)
+            options.append(selectinload(getattr(model, relationship.key)).options(*child_options))
+            continue
+        column = next(
+            (
+                getattr(model, attribute)
+                for attribute in _attribute_names(name, field)
+                if attribute in mapper.column_attrs
+            ),
+            None,
+        )
+        if column is None:
+            # Read from something other than a column (a property): can't tell what it needs
+            complete = False
+        else:
+            columns.add(column)
+
+    if not complete:
+        return LoadPlan(model, None, tuple(options))
+    ordered = tuple(sorted(columns, key=lambda column: column.key))
+    return LoadPlan(model, ordered, (load_only(*ordered), *options))
+
+
+@lru_cache(maxsize=None)
+def load_plan(model: type, response_model: Any) -> LoadPlan:
+    """The plan for the `model` objects a response of type `response_model` holds."""
+    schemas = {
+        schema for schema in _entity_schemas(response_model)
+        if not schema.model_fields.keys().isdisjoint(inspect(model).attrs.keys())
+    }
+    if len(schemas) != 1:
+        raise TypeError(f"Can't tell which schema {response_model} serializes {model.__name__} with")
+    return _plan(model, schemas.pop())
+
+
+def eager_load(model: type):
+    """
+    Opt a route into loading `model` by its response_model's plan. Goes under the
+    @router decorator, which is the one that reads it.
+    """
+
+    def mark(endpoint):
+        setattr(endpoint, _ENDPOINT_ATTRIBUTE, model)
+        return endpoint
+
+    return mark
+
+
+def planned_model(endpoint) -> type | None:
+    return getattr(endpoint, _ENDPOINT_ATTRIBUTE, None)
+
+
+@contextmanager
+def loading_by(plan: LoadPlan) -> Iterator[None]:
+    """Selects of the plan's model get its options inside the block."""
+    token = _current.set(plan)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _apply_load_plan(orm_execute_state) -> None:
+    plan = _current.get()
+    if (
+        plan is None
+        or not orm_execute_state.is_select
+        or orm_execute_state.is_column_load
+        or orm_execute_state.is_relationship_load
+    ):
+        return
+    statement = orm_execute_state.statement
+    if any(description["expr"] is plan.model for description in statement.column_descriptions):
+        orm_execute_state.statement = statement.options(*plan.options)
@@ -0,0 +1,69 @@
+import logging
+import os
+from functools import lru_cache
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Revision matching the schema create_all built before migrations existed
+BASELINE_REVISION = "0001"
+# Advisory lock key held by the worker applying migrations
+_MIGRATION_LOCK_KEY = 0x536F66744C696E6B  # "SoftLink"
+
+
+def alembic_config(connection: Connection | None = None) -> Config:
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+@lru_cache
+def head_revision() -> str:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def _current_revision(connection: Connection) -> str | None:
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+def _upgrade(connection: Connection) -> None:
+    # Re-read under the lock: another worker may have finished while this one waited
+    if _current_revision(connection) is None and inspect(connection).has_table("usuarios"):
+        logger.info("Unversioned schema found, stamping it at revision %s", BASELINE_REVISION)
+        command.stamp(alembic_config(connection), BASELINE_REVISION)
+    command.upgrade(alembic_config(connection), "head")
+
+
+async def ensure_schema(engine: AsyncEngine) -> None:
+    """
+    Startup check: one query reading the stored revision. Only if it is behind does a
+    single worker (holding an advisory lock) apply the pending migrations; the others
+    wait on the lock and then find the schema up to date.
+    """
+    head = head_revision()
+    async with engine.connect() as connection:
+        current = await connection.run_sync(_current_revision)
+    if current == head:
+        return
+    if not settings.MIGRATE_ON_STARTUP:
+        raise RuntimeError(f"Database schema is at {current}, expected {head}: run `alembic upgrade head`")
+
+    async with engine.connect() as connection:
+        # Transaction-scoped, so it is released by the commit (or rollback) on the same
+        # server connection even behind a transaction pooler (DB_POOLER_MODE)
+        if connection.dialect.name == "postgresql":
+            await connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+        await connection.run_sync(_upgrade)
+        await connection.commit()
+    logger.info("Database schema migrated from %s to %s", current, head)
@@ -0,0 +1,53 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.histogram import Histogram
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout waited for a connection
+    (including opening a new one) and how many checkouts timed out.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait = Histogram()
+        self.checkout_timeouts = 0
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            self.checkout_wait.observe(time.perf_counter() - started_at)
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep the counters across it
+        pool = super().recreate()
+        pool.checkout_wait = self.checkout_wait
+        pool.checkout_timeouts = self.checkout_timeouts
+        return pool
+
+
+def pool_stats(engine: AsyncEngine) -> dict:
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedPool):
+        return {"class": type(pool).__name__}
+    return {
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "timeout_s": pool.timeout(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # Negative while the pool hasn't opened pool_size connections yet
+        "overflow": pool.overflow(),
+        "checkout_timeouts": pool.checkout_timeouts,
+        "checkout_wait": pool.checkout_wait.stats(),
+    }
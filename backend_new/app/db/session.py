@@ -1,10 +1,49 @@
+from uuid import uuid4
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
+from app.db.instrumentation import instrument
+from app.db.pool import InstrumentedPool
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
-AsyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
+def _prepared_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
 
-async def get_db():
-    async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+def connect_args() -> dict:
+    """
+    Driver options. Behind a transaction pooler (DB_POOLER_MODE) consecutive
+    transactions may run on different server connections, so nothing may be cached
+    per connection: asyncpg's statement cache and SQLAlchemy's prepared statement
+    cache are off, and the statements it still prepares get unique names instead of
+    per-connection counters that would collide on a shared server connection.
+    """
+    if not settings.DB_POOLER_MODE:
+        return {}
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": _prepared_statement_name,
+    }
+
+if settings.DB_POOLER_MODE:
+    # PgBouncer does the pooling; a pool here would keep its server slots idle
+    pool_options = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.SQL_ECHO,
+    connect_args=connect_args(),
+    **pool_options,
+)
+instrument(engine)
+# expire_on_commit=False: objects flushed by CRUD helpers are serialized after the request's commit
+AsyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession, expire_on_commit=False)
@@ -0,0 +1,135 @@
+"""
+Statement timeouts and cancellation. Every request falls in a route class with
+its own budget for any single statement: public reads (GET without credentials),
+authenticated reads, writes, and exports. The budget is set with SET LOCAL at the
+start of each transaction, so it never outlives the request on a pooled connection.
+Work outside requests (startup, migrations, benchmarks) keeps the server default.
+
+When the client disconnects before the response is complete, the request is
+cancelled; asyncpg then cancels the statement it is running on the server.
+"""
+import asyncio
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.instrumentation import query_stats
+
+PUBLIC_READ = "public_read"
+READ = "read"
+WRITE = "write"
+EXPORT = "export"
+
+# Postgres SQLSTATE query_canceled, raised when statement_timeout fires
+QUERY_CANCELED = "57014"
+
+_READ_METHODS = {"GET", "HEAD"}
+
+_route_class: ContextVar[str | None] = ContextVar("route_class", default=None)
+
+
+def budget_ms(name: str) -> int:
+    return {
+        PUBLIC_READ: settings.DB_STATEMENT_TIMEOUT_PUBLIC_READ_MS,
+        READ: settings.DB_STATEMENT_TIMEOUT_READ_MS,
+        WRITE: settings.DB_STATEMENT_TIMEOUT_WRITE_MS,
+        EXPORT: settings.DB_STATEMENT_TIMEOUT_EXPORT_MS,
+    }[name]
+
+
+def route_class(name: str):
+    """
+    Dependency putting a route in another class than its method implies, e.g.
+    `dependencies=[Depends(route_class(EXPORT))]` on a long report.
+    """
+    budget_ms(name)
+
+    async def set_route_class() -> None:
+        # Async so it runs in the request's context rather than a worker thread's copy
+        _route_class.set(name)
+
+    return set_route_class
+
+
+def is_statement_timeout(exc: BaseException) -> bool:
+    return getattr(getattr(exc, "orig", None), "sqlstate", None) == QUERY_CANCELED
+
+
+@event.listens_for(Session, "after_begin")
+def _set_statement_timeout(session, transaction, connection) -> None:
+    name = _route_class.get()
+    if name is None or connection.dialect.name != "postgresql":
+        return
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(budget_ms(name))}")
+
+
+class StatementTimeoutMiddleware:
+    """
+    Picks the route class of each request and cancels the request, along with any
+    statement it is running, if the client goes away before the response is sent.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        if scope["method"] not in _READ_METHODS:
+            name = WRITE
+        elif any(key == b"authorization" for key, _ in scope["headers"]):
+            name = READ
+        else:
+            name = PUBLIC_READ
+        token = _route_class.set(name)
+        try:
+            await self._run_cancellable(scope, receive, send)
+        finally:
+            _route_class.reset(token)
+
+    async def _run_cancellable(self, scope, receive, send):
+        # The client's messages are read here so a disconnect is seen while the
+        # app is busy; the app gets them from the queue in order. The queue holds a
+        # single message, so a request body is still read only as fast as the app
+        # consumes it (ASGI backpressure) instead of being buffered here.
+        messages: asyncio.Queue = asyncio.Queue(maxsize=1)
+        response_complete = False
+        disconnected = False
+
+        async def send_tracking(message):
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        app_task = asyncio.ensure_future(self.app(scope, messages.get, send_tracking))
+
+        async def watch_client():
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    # Checked before queueing: the app may never read the body
+                    # message still waiting in the queue
+                    if not response_complete and not app_task.done():
+                        disconnected = True
+                        query_stats.cancelled_requests += 1
+                        app_task.cancel()
+                    await messages.put(message)
+                    return
+                await messages.put(message)
+
+        watcher = asyncio.ensure_future(watch_client())
+        try:
+            await app_task
+        except asyncio.CancelledError:
+            # Nobody is left to answer
+            if not disconnected:
+                raise
+        finally:
+            watcher.cancel()
+            if not app_task.done():
+                app_task.cancel()
@@ -0,0 +1,67 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.session import AsyncSessionLocal
+
+_AFTER_COMMIT = "after_commit"
+# Set once the session has written anything (see release_connection)
+_WROTE = "wrote"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement(orm_execute_state) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context) -> None:
+    session.info[_WROTE] = True
+
+
+def after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Run `callback` once the unit of work has committed; it is dropped on rollback.
+    For process-local state (caches, token versions) that must only change along
+    with the data.
+    """
+    db.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+async def release_connection(db: AsyncSession) -> None:
+    """
+    Give the session's connection back to the pool before slow work that doesn't
+    need it (password hashing, file IO). Only while the unit of work has just read:
+    its read-only transaction ends there and the next statement checks a connection
+    out again. Once something has been written the connection stays with the
+    transaction until the unit of work commits.
+    """
+    if not db.in_transaction() or db.info.get(_WROTE) or db.new or db.dirty or db.deleted:
+        return
+    await db.commit()
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[AsyncSession]:
+    """
+    One session and one transaction. CRUD helpers only flush; the transaction is
+    committed once when the block exits and rolled back if it raises, so a
+    multi-step write is never left half-applied.
+
+    The session is lazy: it checks a connection out of the pool on its first
+    statement and returns it when the transaction ends, so a request that never
+    queries never holds one.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except BaseException:
+            await session.rollback()
+            raise
+        for callback in session.info.pop(_AFTER_COMMIT, []):
+            callback()
@@ -5,12 +5,28 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeout
 from app.api.v1.api import api_router
 from app.core.config import settings
 from app.db.init_db import init_db
 from app.db.session import AsyncSessionLocal
+from app.db.unit_of_work import unit_of_work
+from app.core.hashing import password_hasher, PasswordHasherBusy
+from app.core.revocation import revoked_sessions
+from app.core.rate_limit import login_throttle, LoginThrottled
+from app.core.warmup import warmup
+from app.crud.token import token as crud_token
+from app.crud.pagination import InvalidCursor
 import asyncio
+import math
 import traceback
+import logging
+from app.db.instrumentation import SQLStatsMiddleware
+from app.db.timeouts import StatementTimeoutMiddleware, is_statement_timeout
+
+# Only app.* logs at INFO: SQLAlchemy would log every statement if its loggers inherited it
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s %(message)s")
+logging.getLogger("app").setLevel(logging.INFO)
 
 # Definir la ruta base del proyecto
 BASE_DIR = os.path.dirname(os.path.abspath(__file__)) # Nuevo
@@ -38,6 +54,8 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"],
 )
+app.add_middleware(SQLStatsMiddleware)
+app.add_middleware(StatementTimeoutMiddleware)
 
 # Montar el directorio de archivos estáticos
 # Asegurarse de que el directorio 'static' exista antes de montarlo
@@ -72,6 +90,71 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         }
     )
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Authentication service is busy, please retry"},
+        headers={
+            "Retry-After": "1",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
+            "Access-Control-Allow-Headers": "*",
+        }
+    )
+
+@app.exception_handler(LoginThrottled)
+async def login_throttled_handler(request: Request, exc: LoginThrottled):
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Too many login attempts, please retry later"},
+        headers={
+            "Retry-After": str(max(1, math.ceil(exc.retry_after))),
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
+            "Access-Control-Allow-Headers": "*",
+        }
+    )
+
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": "Invalid pagination cursor"},
+        headers={
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
+            "Access-Control-Allow-Headers": "*",
+        }
+    )
+
+@app.exception_handler(DBAPIError)
+async def statement_timeout_handler(request: Request, exc: DBAPIError):
+    if not is_statement_timeout(exc):
+        return await general_exception_handler(request, exc)
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": "The database took too long to answer"},
+        headers={
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
+            "Access-Control-Allow-Headers": "*",
+        }
+    )
+
+@app.exception_handler(PoolTimeout)
+async def pool_timeout_handler(request: Request, exc: PoolTimeout):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database is busy, please retry"},
+        headers={
+            "Retry-After": "1",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS, PATCH",
+            "Access-Control-Allow-Headers": "*",
+        }
+    )
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     print(f"Unhandled exception: {exc}")
@@ -86,17 +169,52 @@ async def general_exception_handler(request: Request, exc: Exception):
         }
     )
 
+async def refresh_revoked_sessions():
+    # Picks up logouts handled by other workers
+    while True:
+        await asyncio.sleep(settings.AUTH_STATE_REFRESH_SECONDS)
+        try:
+            async with AsyncSessionLocal() as session:
+                revoked_sessions.load(await crud_token.get_revoked_sessions(session))
+        except Exception as e:
+            print(f"Error refreshing revoked sessions: {e}")
+
 @app.on_event("startup")
 async def on_startup():
     # Initialize database and create roles
     try:
-        async with AsyncSessionLocal() as session:
+        async with unit_of_work() as session:
             await init_db(session)
+            await crud_token.delete_expired_tokens(session)
+            revoked_sessions.load(await crud_token.get_revoked_sessions(session))
         print("Database initialized and roles created on startup!")
     except Exception as e:
         print(f"Error initializing database: {e}")
         traceback.print_exc()
+    app.state.revocation_refresh_task = asyncio.create_task(refresh_revoked_sessions())
+    warmup.start(app)
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    warmup.stop()
+    app.state.revocation_refresh_task.cancel()
+    password_hasher.shutdown()
+    await login_throttle.store.close()
 
 @app.get("/")
 async def root():
-    return {"message": "Welcome to SoftLink Backend API!"}
\ No newline at end of file
+    return {"message": "Welcome to SoftLink Backend API!"}
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    # Liveness is /health; this one keeps the worker out of rotation until it is warm
+    if not warmup.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming_up"},
+        )
+    return {"status": "ready", "warmup": warmup.stats()}
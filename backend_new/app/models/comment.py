@@ -7,7 +7,7 @@ class Comment(Base):
     __tablename__ = "comentarios"
     id_comentario = Column(Integer, primary_key=True, index=True)
     id_usuario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"))
-    id_proyecto = Column(Integer, ForeignKey("proyectos.id_proyecto", ondelete="CASCADE"))
+    id_proyecto = Column(Integer, ForeignKey("proyectos.id_proyecto", ondelete="CASCADE"), index=True)
     contenido = Column(Text, nullable=False)
     fecha = Column(DateTime, server_default=func.now())
 
@@ -5,7 +5,7 @@ from app.db.base_class import Base
 class DocumentoIniciativa(Base):
     __tablename__ = "documentos_iniciativa"
     id_doc = Column(Integer, primary_key=True, index=True)
-    id_iniciativa = Column(Integer, ForeignKey("iniciativas.id_iniciativa", ondelete="CASCADE"))
+    id_iniciativa = Column(Integer, ForeignKey("iniciativas.id_iniciativa", ondelete="CASCADE"), index=True)
     nombre_archivo = Column(String(255))
     ruta_archivo = Column(String(255))
     tipo = Column(String(50))
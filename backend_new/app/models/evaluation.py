@@ -5,7 +5,7 @@ from app.db.base_class import Base
 class Evaluation(Base):
     __tablename__ = "evaluaciones"
     id_eval = Column(Integer, primary_key=True, index=True)
-    id_proyecto = Column(Integer, ForeignKey("proyectos.id_proyecto", ondelete="CASCADE"))
+    id_proyecto = Column(Integer, ForeignKey("proyectos.id_proyecto", ondelete="CASCADE"), index=True)
     id_evaluador = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="SET NULL"))
     id_criterio = Column(Integer, ForeignKey("criterios.id_criterio", ondelete="SET NULL"))
     puntuacion = Column(Integer) # CHECK (puntuacion BETWEEN 0 AND 100)
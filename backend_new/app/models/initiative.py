@@ -10,8 +10,8 @@ class Initiative(Base):
     descripcion = Column(Text, nullable=False)
     categoria = Column(String(50))
     impacto = Column(Text)
-    estado = Column(String(30), default="pendiente")
-    id_usuario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"))
+    estado = Column(String(30), default="pendiente", index=True)
+    id_usuario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"), index=True)
     fecha_creacion = Column(DateTime, server_default=func.now())
 
     creator = relationship("User", back_populates="iniciativas_creadas")
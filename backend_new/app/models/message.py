@@ -6,8 +6,8 @@ from sqlalchemy.sql import func
 class Message(Base):
     __tablename__ = "mensajes"
     id_mensaje = Column(Integer, primary_key=True, index=True)
-    id_remitente = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="SET NULL"))
-    id_destinatario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="SET NULL"))
+    id_remitente = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="SET NULL"), index=True)
+    id_destinatario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="SET NULL"), index=True)
     asunto = Column(String(150))
     contenido = Column(Text)
     fecha_envio = Column(DateTime, server_default=func.now())
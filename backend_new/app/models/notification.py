@@ -6,7 +6,7 @@ from sqlalchemy.sql import func
 class Notification(Base):
     __tablename__ = "notificaciones"
     id_notificacion = Column(Integer, primary_key=True, index=True)
-    id_usuario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"))
+    id_usuario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"), index=True)
     titulo = Column(String(150))
     mensaje = Column(Text)
     fecha = Column(DateTime, server_default=func.now())
@@ -7,8 +7,8 @@ class Token(Base):
     __tablename__ = "tokens"
     id_token = Column(Integer, primary_key=True, index=True)
     id_usuario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"))
-    token = Column(Text, nullable=False)
-    tipo = Column(String(50), default="auth")
+    token = Column(Text, nullable=False, index=True)  # sha256 digest, never the token itself
+    tipo = Column(String(50), default="auth")  # auth | recovery | refresh | revoked
     fecha_creacion = Column(DateTime, server_default=func.now())
     fecha_expiracion = Column(DateTime)
 
@@ -14,3 +14,4 @@ from .project_student import ProjectStudent, ProjectStudentCreate, ProjectStuden
 from .role import Role, RoleCreate, RoleUpdate
 from .token import Token, TokenPayload
 from .user import User, UserCreate, UserUpdate
+from .page import Page
@@ -5,4 +5,8 @@ class Token(BaseModel):
     token_type: str
 
 class TokenPayload(BaseModel):
-    sub: int | None = None
\ No newline at end of file
+    sub: int | None = None
+    sid: int | None = None
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
\ No newline at end of file
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, EmailStr, ConfigDict, computed_field
 from datetime import datetime
+from app.core.roles import role_registry
 from app.schemas.role import Role
 
 class UserBase(BaseModel):
@@ -29,4 +30,12 @@ class UserInDBBase(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 class User(UserInDBBase):
-    role: Role | None = None # Relationship to Role schema
\ No newline at end of file
+    @computed_field
+    @property
+    def role(self) -> Role | None:
+        # From the in-memory registry, so the relationship is never loaded
+        return role_registry.get(self.id_rol)
+
+class UserSnapshot(User):
+    """Read-only copy of the authenticated user, cached between requests."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
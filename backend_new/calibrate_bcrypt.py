@@ -0,0 +1,116 @@
+"""
+Measure bcrypt cost on this host and pick BCRYPT_ROUNDS for a latency budget.
+
+Run it on the machine (or container) that serves logins:
+
+    python calibrate_bcrypt.py --target-ms 150
+
+Each login costs one bcrypt verification, so the login ceiling per worker process is
+roughly PASSWORD_HASH_WORKERS / p50 (never more than the CPU cores can sustain).
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.hash import bcrypt
+
+sys.path.append(os.getcwd())
+
+from app.core.config import settings
+
+PASSWORD = "calibration-password"
+
+
+def measure(rounds: int, samples: int) -> list[float]:
+    hasher = bcrypt.using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        hasher.hash(PASSWORD)
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return timings
+
+
+def measure_throughput(rounds: int, workers: int, seconds: float) -> float:
+    # bcrypt releases the GIL, so a thread pool shows what the hashing pool can sustain
+    hasher = bcrypt.using(rounds=rounds)
+    done = 0
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while time.perf_counter() - started_at < seconds:
+            list(pool.map(lambda _: hasher.hash(PASSWORD), range(workers)))
+            done += workers
+    return done / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=150, help="p50 budget for one hash")
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=14)
+    parser.add_argument("--samples", type=int, default=7, help="hashes timed per cost")
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASH_WORKERS)
+    parser.add_argument("--throughput-seconds", type=float, default=0, help="also measure pooled throughput per cost")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    rows = []
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        timings = sorted(measure(rounds, args.samples))
+        p50 = statistics.median(timings)
+        row = {
+            "rounds": rounds,
+            "p50_ms": round(p50, 1),
+            "max_ms": round(timings[-1], 1),
+            # Logins/s one worker process can verify, bounded by its pool and by the cores
+            "ceiling_per_process": round(min(args.workers, cores) * 1000 / p50, 1),
+            "ceiling_per_host": round(cores * 1000 / p50, 1),
+        }
+        if args.throughput_seconds:
+            row["measured_per_process"] = round(measure_throughput(rounds, args.workers, args.throughput_seconds), 1)
+        rows.append(row)
+        if p50 > args.target_ms * 4:
+            # Each extra round doubles the cost; nothing above this can fit the budget
+            break
+
+    within_budget = [row["rounds"] for row in rows if row["p50_ms"] <= args.target_ms]
+    recommended = max(within_budget) if within_budget else args.min_rounds
+    report = {
+        "target_ms": args.target_ms,
+        "cores": cores,
+        "workers": args.workers,
+        "current_rounds": settings.BCRYPT_ROUNDS,
+        "recommended_rounds": recommended,
+        "costs": rows,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"cores={cores} PASSWORD_HASH_WORKERS={args.workers} target p50={args.target_ms:g} ms")
+    header = f"{'rounds':>6} {'p50 ms':>8} {'max ms':>8} {'logins/s/process':>17} {'logins/s/host':>14}"
+    if args.throughput_seconds:
+        header += f" {'measured/process':>17}"
+    print(header)
+    for row in rows:
+        line = (
+            f"{row['rounds']:>6} {row['p50_ms']:>8} {row['max_ms']:>8} "
+            f"{row['ceiling_per_process']:>17} {row['ceiling_per_host']:>14}"
+        )
+        if args.throughput_seconds:
+            line += f" {row['measured_per_process']:>17}"
+        marker = " <- recommended" if row["rounds"] == recommended else ""
+        print(line + marker)
+    print(f"\nBCRYPT_ROUNDS={recommended} (current: {settings.BCRYPT_ROUNDS})")
+    if not within_budget:
+        print(f"No cost fits {args.target_ms:g} ms on this host; using the minimum tried.")
+
+
+if __name__ == "__main__":
+    main()
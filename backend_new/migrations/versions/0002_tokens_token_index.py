@@ -0,0 +1,31 @@
+"""tokens.token index
+
+Added by a CREATE INDEX IF NOT EXISTS in init_db before migrations existed, so
+databases stamped at the baseline may already have it.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 07:26:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if 'ix_tokens_token' not in {index['name'] for index in inspector.get_indexes('tokens')}:
+        op.create_index(op.f('ix_tokens_token'), 'tokens', ['token'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_tokens_token'), table_name='tokens')
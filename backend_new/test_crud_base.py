@@ -0,0 +1,92 @@
+"""
+Checks CRUDBase's bulk writes and projections on an in-memory sqlite database
+(needs aiosqlite).
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import event
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.crud.base import CRUDBase
+from app.crud.pagination import PageRequest
+from app.db.base import Base
+from app.models.role import Role
+
+roles = CRUDBase(Role)
+
+
+async def _run(check):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await check(session, statements)
+    finally:
+        await engine.dispose()
+
+
+def test_bulk_writes():
+    async def check(session, statements):
+        # One statement on Postgres; sqlite has no ordered multi-row RETURNING and
+        # gets a statement per row, so only the result is checked here
+        created = await roles.create_many(session, [{"nombre": f"r{i}"} for i in range(5)], descripcion="bulk")
+        # In input order, with the server-set values
+        assert [role.nombre for role in created] == [f"r{i}" for i in range(5)]
+        assert {role.descripcion for role in created} == {"bulk"}
+        assert await roles.create_many(session, []) == []
+
+        ids = [role.id_rol for role in created]
+        await roles.update_many(session, [{"id_rol": ids[0], "nombre": "first"}, {"id_rol": ids[1], "nombre": "second"}])
+        assert await roles.update_where(session, {"descripcion": "odd"}, Role.id_rol.in_(ids[1::2])) == 2
+        session.expire_all()
+        rows = await roles.get_all(session, columns=(Role.nombre, Role.descripcion))
+        assert [tuple(row) for row in rows] == [
+            ("first", "bulk"), ("second", "odd"), ("r2", "bulk"), ("r3", "odd"), ("r4", "bulk")
+        ]
+
+        # Only the fields set on the update are written; `where` failing means no row
+        updated = await roles.update(session, ids[2], {"descripcion": "one"})
+        assert (updated.nombre, updated.descripcion) == ("r2", "one")
+        assert await roles.update(session, ids[2], {"nombre": "x"}, where=Role.descripcion == "other") is None
+
+        statements.clear()
+        assert await roles.remove_many(session, ids[:3]) == 3
+        assert len(statements) == 1
+        assert await roles.remove_many(session, []) == 0
+        assert await roles.remove_where(session, Role.descripcion == "odd") == 1
+        assert [role.nombre for role in await roles.get_all(session)] == ["r4"]
+
+    asyncio.run(_run(check))
+
+
+def test_get_multi_pages_through_a_projection():
+    async def check(session, statements):
+        await roles.create_many(session, [{"nombre": f"r{i}", "descripcion": "d"} for i in range(5)])
+        columns = (Role.id_rol, Role.nombre)
+        names = []
+        page = PageRequest(limit=2)
+        while True:
+            statements.clear()
+            result = await roles.get_multi(session, Role.nombre != "r3", page=page, columns=columns)
+            assert len(statements) == 1
+            assert "descripcion" not in statements[0]
+            assert all(isinstance(row, Row) for row in result.items)
+            names += [row.nombre for row in result.items]
+            if result.next_cursor is None:
+                break
+            page = PageRequest(limit=2, cursor=result.next_cursor)
+        assert names == ["r0", "r1", "r2", "r4"]
+
+        # Newest first, by another unique key
+        result = await roles.get_multi(session, key=(Role.nombre,), descending=True, page=PageRequest(limit=3), columns=(Role.nombre,))
+        assert [row.nombre for row in result.items] == ["r4", "r3", "r2"]
+
+    asyncio.run(_run(check))
@@ -0,0 +1,77 @@
+"""
+Checks that a load plan fetches exactly what the response model serializes: the
+schema's columns and nothing else (no password), with each nested model loaded up
+front in one query, however deep. Runs on an in-memory sqlite database (needs aiosqlite).
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.base import Base
+from app.db.load_plan import load_plan, loading_by
+from app.models.initiative import Initiative
+from app.models.project import Project
+from app.models.project_student import ProjectStudent
+from app.models.user import User
+from app.schemas.page import Page
+from app.schemas.project_student import ProjectStudent as ProjectStudentSchema
+
+PROJECTS = 20
+
+
+def test_plan_follows_the_schema():
+    plan = load_plan(ProjectStudent, Page[ProjectStudentSchema])
+    assert {column.key for column in plan.columns} == {"id_proyecto", "id_estudiante", "rol_en_proyecto"}
+    # Cached per (model, response model)
+    assert load_plan(ProjectStudent, Page[ProjectStudentSchema]) is plan
+
+
+def test_plan_is_applied_to_selects_of_its_model():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            users = [User(nombre=f"u{i}", email=f"u{i}@example.com", password="x") for i in range(PROJECTS)]
+            session.add_all(users)
+            await session.flush()
+            initiatives = [Initiative(nombre=f"i{i}", descripcion="d", id_usuario=user.id_usuario) for i, user in enumerate(users)]
+            session.add_all(initiatives)
+            await session.flush()
+            projects = [
+                Project(id_iniciativa=initiative.id_iniciativa, titulo=f"p{i}", id_coordinador=users[i].id_usuario)
+                for i, initiative in enumerate(initiatives)
+            ]
+            session.add_all(projects)
+            await session.flush()
+            session.add_all(
+                ProjectStudent(id_proyecto=project.id_proyecto, id_estudiante=users[-1 - i].id_usuario)
+                for i, project in enumerate(projects)
+            )
+            await session.commit()
+
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        try:
+            async with AsyncSession(engine) as session:
+                with loading_by(load_plan(ProjectStudent, Page[ProjectStudentSchema])):
+                    rows = (await session.execute(select(ProjectStudent))).scalars().all()
+        finally:
+            await engine.dispose()
+
+        # Assignments, students, projects, and the projects' initiatives and coordinators
+        assert len(statements) == 5
+        assert not any("password" in statement for statement in statements)
+        for row in rows:
+            assert "password" in inspect(row.student).unloaded
+            schema = ProjectStudentSchema.model_validate(row)
+            assert schema.student.id_usuario == row.id_estudiante
+            assert schema.project.coordinator.id_usuario == row.project.id_coordinador
+            assert schema.project.initiative.id_iniciativa == row.project.id_iniciativa
+
+    asyncio.run(run())
@@ -0,0 +1,128 @@
+"""
+Checks keyset pagination on a sqlite database (needs aiosqlite and httpx): a
+cursor that wasn't issued for the list is refused with 400 rather than failing
+the query, pages walk rows that tie on the sort column without skipping or
+repeating any, and the last page has no next cursor.
+"""
+import asyncio
+import base64
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+httpx = pytest.importorskip("httpx")
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.crud.pagination import InvalidCursor, PageRequest, decode_cursor, encode_cursor, paginate
+from app.db import unit_of_work
+from app.db.base import Base
+from app.main import app
+from app.models.initiative import Initiative
+from app.models.user import User
+
+KEY = (Initiative.estado, Initiative.id_iniciativa)
+# Three states, so most rows tie with their neighbours on the first key column
+STATES = ["aprobada", "pendiente", "rechazada"]
+INITIATIVES = 11
+
+
+def _raw(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode()).rstrip(b"=").decode()
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        _raw("{not json"),
+        _raw('{"estado": "pendiente"}'),
+        encode_cursor(["pendiente"]),
+        encode_cursor(["pendiente", 1, 2]),
+        encode_cursor([1, 1]),
+        encode_cursor(["pendiente", "1"]),
+        encode_cursor(["pendiente", True]),
+    ],
+)
+def test_cursors_not_issued_for_the_key_are_refused(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, KEY)
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(["pendiente", 7]), KEY) == ("pendiente", 7)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pages.db'}")
+
+    async def setup():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(User(id_usuario=1, nombre="u", email="u@example.com", password="x"))
+            session.add_all(
+                Initiative(nombre=f"i{i}", descripcion="d", estado=STATES[i % len(STATES)], id_usuario=1)
+                for i in range(INITIATIVES)
+            )
+            await session.commit()
+
+    asyncio.run(setup())
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_pages_walk_ties_in_key_order(engine, descending):
+    async def walk():
+        pages = []
+        cursor = None
+        async with AsyncSession(engine) as session:
+            expected = (await session.execute(select(*KEY))).all()
+            while True:
+                page = await paginate(session, select(Initiative), KEY, PageRequest(limit=4, cursor=cursor), descending=descending)
+                pages.append([(row.estado, row.id_iniciativa) for row in page.items])
+                cursor = page.next_cursor
+                if cursor is None:
+                    return pages, sorted(map(tuple, expected), reverse=descending)
+
+    pages, expected = asyncio.run(walk())
+    assert [len(page) for page in pages] == [4, 4, 3]
+    assert [row for page in pages for row in page] == expected
+
+
+def test_exact_last_page_has_no_next_cursor(engine):
+    async def run():
+        async with AsyncSession(engine) as session:
+            first = await paginate(session, select(Initiative), KEY, PageRequest(limit=INITIATIVES - 1))
+            last = await paginate(session, select(Initiative), KEY, PageRequest(limit=1, cursor=first.next_cursor))
+            return first, last
+
+    first, last = asyncio.run(run())
+    assert first.next_cursor is not None
+    assert len(last.items) == 1 and last.next_cursor is None
+
+
+def test_endpoint_answers_400_for_a_bad_cursor(engine, monkeypatch):
+    sessions = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(unit_of_work, "AsyncSessionLocal", sessions)
+
+    async def requests():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url=f"http://test{settings.API_V1_STR}"
+        ) as client:
+            bad = await client.get("/iniciativas/", params={"cursor": "not a cursor!"})
+            wrong_type = await client.get("/iniciativas/", params={"cursor": encode_cursor(["1"])})
+            first = await client.get("/iniciativas/", params={"limit": INITIATIVES - 1})
+            last = await client.get("/iniciativas/", params={"cursor": first.json()["next_cursor"]})
+            return bad, wrong_type, last
+
+    bad, wrong_type, last = asyncio.run(requests())
+    assert bad.status_code == 400 and bad.json() == {"detail": "Invalid pagination cursor"}
+    assert wrong_type.status_code == 400
+    assert last.status_code == 200
+    assert len(last.json()["items"]) == 1 and last.json()["next_cursor"] is None
@@ -0,0 +1,91 @@
+"""
+Checks refresh-token rotation and logout through the auth endpoints, on a sqlite
+database (needs aiosqlite and httpx): a refresh token works once, and a session
+that logged out can neither refresh nor use its access tokens.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+httpx = pytest.importorskip("httpx")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.db import unit_of_work
+from app.db.base import Base
+from app.main import app
+from app.models.user import User
+
+EMAIL = "ana@example.com"
+# Any route that needs a valid access token
+PROTECTED = "/proyectos-estudiantes/project/1"
+PASSWORD = "correct horse"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}")
+    # Requests keep their real unit of work (commit, after-commit hooks) on sqlite
+    monkeypatch.setattr(
+        unit_of_work, "AsyncSessionLocal", sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    )
+
+    async def setup():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(User(nombre="Ana", email=EMAIL, password=get_password_hash(PASSWORD)))
+            await session.commit()
+
+    asyncio.run(setup())
+    yield lambda requests: asyncio.run(_with_client(requests))
+    asyncio.run(engine.dispose())
+
+
+async def _with_client(requests):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=f"http://test{settings.API_V1_STR}"
+    ) as client:
+        return await requests(client)
+
+
+async def _login(client) -> dict:
+    response = await client.post("/auth/login", data={"username": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_refresh_token_can_only_be_used_once(client):
+    async def requests(client):
+        tokens = await _login(client)
+        rotated = await client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert rotated.status_code == 200
+        assert rotated.json()["refresh_token"] != tokens["refresh_token"]
+        # The old one was swapped out: reusing it fails, the new one works
+        reused = await client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert reused.status_code == 401
+        again = await client.post("/auth/refresh", json={"refresh_token": rotated.json()["refresh_token"]})
+        assert again.status_code == 200
+
+    client(requests)
+
+
+def test_logout_revokes_the_session(client):
+    async def requests(client):
+        tokens = await _login(client)
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        assert (await client.get(PROTECTED, headers=headers)).status_code == 200
+        assert (await client.post("/auth/logout", headers=headers)).status_code == 204
+        # The access token is refused although it hasn't expired, and so is the refresh token
+        assert (await client.get(PROTECTED, headers=headers)).status_code == 401
+        refreshed = await client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert refreshed.status_code == 401
+        # Other sessions of the user are unaffected
+        other = await _login(client)
+        assert (await client.get(PROTECTED, headers={"Authorization": f"Bearer {other['access_token']}"})).status_code == 200
+
+    client(requests)
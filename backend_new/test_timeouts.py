@@ -0,0 +1,92 @@
+"""
+Checks StatementTimeoutMiddleware on raw ASGI apps: a client that goes away
+cancels the request, and a request body still reaches the app intact, in order,
+and no faster than the app reads it.
+"""
+import asyncio
+
+from app.db.instrumentation import query_stats
+from app.db.timeouts import StatementTimeoutMiddleware
+
+
+def _scope(method: str = "GET") -> dict:
+    return {"type": "http", "method": method, "path": "/", "headers": []}
+
+
+def test_disconnect_cancels_the_request():
+    async def run():
+        started = asyncio.Event()
+        cancelled = False
+
+        async def app(scope, receive, send):
+            nonlocal cancelled
+            started.set()
+            try:
+                # A long statement
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            await started.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            raise AssertionError("nothing is sent to a client that left")
+
+        before = query_stats.cancelled_requests
+        # Returns instead of raising: nobody is left to answer
+        await asyncio.wait_for(StatementTimeoutMiddleware(app)(_scope(), receive, send), 5)
+        assert cancelled
+        assert query_stats.cancelled_requests == before + 1
+
+    asyncio.run(run())
+
+
+def test_request_body_reaches_the_app_in_order():
+    async def run():
+        chunks = [bytes([65 + i]) * 1024 for i in range(20)]
+        pulled = 0
+        consumed = 0
+        ahead = []
+
+        async def receive():
+            nonlocal pulled
+            if pulled == len(chunks):
+                # The client waits for the response
+                await asyncio.Event().wait()
+            pulled += 1
+            return {"type": "http.request", "body": chunks[pulled - 1], "more_body": pulled < len(chunks)}
+
+        async def app(scope, receive, send):
+            nonlocal consumed
+            body = b""
+            while True:
+                # A slow reader: the middleware must not run ahead of it
+                for _ in range(5):
+                    await asyncio.sleep(0)
+                ahead.append(pulled - consumed)
+                message = await receive()
+                consumed += 1
+                body += message["body"]
+                if not message["more_body"]:
+                    break
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": body})
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await asyncio.wait_for(StatementTimeoutMiddleware(app)(_scope("POST"), receive, send), 5)
+        assert sent[-1]["body"] == b"".join(chunks)
+        # One message queued, one held by the reader waiting for room
+        assert max(ahead) <= 2
+
+    asyncio.run(run())
@@ -1,49 +1,129 @@
 from typing import Generator
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.security import verify_password
-from app.db.session import AsyncSessionLocal
+from app.core.hashing import password_hasher
+from app.core.cache import principal_cache
+from app.core.principal import Principal, token_versions
+from app.core.revocation import revoked_sessions
+from app.db.replica import PRIMARY_PIN_HEADER, pinned_to_primary
+from app.db.session import AsyncSessionLocal, ReadSessionLocal
+from app.db.unit_of_work import release_connection, unit_of_work
 from app.crud import crud_user
+from app.crud.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageRequest
 from app.models.user import User
 from app.schemas.token import TokenData
+from app.schemas.user import UserSnapshot
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 async def get_db() -> Generator:
-    async with AsyncSessionLocal() as session:
+    """
+    The request's unit of work: every write of the request commits together at
+    the end. Depend on it with scope="function" so the commit happens before the
+    response is sent, not after. No connection is taken until the first query;
+    call release_connection() after reads that precede slow non-DB work.
+    """
+    async with unit_of_work() as session:
         yield session
 
-async def get_current_user(
-    db: AsyncSession = Depends(get_db),
-    token: str = Depends(oauth2_scheme)
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+async def get_read_db(request: Request) -> Generator:
+    """
+    Session on the read replica, for routes that never write. A client that just
+    wrote something is pinned to the primary for a few seconds so it reads it back.
+    Depend on it with scope="function" too, so the connection goes back to the pool
+    when the endpoint returns rather than after the response has been sent.
+    """
+    factory = ReadSessionLocal
+    if pinned_to_primary(request.headers.get(PRIMARY_PIN_HEADER)):
+        factory = AsyncSessionLocal
+    async with factory() as session:
+        yield session
+
+def get_page(
+    cursor: str | None = Query(None, description="`next_cursor` of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    skip: int | None = Query(None, ge=0, deprecated=True, description="OFFSET paging, ignored with `cursor`"),
+) -> PageRequest:
+    return PageRequest(limit=limit, cursor=cursor, skip=skip)
+
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+def decode_token(token: str) -> TokenData:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email)
     except JWTError:
         raise credentials_exception
-    
+    email: str = payload.get("sub")
+    if email is None:
+        raise credentials_exception
+    token_data = TokenData(
+        email=email,
+        id_usuario=payload.get("uid"),
+        id_rol=payload.get("rol"),
+        token_version=payload.get("ver", 0),
+        session_id=payload.get("sid"),
+    )
+    # Tokens issued before a role change carry an older version
+    if token_data.id_usuario is not None and not token_versions.is_current(token_data.id_usuario, token_data.token_version):
+        raise credentials_exception
+    # Sessions closed through /auth/logout
+    if token_data.session_id is not None and revoked_sessions.is_revoked(token_data.session_id):
+        raise credentials_exception
+    return token_data
+
+async def get_current_principal(
+    token: str = Depends(oauth2_scheme)
+) -> Principal:
+    """
+    Identity and role from the token claims only. Use this for role-gated endpoints
+    that don't need the user's profile data.
+    """
+    token_data = decode_token(token)
+    if token_data.id_usuario is None:
+        raise credentials_exception
+    return Principal(
+        id_usuario=token_data.id_usuario,
+        email=token_data.email,
+        id_rol=token_data.id_rol,
+        token_version=token_data.token_version,
+        session_id=token_data.session_id,
+    )
+
+async def get_current_user(
+    db: AsyncSession = Depends(get_db, scope="function"),
+    token: str = Depends(oauth2_scheme)
+) -> UserSnapshot:
+    token_data = decode_token(token)
+
+    cached = principal_cache.get(token_data.email)
+    if cached is not None:
+        return cached
+
+    epoch = principal_cache.epoch()
     user = await crud_user.get_user_by_email(db, email=token_data.email)
     if user is None:
         raise credentials_exception
-    return user
+    snapshot = UserSnapshot.model_validate(user)
+    principal_cache.set(token_data.email, snapshot, epoch=epoch)
+    return snapshot
 
 async def authenticate_user(db: AsyncSession, email: str, password: str):
     user = await crud_user.get_user_by_email(db, email)
     if not user:
         return False
-    if not verify_password(password, user.password):
+    await release_connection(db)
+    verified, new_hash = await password_hasher.verify_and_update(password, user.password)
+    if not verified:
         return False
+    # Stored hash uses another bcrypt cost (BCRYPT_ROUNDS changed): upgrade it now
+    if new_hash:
+        await crud_user.update_password_hash(db, user.id_usuario, new_hash)
     return user
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, users, initiatives, dashboard, postulaciones, projects, upload
+from app.api.v1.endpoints import auth, users, initiatives, dashboard, postulaciones, projects, upload, media, metrics
 
 api_router = APIRouter()
 
@@ -10,3 +10,5 @@ api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboar
 api_router.include_router(postulaciones.router, prefix="/postulaciones", tags=["postulaciones"])
 api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
 api_router.include_router(upload.router, prefix="/upload", tags=["upload"])
+api_router.include_router(media.router, prefix="/media", tags=["media"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
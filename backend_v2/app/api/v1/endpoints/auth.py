@@ -1,25 +1,57 @@
 from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, authenticate_user
+from app.api.deps import get_db, authenticate_user, get_current_principal
+from app.api.routing import BatchLoadingRoute
 from app.core.config import settings
+from app.core.principal import Principal
+from app.core.rate_limit import client_ip, login_throttle
+from app.core.revocation import revoked_sessions
+from app.core.roles import role_registry
 from app.core.security import create_access_token
-from app.crud import crud_user
+from app.crud import crud_user, crud_token
+from app.db.unit_of_work import after_commit
+from app.models.user import User as UserModel
 from app.schemas.user import UserCreate, User
-from app.schemas.token import Token
+from app.schemas.token import Token, RefreshRequest
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
+
+def issue_tokens(user: UserModel, session_id: int, refresh_token: str) -> dict:
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={
+            "sub": user.email,
+            "uid": user.id_usuario,
+            "rol": user.id_rol,
+            "ver": user.token_version,
+            "sid": session_id,
+        },
+        expires_delta=access_token_expires
+    )
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+        "user": user,
+    }
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register(
     user_in: UserCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     """
     Register a new user
     """
+    if role_registry.get(user_in.id_rol) is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid role"
+        )
+
     # Check if user already exists
     user = await crud_user.get_user_by_email(db, email=user_in.email)
     if user:
@@ -34,13 +66,17 @@ async def register(
 
 @router.post("/login", response_model=Token)
 async def login(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db, scope="function"),
     form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """
     OAuth2 compatible token login, get an access token for future requests
     """
-    user = await authenticate_user(db, form_data.username, form_data.password)
+    # Throttled attempts are refused before any bcrypt work
+    await login_throttle.admit(form_data.username, client_ip(request))
+    async with login_throttle.verification():
+        user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -48,9 +84,45 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
-    )
-    
-    return {"access_token": access_token, "token_type": "bearer", "user": user}
+    session_id, refresh_token = await crud_token.create_session(db, user.id_usuario)
+    return issue_tokens(user, session_id, refresh_token)
+
+@router.post("/refresh", response_model=Token)
+async def refresh(
+    body: RefreshRequest,
+    db: AsyncSession = Depends(get_db, scope="function")
+):
+    """
+    Exchange a refresh token for a new access token. The refresh token is rotated:
+    the one sent can't be used again.
+    """
+    rotated = await crud_token.rotate_session(db, body.refresh_token)
+    if rotated is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    session_id, user_id, refresh_token = rotated
+    user = await crud_user.get_user_by_id(db, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return issue_tokens(user, session_id, refresh_token)
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    db: AsyncSession = Depends(get_db, scope="function"),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Revoke the current session: its refresh token and every access token issued for it
+    """
+    if current_user.session_id is None:
+        return
+    expires_at = await crud_token.revoke_session(db, current_user.session_id, current_user.id_usuario)
+    if expires_at is not None:
+        after_commit(db, lambda: revoked_sessions.add(current_user.session_id, expires_at))
@@ -1,14 +1,17 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_current_principal
+from app.api.routing import BatchLoadingRoute
+from app.core.principal import Principal
+from app.core.permissions import authorize
+from app.core.roles import ESTUDIANTE, EMPRESA
 from app.crud import crud_user, crud_initiative
-from app.models.user import User
 from app.schemas.initiative import Initiative
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
 class DashboardStats(BaseModel):
     total_students: int
@@ -18,17 +21,17 @@ class DashboardStats(BaseModel):
 
 @router.get("/stats", response_model=DashboardStats)
 async def get_dashboard_stats(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db, scope="function"),
+    current_user: Principal = Depends(get_current_principal)
 ) -> Any:
     """
     Get dashboard statistics. Only for coordinators.
     """
-    if current_user.id_rol != 1: # 1 = Coordinator
-        raise HTTPException(status_code=403, detail="Not enough permissions")
+    authorize(current_user, "read", "dashboard")
     
-    total_students = await crud_user.count_by_role(db, role_id=2)
-    total_companies = await crud_user.count_by_role(db, role_id=3)
+    users_per_role = await crud_user.count_per_role(db)
+    total_students = users_per_role.get(ESTUDIANTE, 0)
+    total_companies = users_per_role.get(EMPRESA, 0)
     pending_initiatives_count = await crud_initiative.count_by_status(db, status="pendiente")
     pending_initiatives = await crud_initiative.get_by_status(db, status="pendiente", limit=5)
     
@@ -2,31 +2,33 @@ from typing import List, Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_read_db, get_current_principal, get_page
+from app.api.routing import BatchLoadingRoute
+from app.core.principal import Principal
+from app.core.permissions import authorize
 from app.crud import crud_initiative
+from app.crud.pagination import PageRequest
 from app.schemas.initiative import Initiative, InitiativeCreate, InitiativeUpdate
-from app.models.user import User
+from app.schemas.page import Page
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
-@router.get("/", response_model=List[Initiative])
+@router.get("/", response_model=Page[Initiative])
 async def read_initiatives(
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+    page: PageRequest = Depends(get_page),
 ):
     """
     Retrieve initiatives. Public access.
     """
-    initiatives = await crud_initiative.get_multi(db, skip=skip, limit=limit)
-    return initiatives
+    return await crud_initiative.get_multi(db, page=page)
 
 @router.post("/", response_model=Initiative)
 async def create_initiative(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     initiative_in: InitiativeCreate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Create new initiative.
@@ -37,7 +39,7 @@ async def create_initiative(
 @router.get("/{id}", response_model=Initiative)
 async def read_initiative(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     id: int,
 ):
     """
@@ -51,38 +53,34 @@ async def read_initiative(
 @router.put("/{id}", response_model=Initiative)
 async def update_initiative(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     id: int,
     initiative_in: InitiativeUpdate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
-    Update an initiative.
+    Update an initiative. Owners and coordinators only.
     """
-    initiative = await crud_initiative.get(db=db, id=id)
+    rule = authorize(current_user, "update", "initiative")
+    initiative = await crud_initiative.update(
+        db=db, id=id, obj_in=initiative_in, allowed=rule.clause(current_user)
+    )
     if not initiative:
         raise HTTPException(status_code=404, detail="Initiative not found")
-    if initiative.id_usuario != current_user.id_usuario and current_user.id_rol != 1: # 1 is Coordinator
-        raise HTTPException(status_code=400, detail="Not enough permissions")
-    
-    initiative = await crud_initiative.update(db=db, db_obj=initiative, obj_in=initiative_in)
     return initiative
 
 @router.delete("/{id}", response_model=Initiative)
 async def delete_initiative(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     id: int,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
-    Delete an initiative.
+    Delete an initiative. Owners and coordinators only.
     """
-    initiative = await crud_initiative.get(db=db, id=id)
+    rule = authorize(current_user, "delete", "initiative")
+    initiative = await crud_initiative.remove(db=db, id=id, allowed=rule.clause(current_user))
     if not initiative:
         raise HTTPException(status_code=404, detail="Initiative not found")
-    if initiative.id_usuario != current_user.id_usuario and current_user.id_rol != 1:
-        raise HTTPException(status_code=400, detail="Not enough permissions")
-    
-    initiative = await crud_initiative.remove(db=db, id=id)
     return initiative
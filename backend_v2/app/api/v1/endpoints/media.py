@@ -0,0 +1,23 @@
+import os
+import time
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+
+from app.core import media
+
+router = APIRouter()
+
+@router.get("/{filename}")
+async def get_media(filename: str, exp: int, sig: str):
+    """
+    Serve an uploaded file. Access is granted by the URL's signature alone, so no
+    database or token lookup happens here.
+    """
+    if not media.verify(filename, exp, sig):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid or expired link")
+    path = media.media_path(filename)
+    if path is None or not os.path.isfile(path):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    max_age = max(int(exp - time.time()), 0)
+    return FileResponse(path, headers={"Cache-Control": f"private, max-age={max_age}"})
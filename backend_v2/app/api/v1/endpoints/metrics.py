@@ -0,0 +1,37 @@
+from typing import Any
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_principal
+from app.core.principal import Principal, token_versions
+from app.core.permissions import authorize
+from app.core.revocation import revoked_sessions
+from app.core.hashing import password_hasher
+from app.core.cache import principal_cache
+from app.core.rate_limit import login_throttle
+from app.core.loop_monitor import event_loop_monitor
+from app.db.instrumentation import query_stats
+from app.db.pool import pool_stats
+from app.db.session import engine, read_engine
+
+router = APIRouter()
+
+@router.get("/")
+async def read_metrics(
+    current_user: Principal = Depends(get_current_principal)
+) -> Any:
+    """
+    Runtime metrics of this worker. Only for coordinators.
+    """
+    authorize(current_user, "read", "metrics")
+
+    return {
+        "event_loop": event_loop_monitor.stats(),
+        "db_pool": pool_stats(engine),
+        "db_read_pool": pool_stats(read_engine) if read_engine is not engine else None,
+        "sql": query_stats.stats(),
+        "password_hasher": password_hasher.stats(),
+        "principal_cache": principal_cache.stats(),
+        "login_throttle": login_throttle.stats(),
+        "token_versions": len(token_versions),
+        "revoked_sessions": len(revoked_sessions),
+    }
@@ -2,25 +2,28 @@ from typing import List, Any
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_current_principal
+from app.api.routing import BatchLoadingRoute
+from app.core.principal import Principal
+from app.core.permissions import authorize
 from app.crud import crud_postulacion, crud_initiative
-from app.schemas.postulacion import Postulacion, PostulacionCreate, PostulacionUpdate
-from app.models.user import User
+from app.db.load_plan import eager_load
+from app.models.postulacion import Postulacion as PostulacionModel
+from app.schemas.postulacion import Postulacion, PostulacionCreate, PostulacionReview, PostulacionUpdate
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
 @router.post("/", response_model=Postulacion)
 async def create_postulacion(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     postulacion_in: PostulacionCreate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Create new postulation. Only students.
     """
-    if current_user.id_rol != 2: # Student
-        raise HTTPException(status_code=400, detail="Only students can postulate")
+    authorize(current_user, "create", "postulacion")
     
     # Check if initiative exists
     initiative = await crud_initiative.get(db, id=postulacion_in.id_iniciativa)
@@ -37,9 +40,10 @@ async def create_postulacion(
     return postulacion
 
 @router.get("/me", response_model=List[Postulacion])
+@eager_load(PostulacionModel)
 async def read_my_postulaciones(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db, scope="function"),
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Get current user postulations.
@@ -47,16 +51,16 @@ async def read_my_postulaciones(
     postulaciones = await crud_postulacion.get_by_student(db, student_id=current_user.id_usuario)
     return postulaciones
 
-@router.get("/pending", response_model=List[Postulacion])
+@router.get("/pending", response_model=List[PostulacionReview])
+@eager_load(PostulacionModel)
 async def read_pending_postulaciones(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db, scope="function"),
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
-    Get all pending postulations. Only Coordinator.
+    Get all pending postulations, with each applicant's CV. Only Coordinator.
     """
-    if current_user.id_rol != 1:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
+    authorize(current_user, "list_pending", "postulacion")
     
     postulaciones = await crud_postulacion.get_pending(db)
     return postulaciones
@@ -65,28 +69,25 @@ from datetime import date
 from app.crud import crud_postulacion, crud_initiative, crud_project
 from app.schemas.project import ProjectCreate
 
-@router.put("/{id}", response_model=Postulacion)
+@router.put("/{id}", response_model=PostulacionReview)
 async def update_postulacion(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     id: int,
     postulacion_in: PostulacionUpdate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Update postulation status. Only Coordinator.
     If status is 'aceptada', creates a Project and assigns the student.
     """
-    if current_user.id_rol != 1:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
+    authorize(current_user, "update", "postulacion")
     
-    postulacion = await crud_postulacion.get(db, id=id)
+    # Update Postulation
+    postulacion = await crud_postulacion.update(db, id, postulacion_in)
     if not postulacion:
         raise HTTPException(status_code=404, detail="Postulation not found")
     
-    # Update Postulation
-    postulacion = await crud_postulacion.update(db=db, db_obj=postulacion, obj_in=postulacion_in)
-    
     # If accepted, create Project and assign Student
     if postulacion_in.estado == "aceptada":
         # Check if project already exists for this initiative
@@ -2,59 +2,49 @@ from typing import List, Any
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_read_db, get_current_principal, get_page
+from app.api.routing import BatchLoadingRoute
+from app.core.principal import Principal
+from app.core.permissions import authorize
+from app.crud.pagination import PageRequest, paginate
+from app.db.load_plan import eager_load
 from app.models.project import Project
-from app.models.project_student import ProjectStudent
-from app.models.initiative import Initiative
+from app.schemas.page import Page
 from app.schemas.project import Project as ProjectSchema
-from app.models.user import User
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
-@router.get("/public", response_model=List[ProjectSchema])
+@router.get("/public", response_model=Page[ProjectSchema])
+@eager_load(Project)
 async def read_public_projects(
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
+    db: AsyncSession = Depends(get_read_db, scope="function"),
+    page: PageRequest = Depends(get_page),
 ):
     """
     Retrieve all projects for public view.
     """
-    result = await db.execute(
-        select(Project)
-        .options(selectinload(Project.iniciativa))
-        .offset(skip)
-        .limit(limit)
-    )
-    return result.scalars().all()
+    return await paginate(db, select(Project), (Project.id_proyecto,), page)
 
-@router.get("/", response_model=List[ProjectSchema])
+@router.get("/", response_model=Page[ProjectSchema])
+@eager_load(Project)
 async def read_projects(
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db, scope="function"),
+    page: PageRequest = Depends(get_page),
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Retrieve all projects. Only for Coordinators.
     """
-    if current_user.id_rol != 1:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
+    authorize(current_user, "list", "project")
     
-    result = await db.execute(
-        select(Project)
-        .options(selectinload(Project.iniciativa))
-        .offset(skip)
-        .limit(limit)
-    )
-    return result.scalars().all()
+    return await paginate(db, select(Project), (Project.id_proyecto,), page)
 
 @router.get("/me", response_model=List[ProjectSchema])
+@eager_load(Project)
 async def read_my_projects(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db, scope="function"),
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Retrieve projects related to current user.
@@ -62,40 +52,18 @@ async def read_my_projects(
     - Company: Projects from their initiatives.
     - Coordinator: All projects they coordinate (or all if superuser).
     """
-    if current_user.id_rol == 2: # Student
-        # Join with ProjectStudent
-        result = await db.execute(
-            select(Project)
-            .join(ProjectStudent)
-            .options(selectinload(Project.iniciativa))
-            .filter(ProjectStudent.id_estudiante == current_user.id_usuario)
-        )
-        return result.scalars().all()
-    
-    elif current_user.id_rol == 3: # Company
-        # Join with Initiative
-        result = await db.execute(
-            select(Project)
-            .join(Initiative)
-            .options(selectinload(Project.iniciativa))
-            .filter(Initiative.id_usuario == current_user.id_usuario)
-        )
-        return result.scalars().all()
-        
-    elif current_user.id_rol == 1: # Coordinator
-        # Return all for now, or filter by id_coordinador if we assign specific coordinators
-        result = await db.execute(
-            select(Project)
-            .options(selectinload(Project.iniciativa))
-        )
-        return result.scalars().all()
-    
-    return []
+    rule = authorize(current_user, "list_mine", "project")
+    result = await db.execute(
+        select(Project)
+        .where(rule.clause(current_user))
+    )
+    return result.scalars().all()
 
 @router.get("/{id}", response_model=ProjectSchema)
+@eager_load(Project)
 async def read_project(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db, scope="function"),
     id: int,
 ):
     """
@@ -103,7 +71,6 @@ async def read_project(
     """
     result = await db.execute(
         select(Project)
-        .options(selectinload(Project.iniciativa))
         .filter(Project.id_proyecto == id)
     )
     project = result.scalar_one_or_none()
@@ -119,9 +86,9 @@ from app.schemas.milestone import Milestone, MilestoneCreate
 @router.get("/{id}/milestones", response_model=List[Milestone])
 async def read_project_milestones(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     id: int,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Get milestones for a project.
@@ -132,26 +99,22 @@ async def read_project_milestones(
 @router.post("/{id}/milestones", response_model=Milestone)
 async def create_project_milestone(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     id: int,
     milestone_in: MilestoneCreate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Create a milestone for a project. Only Coordinator.
     """
-    if current_user.id_rol != 1:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    
-    # Ensure project exists
-    project = await db.get(Project, id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    rule = authorize(current_user, "create", "milestone")
         
     # Force project_id from URL
     milestone_in.id_proyecto = id
     
-    milestone = await crud_milestone.create(db, obj_in=milestone_in)
+    milestone = await crud_milestone.create(db, obj_in=milestone_in, allowed=rule.clause(current_user))
+    if not milestone:
+        raise HTTPException(status_code=404, detail="Project not found")
     return milestone
 
 from app.crud import crud_delivery
@@ -160,24 +123,30 @@ from app.schemas.delivery import Delivery, DeliveryCreate
 @router.post("/{id}/milestones/{milestone_id}/deliveries", response_model=Delivery)
 async def create_milestone_delivery(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     id: int,
     milestone_id: int,
     delivery_in: DeliveryCreate,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
-    Submit a delivery for a milestone. Only Students.
+    Submit a delivery for a milestone. Only students assigned to the project.
     """
-    if current_user.id_rol != 2:
-        raise HTTPException(status_code=403, detail="Only students can submit deliveries")
-    
-    # TODO: Verify student belongs to project
+    rule = authorize(current_user, "create", "delivery")
     
     # Force milestone_id
     delivery_in.id_hito = milestone_id
     
-    delivery = await crud_delivery.create(db, obj_in=delivery_in, student_id=current_user.id_usuario)
+    # Membership is checked inside the INSERT; a milestone the student can't deliver to doesn't match
+    delivery = await crud_delivery.create(
+        db,
+        obj_in=delivery_in,
+        student_id=current_user.id_usuario,
+        project_id=id,
+        allowed=rule.clause(current_user),
+    )
+    if not delivery:
+        raise HTTPException(status_code=404, detail="Milestone not found")
     
     # Update milestone status to 'completado' (or 'entregado' if we had that status)
     # For now, let's keep it simple. Maybe Coordinator manually marks it as completed after review.
@@ -187,10 +156,10 @@ async def create_milestone_delivery(
 @router.get("/{id}/milestones/{milestone_id}/deliveries", response_model=List[Delivery])
 async def read_milestone_deliveries(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
     id: int,
     milestone_id: int,
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Get deliveries for a milestone.
@@ -4,20 +4,24 @@ from typing import Any
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
 from app.core.config import settings
 from app.models.user import User
-from app.api.deps import get_current_user
-from app.db.session import AsyncSessionLocal
+from app.api.deps import get_db, get_current_principal
+from app.api.routing import BatchLoadingRoute
+from app.core.principal import Principal
+from app.core.cache import principal_cache
+from app.core.media import UPLOAD_DIR, media_url
+from app.db.unit_of_work import after_commit
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import update
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
-UPLOAD_DIR = "static/uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 @router.post("/image")
 async def upload_profile_image(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db, scope="function"),
+    current_user: Principal = Depends(get_current_principal),
 ):
     if not file.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="File must be an image")
@@ -30,21 +34,21 @@ async def upload_profile_image(
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
             
-        # Update user profile in DB
-        # We need a new session here since we're not injecting it
-        async with AsyncSessionLocal() as db:
-            stmt = update(User).where(User.id_usuario == current_user.id_usuario).values(foto=filename)
-            await db.execute(stmt)
-            await db.commit()
+        # Update user profile in DB. The file is written first: the session takes a
+        # connection only for this statement
+        stmt = update(User).where(User.id_usuario == current_user.id_usuario).values(foto=filename)
+        await db.execute(stmt)
+        after_commit(db, lambda: principal_cache.invalidate(current_user.email))
             
-        return {"filename": filename, "url": f"/static/uploads/{filename}"}
+        return {"filename": filename, "url": media_url(filename)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Could not upload file: {str(e)}")
 
 @router.post("/document")
 async def upload_cv(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db, scope="function"),
+    current_user: Principal = Depends(get_current_principal),
 ):
     if file.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="File must be a PDF")
@@ -56,11 +60,10 @@ async def upload_cv(
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
             
-        async with AsyncSessionLocal() as db:
-            stmt = update(User).where(User.id_usuario == current_user.id_usuario).values(hoja_vida=filename)
-            await db.execute(stmt)
-            await db.commit()
+        stmt = update(User).where(User.id_usuario == current_user.id_usuario).values(hoja_vida=filename)
+        await db.execute(stmt)
+        after_commit(db, lambda: principal_cache.invalidate(current_user.email))
             
-        return {"filename": filename, "url": f"/static/uploads/{filename}"}
+        return {"filename": filename, "url": media_url(filename)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Could not upload file: {str(e)}")
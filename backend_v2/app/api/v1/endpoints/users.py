@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_current_user, get_current_principal
+from app.api.routing import BatchLoadingRoute
+from app.core.principal import Principal
+from app.core.permissions import authorize
+from app.core.roles import role_registry
 from app.crud import crud_user
-from app.schemas.user import UserUpdate, User
+from app.schemas.user import UserUpdate, UserRoleUpdate, User
 from app.models.user import User as UserModel
 
-router = APIRouter()
+router = APIRouter(route_class=BatchLoadingRoute)
 
 @router.get("/me", response_model=User)
 async def get_current_user_profile(
@@ -20,11 +24,30 @@ async def get_current_user_profile(
 @router.put("/me", response_model=User)
 async def update_user_profile(
     user_update: UserUpdate,
-    db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db, scope="function"),
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Update current user profile
     """
     updated_user = await crud_user.update_user(db, user_id=current_user.id_usuario, user_update=user_update)
     return updated_user
+
+@router.put("/{user_id}/role", response_model=User)
+async def update_user_role(
+    user_id: int,
+    role_in: UserRoleUpdate,
+    db: AsyncSession = Depends(get_db, scope="function"),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Change a user's role. Only Coordinator. Tokens issued with the old role stop working.
+    """
+    authorize(current_user, "update_role", "user")
+    if role_registry.get(role_in.id_rol) is None:
+        raise HTTPException(status_code=400, detail="Invalid role")
+
+    user = await crud_user.update_role(db, user_id=user_id, role_id=role_in.id_rol)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
@@ -0,0 +1,64 @@
+import asyncio
+import os
+
+from app.core.config import settings
+
+
+class EventLoopMonitor:
+    """
+    Measures how late the event loop wakes up a task that sleeps `interval` seconds.
+    Lag above `stall_threshold` means something blocked the loop (e.g. CPU work that
+    should have gone to a worker pool). Counters are cumulative so two snapshots can
+    be subtracted.
+    """
+
+    def __init__(self, interval: float = 0.05, stall_threshold: float = 0.02):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self._task: asyncio.Task | None = None
+        self._samples = 0
+        self._lag_seconds = 0.0
+        self._max_lag = 0.0
+        self._stalls = 0
+        self._stall_seconds = 0.0
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - expected, 0.0)
+            self._samples += 1
+            self._lag_seconds += lag
+            self._max_lag = max(self._max_lag, lag)
+            if lag >= self.stall_threshold:
+                self._stalls += 1
+                self._stall_seconds += lag
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> dict:
+        samples = self._samples or 1
+        return {
+            # Metrics are per worker process; the pid tells workers apart
+            "pid": os.getpid(),
+            "interval_ms": self.interval * 1000,
+            "samples": self._samples,
+            "avg_lag_ms": round(self._lag_seconds / samples * 1000, 3),
+            "max_lag_ms": round(self._max_lag * 1000, 3),
+            "stalls": self._stalls,
+            "stall_ms": round(self._stall_seconds * 1000, 3),
+        }
+
+
+event_loop_monitor = EventLoopMonitor(
+    interval=settings.EVENT_LOOP_MONITOR_INTERVAL_MS / 1000,
+    stall_threshold=settings.EVENT_LOOP_STALL_THRESHOLD_MS / 1000,
+)
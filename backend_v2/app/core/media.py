@@ -0,0 +1,43 @@
+import base64
+import hashlib
+import hmac
+import math
+import os
+import time
+
+from app.core.config import settings
+
+UPLOAD_DIR = "static/uploads"
+
+# Separate from the JWT key's use: a media signature can never pass as a token signature
+_KEY = hmac.new(settings.SECRET_KEY.encode(), b"softlink-media", hashlib.sha256).digest()
+
+
+def _signature(filename: str, expires: int) -> str:
+    digest = hmac.new(_KEY, f"{filename}:{expires}".encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def media_url(filename: str | None) -> str | None:
+    """
+    Signed, expiring URL for an uploaded file. The expiry is rounded up to a bucket
+    boundary so the same file gets the same URL for a while and browsers can cache it.
+    """
+    if not filename:
+        return None
+    bucket = settings.MEDIA_URL_BUCKET_SECONDS
+    expires = math.ceil((time.time() + settings.MEDIA_URL_TTL_SECONDS) / bucket) * bucket
+    return f"{settings.API_V1_STR}/media/{filename}?exp={expires}&sig={_signature(filename, expires)}"
+
+
+def verify(filename: str, expires: int, signature: str) -> bool:
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(signature, _signature(filename, expires))
+
+
+def media_path(filename: str) -> str | None:
+    """Path of an uploaded file, or None if the name could escape the upload directory."""
+    if not filename or os.path.basename(filename) != filename or filename.startswith("."):
+        return None
+    return os.path.join(UPLOAD_DIR, filename)
@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import ColumnElement, select, true
+
+from app.core.principal import Principal
+from app.core.roles import COORDINADOR, EMPRESA, ESTUDIANTE
+from app.models.initiative import Initiative
+from app.models.milestone import Milestone
+from app.models.project import Project
+from app.models.project_student import ProjectStudent
+
+
+class PermissionDenied(Exception):
+    """The principal's role may never perform this action on this resource."""
+
+
+Predicate = Callable[[Principal], ColumnElement[bool]]
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """
+    What a role may do. Without a predicate the role alone is enough; otherwise the
+    predicate is folded into the statement's WHERE clause, so a row the principal may
+    not touch simply doesn't match. For `create`, the predicate applies to the parent
+    row the new one is created under (e.g. the milestone of a delivery).
+    """
+    predicate: Predicate | None = None
+
+    def clause(self, principal: Principal) -> ColumnElement[bool]:
+        if self.predicate is None:
+            return true()
+        return self.predicate(principal)
+
+
+ANY = Rule()
+
+
+def _owns_initiative(principal: Principal) -> ColumnElement[bool]:
+    return Initiative.id_usuario == principal.id_usuario
+
+
+def _project_member(principal: Principal) -> ColumnElement[bool]:
+    return Project.id_proyecto.in_(
+        select(ProjectStudent.id_proyecto).where(ProjectStudent.id_estudiante == principal.id_usuario)
+    )
+
+
+def _project_of_own_initiative(principal: Principal) -> ColumnElement[bool]:
+    return Project.id_iniciativa.in_(
+        select(Initiative.id_iniciativa).where(Initiative.id_usuario == principal.id_usuario)
+    )
+
+
+def _milestone_of_member_project(principal: Principal) -> ColumnElement[bool]:
+    return Milestone.id_proyecto.in_(
+        select(ProjectStudent.id_proyecto).where(ProjectStudent.id_estudiante == principal.id_usuario)
+    )
+
+
+# (resource, action) -> {role: rule}. Roles missing from an entry are denied.
+POLICY: dict[tuple[str, str], dict[int, Rule]] = {
+    ("initiative", "update"): {
+        COORDINADOR: ANY,
+        ESTUDIANTE: Rule(_owns_initiative),
+        EMPRESA: Rule(_owns_initiative),
+    },
+    ("initiative", "delete"): {
+        COORDINADOR: ANY,
+        ESTUDIANTE: Rule(_owns_initiative),
+        EMPRESA: Rule(_owns_initiative),
+    },
+    ("project", "list"): {COORDINADOR: ANY},
+    ("project", "list_mine"): {
+        COORDINADOR: ANY,
+        ESTUDIANTE: Rule(_project_member),
+        EMPRESA: Rule(_project_of_own_initiative),
+    },
+    ("milestone", "create"): {COORDINADOR: ANY},
+    ("delivery", "create"): {ESTUDIANTE: Rule(_milestone_of_member_project)},
+    ("postulacion", "create"): {ESTUDIANTE: ANY},
+    ("postulacion", "list_pending"): {COORDINADOR: ANY},
+    ("postulacion", "update"): {COORDINADOR: ANY},
+    ("user", "update_role"): {COORDINADOR: ANY},
+    ("dashboard", "read"): {COORDINADOR: ANY},
+    ("metrics", "read"): {COORDINADOR: ANY},
+}
+
+# Flattened once at import: authorizing is a single dict lookup
+_RULES: dict[tuple[int, str, str], Rule] = {
+    (role, action, resource): rule
+    for (resource, action), rules in POLICY.items()
+    for role, rule in rules.items()
+}
+
+
+def authorize(principal: Principal, action: str, resource: str) -> Rule:
+    """
+    Rule for the principal's role, raising PermissionDenied (403) if the role can't
+    perform the action at all. That check needs no database access.
+    """
+    rule = _RULES.get((principal.id_rol, action, resource))
+    if rule is None:
+        raise PermissionDenied()
+    return rule
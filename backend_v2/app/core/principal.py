@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Iterable
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Identity and role taken straight from the access token claims (no DB lookup)."""
+    id_usuario: int
+    email: str
+    id_rol: int | None
+    token_version: int
+    session_id: int | None = None
+
+
+class TokenVersions:
+    """
+    Current `ver` claim per user. Users are only tracked once their version moved
+    past 0 (e.g. after a role change), so the map stays small. Tokens carrying an
+    older version are rejected without touching the database.
+    """
+
+    def __init__(self):
+        self._versions: dict[int, int] = {}
+
+    def replace(self, rows: Iterable[tuple[int, int]]) -> None:
+        self._versions = {user_id: version for user_id, version in rows}
+
+    def bump(self, user_id: int, version: int) -> None:
+        if version > self._versions.get(user_id, 0):
+            self._versions[user_id] = version
+
+    def is_current(self, user_id: int, version: int) -> bool:
+        return version >= self._versions.get(user_id, 0)
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+
+token_versions = TokenVersions()
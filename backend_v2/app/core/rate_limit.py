@@ -0,0 +1,229 @@
+import ipaddress
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Protocol
+
+from starlette.requests import Request
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _networks(addresses: list[str]) -> tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]:
+    return tuple(ipaddress.ip_network(address, strict=False) for address in addresses)
+
+
+_trusted_proxies = _networks(settings.TRUSTED_PROXIES)
+
+
+def _is_trusted(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _trusted_proxies)
+
+
+def client_ip(request: Request) -> str | None:
+    """
+    The address a request came from, seen through the trusted proxies: the
+    right-most X-Forwarded-For entry that isn't one of them. Entries further left
+    were written by the client and can't be trusted.
+    """
+    host = request.client.host if request.client else None
+    if host is None or not _is_trusted(host):
+        return host
+    forwarded = [entry.strip() for entry in request.headers.get("x-forwarded-for", "").split(",") if entry.strip()]
+    for entry in reversed(forwarded):
+        if not _is_trusted(entry):
+            return entry
+    return forwarded[0] if forwarded else host
+
+
+class LoginThrottled(Exception):
+    """Raised when a login attempt is refused before any password is verified."""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+
+
+class BucketStore(Protocol):
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> float:
+        """Take one token from the bucket. Returns 0 if allowed, else seconds until a token is available."""
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class MemoryBucketStore:
+    """
+    Token buckets in this process. Each worker throttles on its own. At most
+    `max_keys` buckets are kept: past that the least recently used ones are dropped,
+    a tenth of the cap at a time so the pruning cost is spread over many calls.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # key -> (tokens, updated_at), least recently used first
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / refill_per_second
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            # Forgetting a bucket refills it early; under a flood of new keys the
+            # dropped ones are the attempts that haven't been repeated the longest
+            for _ in range(len(self._buckets) - self.max_keys + self.max_keys // 10):
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def close(self) -> None:
+        self._buckets.clear()
+
+
+# Refill and take in one round trip; TIME keeps every worker on the same clock
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(retry_after)
+"""
+
+
+class RedisBucketStore:
+    """
+    Token buckets shared by every worker through Redis (or any server speaking its
+    protocol and Lua scripting, e.g. Valkey). Falls back to local buckets while the
+    server is unreachable instead of refusing every login.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT_STORE=redis requires the 'redis' package") from e
+        self._client = redis.from_url(url)
+        self._take = self._client.register_script(_TAKE_SCRIPT)
+        self._fallback = MemoryBucketStore()
+
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> float:
+        try:
+            return float(await self._take(keys=[key], args=[capacity, refill_per_second]))
+        except Exception:
+            logger.warning("Rate limit store unreachable, using local buckets", exc_info=True)
+            return await self._fallback.take(key, capacity, refill_per_second)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class LoginThrottle:
+    """
+    Admission control in front of password verification: a token bucket per account
+    and per client IP, plus a cap on verifications running at once in this worker.
+    Every refusal is immediate so a credential-stuffing burst costs no bcrypt work.
+    """
+
+    def __init__(
+        self,
+        store: BucketStore,
+        account_burst: int,
+        account_per_minute: float,
+        ip_burst: int,
+        ip_per_minute: float,
+        max_concurrent: int,
+    ):
+        self.store = store
+        self.account_burst = account_burst
+        self.account_rate = account_per_minute / 60
+        self.ip_burst = ip_burst
+        self.ip_rate = ip_per_minute / 60
+        self.max_concurrent = max_concurrent
+        self._active = 0
+        self._allowed = 0
+        self._rejected_ip = 0
+        self._rejected_account = 0
+        self._rejected_concurrency = 0
+
+    async def admit(self, account: str, ip: str | None) -> None:
+        if ip:
+            retry_after = await self.store.take(f"login:ip:{ip}", self.ip_burst, self.ip_rate)
+            if retry_after:
+                self._rejected_ip += 1
+                raise LoginThrottled(retry_after)
+        retry_after = await self.store.take(
+            f"login:account:{account.strip().lower()}", self.account_burst, self.account_rate
+        )
+        if retry_after:
+            self._rejected_account += 1
+            raise LoginThrottled(retry_after)
+
+    @asynccontextmanager
+    async def verification(self):
+        if self._active >= self.max_concurrent:
+            self._rejected_concurrency += 1
+            raise LoginThrottled(1)
+        self._active += 1
+        self._allowed += 1
+        try:
+            yield
+        finally:
+            self._active -= 1
+
+    def stats(self) -> dict:
+        return {
+            "store": getattr(self.store, "name", type(self.store).__name__),
+            "active": self._active,
+            "max_concurrent": self.max_concurrent,
+            "allowed": self._allowed,
+            "rejected_ip": self._rejected_ip,
+            "rejected_account": self._rejected_account,
+            "rejected_concurrency": self._rejected_concurrency,
+        }
+
+
+def _create_store() -> BucketStore:
+    if settings.RATE_LIMIT_STORE == "redis":
+        return RedisBucketStore(settings.RATE_LIMIT_REDIS_URL)
+    return MemoryBucketStore()
+
+
+login_throttle = LoginThrottle(
+    store=_create_store(),
+    account_burst=settings.LOGIN_ACCOUNT_BURST,
+    account_per_minute=settings.LOGIN_ACCOUNT_PER_MINUTE,
+    ip_burst=settings.LOGIN_IP_BURST,
+    ip_per_minute=settings.LOGIN_IP_PER_MINUTE,
+    max_concurrent=settings.LOGIN_MAX_CONCURRENT_VERIFICATIONS,
+)
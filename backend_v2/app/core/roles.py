@@ -0,0 +1,45 @@
+from app.schemas.role import Role
+
+# Role ids as seeded on a fresh database; RoleRegistry.load checks them
+COORDINADOR = 1
+ESTUDIANTE = 2
+EMPRESA = 3
+
+ROLES = [
+    {"nombre": "coordinador", "descripcion": "Supervisa proyectos, aprueba iniciativas y evalúa estudiantes"},
+    {"nombre": "estudiante", "descripcion": "Participa en proyectos y desarrolla soluciones tecnológicas"},
+    {"nombre": "empresa", "descripcion": "Registra iniciativas y evalúa resultados"},
+]
+
+_EXPECTED_IDS = {"coordinador": COORDINADOR, "estudiante": ESTUDIANTE, "empresa": EMPRESA}
+
+
+class RoleRegistry:
+    """
+    The roles table, loaded once at startup. Roles never change at runtime, so
+    responses embed them from here instead of joining or selecting them per request.
+    """
+
+    def __init__(self):
+        self._by_id: dict[int, Role] = {}
+
+    def load(self, rows) -> None:
+        roles = {row.id_rol: Role.model_validate(row, from_attributes=True) for row in rows}
+        for role in roles.values():
+            expected = _EXPECTED_IDS.get(role.nombre)
+            if expected is not None and expected != role.id_rol:
+                # Authorization compares ids, so a mismatch would grant the wrong permissions
+                raise RuntimeError(f"Role '{role.nombre}' has id {role.id_rol}, expected {expected}")
+        self._by_id = roles
+
+    def get(self, role_id: int | None) -> Role | None:
+        return self._by_id.get(role_id)
+
+    def all(self) -> list[Role]:
+        return sorted(self._by_id.values(), key=lambda role: role.id_rol)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+role_registry = RoleRegistry()
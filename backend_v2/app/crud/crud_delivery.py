@@ -1,26 +1,43 @@
 from typing import List
+from sqlalchemy import ColumnElement, true, insert, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from app.crud.base import CRUDBase
 from app.models.delivery import Delivery
-from app.schemas.delivery import DeliveryCreate
+from app.models.milestone import Milestone
+from app.schemas.delivery import DeliveryCreate, DeliveryUpdate
+
+deliveries = CRUDBase[Delivery, DeliveryCreate, DeliveryUpdate](Delivery)
 
 async def get_by_milestone(db: AsyncSession, milestone_id: int):
-    result = await db.execute(select(Delivery).filter(Delivery.id_hito == milestone_id))
-    return result.scalars().all()
+    return await deliveries.get_all(db, Delivery.id_hito == milestone_id)
 
 async def get_by_student_and_milestone(db: AsyncSession, student_id: int, milestone_id: int):
+    return await deliveries.get_by(db, Delivery.id_estudiante == student_id, Delivery.id_hito == milestone_id)
+
+async def create(
+    db: AsyncSession,
+    obj_in: DeliveryCreate,
+    student_id: int,
+    project_id: int,
+    allowed: ColumnElement[bool] = true(),
+):
+    """
+    INSERT ... SELECT from the milestone, which must belong to `project_id` and satisfy
+    `allowed` (e.g. the student is a member of its project). Returns None otherwise.
+    """
+    data = obj_in.model_dump(exclude={"id_hito"})
     result = await db.execute(
-        select(Delivery)
-        .filter(Delivery.id_estudiante == student_id, Delivery.id_hito == milestone_id)
+        insert(Delivery)
+        .from_select(
+            ["id_hito", "id_estudiante", *data],
+            select(
+                Milestone.id_hito,
+                literal(student_id, Delivery.id_estudiante.type),
+                *(literal(value, Delivery.__table__.c[key].type) for key, value in data.items()),
+            )
+            .where(Milestone.id_hito == obj_in.id_hito, Milestone.id_proyecto == project_id, allowed),
+        )
+        .returning(Delivery)
     )
     return result.scalar_one_or_none()
-
-async def create(db: AsyncSession, obj_in: DeliveryCreate, student_id: int):
-    db_obj = Delivery(
-        **obj_in.model_dump(),
-        id_estudiante=student_id
-    )
-    db.add(db_obj)
-    await db.commit()
-    await db.refresh(db_obj)
-    return db_obj
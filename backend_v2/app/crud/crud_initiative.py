@@ -1,63 +1,38 @@
 from typing import List
+from sqlalchemy import ColumnElement, true
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.sql import func
+from app.crud.base import CRUDBase
+from app.crud.pagination import PageRequest
 from app.models.initiative import Initiative
 from app.schemas.initiative import InitiativeCreate, InitiativeUpdate
 
+initiatives = CRUDBase[Initiative, InitiativeCreate, InitiativeUpdate](Initiative)
+
 async def get(db: AsyncSession, id: int):
-    result = await db.execute(select(Initiative).filter(Initiative.id_iniciativa == id))
-    return result.scalar_one_or_none()
+    return await initiatives.get(db, id)
 
-async def get_multi(db: AsyncSession, skip: int = 0, limit: int = 100):
-    result = await db.execute(select(Initiative).offset(skip).limit(limit))
-    return result.scalars().all()
+async def get_multi(db: AsyncSession, page: PageRequest = PageRequest()):
+    return await initiatives.get_multi(db, page=page)
 
 async def get_by_owner(db: AsyncSession, owner_id: int, skip: int = 0, limit: int = 100):
-    result = await db.execute(
-        select(Initiative)
-        .filter(Initiative.id_usuario == owner_id)
-        .offset(skip)
-        .limit(limit)
-    )
-    return result.scalars().all()
+    return await initiatives.get_all(db, Initiative.id_usuario == owner_id, offset=skip, limit=limit)
 
 async def create(db: AsyncSession, obj_in: InitiativeCreate, owner_id: int):
-    db_obj = Initiative(
-        **obj_in.model_dump(),
-        id_usuario=owner_id
-    )
-    db.add(db_obj)
-    await db.commit()
-    await db.refresh(db_obj)
-    return db_obj
-
-async def update(db: AsyncSession, db_obj: Initiative, obj_in: InitiativeUpdate):
-    update_data = obj_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_obj, field, value)
-    
-    db.add(db_obj)
-    await db.commit()
-    await db.refresh(db_obj)
-    return db_obj
-
-async def remove(db: AsyncSession, id: int):
-    obj = await get(db, id)
-    if obj:
-        await db.delete(obj)
-        await db.commit()
-    return obj
+    return await initiatives.create(db, obj_in, id_usuario=owner_id)
+
+async def update(db: AsyncSession, id: int, obj_in: InitiativeUpdate, allowed: ColumnElement[bool] = true()):
+    """
+    Update in one UPDATE ... RETURNING. `allowed` (see app.core.permissions) is part of
+    the WHERE clause; returns None when no initiative with this id satisfies it.
+    """
+    return await initiatives.update(db, id, obj_in, where=allowed)
+
+async def remove(db: AsyncSession, id: int, allowed: ColumnElement[bool] = true()):
+    # Dependent rows go through the ON DELETE CASCADE foreign keys
+    return await initiatives.remove(db, id, where=allowed)
 
 async def count_by_status(db: AsyncSession, status: str):
-    result = await db.execute(select(func.count(Initiative.id_iniciativa)).filter(Initiative.estado == status))
-    return result.scalar_one()
+    return await initiatives.count(db, Initiative.estado == status)
 
 async def get_by_status(db: AsyncSession, status: str, skip: int = 0, limit: int = 100):
-    result = await db.execute(
-        select(Initiative)
-        .filter(Initiative.estado == status)
-        .offset(skip)
-        .limit(limit)
-    )
-    return result.scalars().all()
+    return await initiatives.get_all(db, Initiative.estado == status, offset=skip, limit=limit)
@@ -1,37 +1,40 @@
 from typing import List
+from sqlalchemy import ColumnElement, true, insert, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from app.crud.base import CRUDBase
 from app.models.milestone import Milestone
+from app.models.project import Project
 from app.schemas.milestone import MilestoneCreate, MilestoneUpdate
 
+milestones = CRUDBase[Milestone, MilestoneCreate, MilestoneUpdate](Milestone)
+
 async def get_by_project(db: AsyncSession, project_id: int):
-    result = await db.execute(select(Milestone).filter(Milestone.id_proyecto == project_id))
-    return result.scalars().all()
+    return await milestones.get_all(db, Milestone.id_proyecto == project_id)
 
 async def get(db: AsyncSession, id: int):
-    result = await db.execute(select(Milestone).filter(Milestone.id_hito == id))
-    return result.scalar_one_or_none()
+    return await milestones.get(db, id)
 
-async def create(db: AsyncSession, obj_in: MilestoneCreate):
-    db_obj = Milestone(**obj_in.model_dump())
-    db.add(db_obj)
-    await db.commit()
-    await db.refresh(db_obj)
-    return db_obj
+async def create(db: AsyncSession, obj_in: MilestoneCreate, allowed: ColumnElement[bool] = true()):
+    """
+    INSERT ... SELECT from the parent project, so the project's existence and `allowed`
+    are checked in the same statement. Returns None when the project doesn't qualify.
+    """
+    data = obj_in.model_dump(exclude={"id_proyecto"})
+    result = await db.execute(
+        insert(Milestone)
+        .from_select(
+            ["id_proyecto", *data],
+            # Typed literals: Postgres can't infer parameter types from an INSERT target list
+            select(Project.id_proyecto, *(literal(value, Milestone.__table__.c[key].type) for key, value in data.items()))
+            .where(Project.id_proyecto == obj_in.id_proyecto, allowed),
+        )
+        .returning(Milestone)
+    )
+    return result.scalar_one_or_none()
 
-async def update(db: AsyncSession, db_obj: Milestone, obj_in: MilestoneUpdate):
-    update_data = obj_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_obj, field, value)
-    
-    db.add(db_obj)
-    await db.commit()
-    await db.refresh(db_obj)
-    return db_obj
+async def update(db: AsyncSession, id: int, obj_in: MilestoneUpdate):
+    return await milestones.update(db, id, obj_in)
 
 async def remove(db: AsyncSession, id: int):
-    obj = await get(db, id)
-    if obj:
-        await db.delete(obj)
-        await db.commit()
-    return obj
+    return await milestones.remove(db, id)
@@ -1,59 +1,31 @@
 from typing import List
+from sqlalchemy import literal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from app.crud.base import CRUDBase
 from app.models.postulacion import Postulacion
 from app.schemas.postulacion import PostulacionCreate, PostulacionUpdate
 
+postulaciones = CRUDBase[Postulacion, PostulacionCreate, PostulacionUpdate](Postulacion)
+
 async def get(db: AsyncSession, id: int):
-    result = await db.execute(
-        select(Postulacion)
-        .options(selectinload(Postulacion.estudiante), selectinload(Postulacion.iniciativa))
-        .filter(Postulacion.id_postulacion == id)
-    )
-    return result.scalar_one_or_none()
+    return await postulaciones.get(db, id)
 
 async def get_by_student(db: AsyncSession, student_id: int):
-    result = await db.execute(
-        select(Postulacion)
-        .options(selectinload(Postulacion.iniciativa))
-        .filter(Postulacion.id_estudiante == student_id)
-    )
-    return result.scalars().all()
+    return await postulaciones.get_all(db, Postulacion.id_estudiante == student_id)
 
 async def get_by_initiative(db: AsyncSession, initiative_id: int):
-    result = await db.execute(
-        select(Postulacion)
-        .options(selectinload(Postulacion.estudiante))
-        .filter(Postulacion.id_iniciativa == initiative_id)
-    )
-    return result.scalars().all()
+    return await postulaciones.get_all(db, Postulacion.id_iniciativa == initiative_id)
 
 async def get_pending(db: AsyncSession):
-    result = await db.execute(
-        select(Postulacion)
-        .options(selectinload(Postulacion.estudiante), selectinload(Postulacion.iniciativa))
-        .filter(Postulacion.estado == "pendiente")
+    return await postulaciones.get_all(
+        db,
+        # Rendered inline, not as a bind parameter, so the planner can match the
+        # partial index ix_postulaciones_pendientes even for a cached generic plan
+        Postulacion.estado == literal("pendiente", literal_execute=True),
     )
-    return result.scalars().all()
 
 async def create(db: AsyncSession, obj_in: PostulacionCreate, student_id: int):
-    db_obj = Postulacion(
-        **obj_in.model_dump(),
-        id_estudiante=student_id,
-        estado="pendiente"
-    )
-    db.add(db_obj)
-    await db.commit()
-    await db.refresh(db_obj)
-    return db_obj
+    return await postulaciones.create(db, obj_in, id_estudiante=student_id, estado="pendiente")
 
-async def update(db: AsyncSession, db_obj: Postulacion, obj_in: PostulacionUpdate):
-    update_data = obj_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_obj, field, value)
-    
-    db.add(db_obj)
-    await db.commit()
-    await db.refresh(db_obj)
-    return db_obj
+async def update(db: AsyncSession, id: int, obj_in: PostulacionUpdate):
+    return await postulaciones.update(db, id, obj_in)
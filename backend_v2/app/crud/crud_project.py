@@ -1,26 +1,19 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
+from app.crud.base import CRUDBase
 from app.models.project import Project
 from app.models.project_student import ProjectStudent
 from app.schemas.project import ProjectCreate
 
+projects = CRUDBase[Project, ProjectCreate, ProjectCreate](Project)
+project_students = CRUDBase(ProjectStudent)
+
 async def get_by_initiative(db: AsyncSession, initiative_id: int):
-    result = await db.execute(select(Project).filter(Project.id_iniciativa == initiative_id))
-    return result.scalar_one_or_none()
+    return await projects.get_by(db, Project.id_iniciativa == initiative_id)
 
 async def create(db: AsyncSession, obj_in: ProjectCreate):
-    db_obj = Project(**obj_in.model_dump())
-    db.add(db_obj)
-    await db.commit()
-    await db.refresh(db_obj)
-    return db_obj
+    return await projects.create(db, obj_in)
 
 async def add_student(db: AsyncSession, project_id: int, student_id: int, role: str = "Estudiante"):
-    db_obj = ProjectStudent(
-        id_proyecto=project_id,
-        id_estudiante=student_id,
-        rol_en_proyecto=role
+    return await project_students.create(
+        db, {"id_proyecto": project_id, "id_estudiante": student_id, "rol_en_proyecto": role}
     )
-    db.add(db_obj)
-    await db.commit()
-    return db_obj
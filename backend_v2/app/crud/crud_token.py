@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, update
+from sqlalchemy.future import select
+from app.core.config import settings
+from app.core.security import create_refresh_token, hash_token
+from app.crud.base import CRUDBase
+from app.models.token import Token
+
+tokens = CRUDBase(Token)
+
+def _refresh_expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+async def create_session(db: AsyncSession, user_id: int) -> tuple[int, str]:
+    """
+    Store a new refresh token for the user. Returns the session id (used as the
+    `sid` claim of access tokens) and the plain refresh token, which is never stored.
+    """
+    refresh_token = create_refresh_token()
+    result = await db.execute(
+        insert(Token)
+        .values(
+            id_usuario=user_id,
+            token=hash_token(refresh_token),
+            tipo="refresh",
+            fecha_expiracion=_refresh_expiry(),
+        )
+        .returning(Token.id_token)
+    )
+    return result.scalar_one(), refresh_token
+
+async def rotate_session(db: AsyncSession, refresh_token: str) -> tuple[int, int, str] | None:
+    """
+    Swap a valid refresh token for a new one in a single statement, so a token can
+    only be used once. Returns (session id, user id, new refresh token).
+    """
+    new_refresh_token = create_refresh_token()
+    result = await db.execute(
+        update(Token)
+        .where(
+            Token.token == hash_token(refresh_token),
+            Token.tipo == "refresh",
+            Token.fecha_expiracion > datetime.now(timezone.utc),
+        )
+        .values(token=hash_token(new_refresh_token), fecha_expiracion=_refresh_expiry())
+        .returning(Token.id_token, Token.id_usuario)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    return row.id_token, row.id_usuario, new_refresh_token
+
+async def revoke_session(db: AsyncSession, session_id: int, user_id: int) -> float | None:
+    """
+    Mark the session as revoked. The row is kept only until the access tokens already
+    issued for it expire; returns that moment as a timestamp.
+    """
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    result = await db.execute(
+        update(Token)
+        .where(Token.id_token == session_id, Token.id_usuario == user_id, Token.tipo == "refresh")
+        .values(tipo="revoked", fecha_expiracion=expires_at)
+        .returning(Token.id_token)
+    )
+    row = result.one_or_none()
+    return expires_at.timestamp() if row else None
+
+async def get_revoked_sessions(db: AsyncSession) -> list[tuple[int, float]]:
+    result = await db.execute(
+        select(Token.id_token, Token.fecha_expiracion)
+        .where(Token.tipo == "revoked", Token.fecha_expiracion > datetime.now(timezone.utc))
+    )
+    return [(id_token, _timestamp(expires_at)) for id_token, expires_at in result.all()]
+
+async def delete_expired_tokens(db: AsyncSession) -> None:
+    await tokens.remove_where(db, Token.fecha_expiracion < datetime.now(timezone.utc))
+
+def _timestamp(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
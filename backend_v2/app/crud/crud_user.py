@@ -1,54 +1,56 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.sql import func
+from sqlalchemy import update
+from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash
+from app.core.hashing import password_hasher
+from app.core.cache import principal_cache
+from app.core.principal import token_versions
+from app.db.unit_of_work import after_commit, release_connection
+
+users = CRUDBase[User, UserCreate, UserUpdate](User)
 
 async def get_user_by_email(db: AsyncSession, email: str):
-    result = await db.execute(select(User).filter(User.email == email))
-    return result.scalar_one_or_none()
+    return await users.get_by(db, User.email == email)
 
 async def get_user_by_id(db: AsyncSession, user_id: int):
-    result = await db.execute(select(User).filter(User.id_usuario == user_id))
-    return result.scalar_one_or_none()
+    return await users.get(db, user_id)
 
 async def create_user(db: AsyncSession, user: UserCreate):
-    hashed_password = get_password_hash(user.password)
-    db_user = User(
-        email=user.email,
-        nombre=user.nombre,
-        password=hashed_password,
-        telefono=user.telefono,
-        github=user.github,
-        tecnologias=user.tecnologias,
-        bio=user.bio,
-        sitio_web=user.sitio_web,
-        id_rol=user.id_rol
-    )
-    db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
-    return db_user
+    await release_connection(db)
+    hashed_password = await password_hasher.hash(user.password)
+    return await users.create(db, user, password=hashed_password)
 
 async def update_user(db: AsyncSession, user_id: int, user_update: UserUpdate):
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return None
-    
     # Update only provided fields
-    update_data = user_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(user, field, value)
-    
-    await db.commit()
-    await db.refresh(user)
+    user = await users.update(db, user_id, user_update)
+    if user is not None:
+        after_commit(db, lambda: principal_cache.invalidate(user.email))
     return user
 
+async def update_role(db: AsyncSession, user_id: int, role_id: int):
+    # Bumping token_version invalidates every token issued with the old role
+    result = await db.execute(
+        update(User)
+        .where(User.id_usuario == user_id)
+        .values(id_rol=role_id, token_version=User.token_version + 1)
+        .returning(User)
+    )
+    user = result.scalar_one_or_none()
+    if user is None:
+        return None
+    after_commit(db, lambda: token_versions.bump(user_id, user.token_version))
+    after_commit(db, lambda: principal_cache.invalidate(user.email))
+    return user
+
+async def update_password_hash(db: AsyncSession, user_id: int, hashed_password: str):
+    await users.update_where(db, {"password": hashed_password}, User.id_usuario == user_id)
+
+async def get_token_versions(db: AsyncSession):
+    return await users.get_all(db, User.token_version > 0, columns=(User.id_usuario, User.token_version))
+
 async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100):
-    result = await db.execute(select(User).offset(skip).limit(limit))
-    return result.scalars().all()
+    return await users.get_all(db, offset=skip, limit=limit)
 
-async def count_by_role(db: AsyncSession, role_id: int):
-    result = await db.execute(select(func.count(User.id_usuario)).filter(User.id_rol == role_id))
-    return result.scalar_one()
+async def count_per_role(db: AsyncSession) -> dict[int, int]:
+    return await users.count_by(db, User.id_rol)
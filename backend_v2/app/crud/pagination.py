@@ -0,0 +1,92 @@
+"""
+Keyset pagination. A page is read as WHERE key > <key of the last row seen>
+ORDER BY key LIMIT n, so its cost is an index seek however deep the client is,
+and rows inserted meanwhile don't shift the pages after it. The key is a tuple of
+indexed columns ending in the primary key, so it is unique; the cursor handed to
+clients is that tuple for the last row of the page, opaque to them.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.schemas.page import Page
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class InvalidCursor(ValueError):
+    """The cursor wasn't issued for this list (or was tampered with)."""
+
+
+@dataclass(frozen=True, slots=True)
+class PageRequest:
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: str | None = None
+    # Deprecated OFFSET paging, only used when no cursor is given
+    skip: int | None = None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, key: Sequence[InstrumentedAttribute]) -> tuple:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError) as exc:
+        raise InvalidCursor(cursor) from exc
+    if not isinstance(values, list) or len(values) != len(key):
+        raise InvalidCursor(cursor)
+    for column, value in zip(key, values):
+        expected = column.type.python_type
+        # JSON true/false would pass as ints (bool subclasses int)
+        if not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+            raise InvalidCursor(cursor)
+    return tuple(values)
+
+
+def _selects_entity(statement: Select) -> bool:
+    descriptions = statement.column_descriptions
+    return len(descriptions) == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]
+
+
+async def paginate(
+    db: AsyncSession,
+    statement: Select,
+    key: Sequence[InstrumentedAttribute],
+    page: PageRequest,
+    *,
+    descending: bool = False,
+) -> Page:
+    """
+    Run `statement` (a select of one entity, or a projection including the key
+    columns) ordered by `key`, one page at a time. `key` must be unique and backed
+    by an index, e.g. (sort column, primary key).
+    """
+    statement = statement.order_by(*(column.desc() if descending else column.asc() for column in key))
+    if page.cursor is not None:
+        after = decode_cursor(page.cursor, key)
+        if len(key) == 1:
+            column, value = key[0], after[0]
+        else:
+            column, value = tuple_(*key), tuple_(*after)
+        statement = statement.where(column < value if descending else column > value)
+    elif page.skip:
+        statement = statement.offset(page.skip)
+
+    # One extra row tells whether there is a next page without a COUNT
+    result = await db.execute(statement.limit(page.limit + 1))
+    items = result.scalars().all() if _selects_entity(statement) else result.all()
+    next_cursor = None
+    if len(items) > page.limit:
+        items = items[: page.limit]
+        next_cursor = encode_cursor([getattr(items[-1], column.key) for column in key])
+    return Page(items=items, next_cursor=next_cursor)
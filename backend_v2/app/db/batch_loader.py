@@ -0,0 +1,191 @@
+"""
+Batched relationship loading for responses. Nested models in a response schema
+(Project.initiative, Postulacion.estudiante, ...) are filled in before the response
+is serialized: the loader walks the response along its schema, collects every
+unloaded relationship it reaches, and resolves each level with one
+`SELECT ... WHERE key IN (...)` per related model, however many rows point at it.
+Endpoints don't pick loader options, and serialization never lazy-loads, which an
+AsyncSession can't do anyway (MissingGreenlet).
+
+Loaded rows are cached on the session, so for the rest of the request a row that
+was fetched once, or found missing, is not asked for again.
+"""
+from collections import defaultdict
+from functools import lru_cache
+from typing import Annotated, Any, get_args, get_origin
+
+from pydantic import AliasChoices, BaseModel
+from pydantic.fields import FieldInfo
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_object_session
+from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import MANYTOMANY, MANYTOONE
+
+_MISSING = object()
+
+
+def _models_in(annotation: Any) -> tuple[type[BaseModel], ...]:
+    """The schemas a field's value can be validated as (through Optional, list, ...)."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return (annotation,)
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _models_in(get_args(annotation)[0])
+    if origin is None:
+        return ()
+    return tuple(model for arg in get_args(annotation) for model in _models_in(arg))
+
+
+@lru_cache(maxsize=None)
+def _nested_fields(schema: type[BaseModel]) -> tuple[tuple[str, FieldInfo], ...]:
+    return tuple((name, field) for name, field in schema.model_fields.items() if _models_in(field.annotation))
+
+
+def _attribute_names(name: str, field: FieldInfo) -> list[str]:
+    # The attribute read from an ORM object is the validation alias, if there is one
+    alias = field.validation_alias
+    if isinstance(alias, str):
+        return [alias, name]
+    if isinstance(alias, AliasChoices):
+        return [choice for choice in alias.choices if isinstance(choice, str)] + [name]
+    return [name]
+
+
+class BatchLoader:
+    """Per-session cache of rows fetched by primary key."""
+
+    def __init__(self):
+        self._rows: dict[tuple[type, Any], Any] = {}
+
+    @classmethod
+    def of(cls, session: AsyncSession) -> "BatchLoader":
+        loader = session.info.get("batch_loader")
+        if loader is None:
+            loader = session.info["batch_loader"] = cls()
+        return loader
+
+    async def get_many(self, session: AsyncSession, model: type, keys: set[Any]) -> dict[Any, Any]:
+        """Rows of `model` by primary key, fetching only the ones not seen yet in one IN query."""
+        mapper = inspect(model)
+        identity_map = session.sync_session.identity_map
+        missing = set()
+        for key in keys:
+            if (model, key) in self._rows:
+                continue
+            row = identity_map.get(mapper.identity_key_from_primary_key((key,)))
+            if row is not None:
+                self._rows[model, key] = row
+            else:
+                missing.add(key)
+        if missing:
+            primary_key = mapper.primary_key[0]
+            result = await session.execute(select(model).where(primary_key.in_(missing)))
+            for row in result.scalars():
+                self._rows[model, mapper.primary_key_from_instance(row)[0]] = row
+            for key in missing:
+                self._rows.setdefault((model, key), None)
+        return {key: self._rows[model, key] for key in keys}
+
+
+def _collect(value: Any, annotation: Any, pending: list) -> None:
+    """Find the ORM objects in `value` and the schema each will be serialized with."""
+    if value is None:
+        return
+    models = _models_in(annotation)
+    if not models:
+        return
+    if isinstance(value, (list, tuple, set)):
+        for item in value:
+            _collect(item, annotation, pending)
+        return
+    for schema in models:
+        if isinstance(value, (BaseModel, dict)):
+            for name, field in _nested_fields(schema):
+                child = value.get(name) if isinstance(value, dict) else getattr(value, name, None)
+                _collect(child, field.annotation, pending)
+        elif hasattr(value, "_sa_instance_state"):
+            pending.append((value, schema))
+
+
+def _relationship(mapper, name: str, field: FieldInfo) -> RelationshipProperty | None:
+    for attribute in _attribute_names(name, field):
+        relationship = mapper.relationships.get(attribute)
+        if relationship is not None:
+            return relationship
+    return None
+
+
+def _single_key(relationship: RelationshipProperty):
+    """(local column, remote column) of a relationship over a single-column foreign key."""
+    pairs = relationship.local_remote_pairs
+    if relationship.direction is MANYTOMANY or len(pairs) != 1:
+        return None
+    return pairs[0]
+
+
+async def load_relationships(value: Any, annotation: Any) -> None:
+    """Load every relationship the schema in `annotation` will read from `value`."""
+    pending: list = []
+    _collect(value, annotation, pending)
+    seen: set[tuple[int, type]] = set()
+    while pending:
+        # Many-to-one: (session, related model) -> [(object, relationship, field annotation, key)]
+        by_model: dict[tuple[AsyncSession, type], list] = defaultdict(list)
+        # One-to-many: (session, relationship) -> [(object, field annotation, key)]
+        by_relationship: dict[tuple[AsyncSession, RelationshipProperty], list] = defaultdict(list)
+        next_pending: list = []
+
+        for obj, schema in pending:
+            if (id(obj), schema) in seen:
+                continue
+            seen.add((id(obj), schema))
+            state = inspect(obj)
+            for name, field in _nested_fields(schema):
+                relationship = _relationship(state.mapper, name, field)
+                if relationship is None:
+                    continue
+                if relationship.key not in state.unloaded:
+                    _collect(state.dict.get(relationship.key), field.annotation, next_pending)
+                    continue
+                pair = _single_key(relationship)
+                session = async_object_session(obj)
+                if pair is None or session is None:
+                    # Not batched (many-to-many, composite keys, detached objects)
+                    continue
+                local, remote = pair
+                key = state.dict.get(state.mapper.get_property_by_column(local).key, _MISSING)
+                if key is _MISSING:
+                    # The key column itself is expired; reading it would be IO too
+                    continue
+                if relationship.direction is MANYTOONE and remote.primary_key:
+                    by_model[session, relationship.mapper.class_].append((obj, relationship, field.annotation, key))
+                else:
+                    by_relationship[session, relationship].append((obj, field.annotation, key))
+
+        for (session, model), needs in by_model.items():
+            rows = await BatchLoader.of(session).get_many(
+                session, model, {key for *_, key in needs if key is not None}
+            )
+            for obj, relationship, field_annotation, key in needs:
+                row = rows.get(key) if key is not None else None
+                set_committed_value(obj, relationship.key, row)
+                _collect(row, field_annotation, next_pending)
+
+        for (session, relationship), needs in by_relationship.items():
+            keys = {key for *_, key in needs if key is not None}
+            _, remote = _single_key(relationship)
+            children = defaultdict(list)
+            if keys:
+                target = relationship.mapper
+                remote_key = target.get_property_by_column(remote).key
+                result = await session.execute(select(target.class_).where(getattr(target.class_, remote_key).in_(keys)))
+                for child in result.scalars():
+                    children[getattr(child, remote_key)].append(child)
+            for obj, field_annotation, key in needs:
+                related = children.get(key, [])
+                value = related if relationship.uselist else (related[0] if related else None)
+                set_committed_value(obj, relationship.key, value)
+                _collect(value, field_annotation, next_pending)
+
+        pending = next_pending
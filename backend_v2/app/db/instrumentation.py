@@ -0,0 +1,161 @@
+import heapq
+import logging
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.histogram import Histogram
+
+logger = logging.getLogger("app.sql")
+
+_STATEMENT_PREVIEW = 300
+
+
+@dataclass(slots=True)
+class RequestQueries:
+    """Statements run while handling one request."""
+    count: int = 0
+    seconds: float = 0.0
+    # (seconds, statement) min-heap holding the slowest few
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+    def record(self, seconds: float, statement: str) -> None:
+        self.count += 1
+        self.seconds += seconds
+        entry = (seconds, statement[:_STATEMENT_PREVIEW])
+        if len(self.slowest) < settings.SQL_SLOWEST_PER_REQUEST:
+            heapq.heappush(self.slowest, entry)
+        elif entry > self.slowest[0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def summary(self) -> dict:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.seconds * 1000, 2),
+            "slowest": [
+                {"ms": round(seconds * 1000, 2), "statement": statement}
+                for seconds, statement in sorted(self.slowest, reverse=True)
+            ],
+        }
+
+
+_current: ContextVar[RequestQueries | None] = ContextVar("request_queries", default=None)
+
+
+class QueryStats:
+    """Process-wide statement counters, reported in /metrics."""
+
+    def __init__(self):
+        self.duration = Histogram()
+        self.slow_queries = 0
+        # Statements stopped by statement_timeout, and requests cancelled because
+        # the client disconnected (app.db.timeouts)
+        self.statement_timeouts = 0
+        self.cancelled_requests = 0
+
+    def stats(self) -> dict:
+        return {
+            "slow_query_ms": settings.SQL_SLOW_QUERY_MS,
+            "slow_queries": self.slow_queries,
+            "statement_timeouts": self.statement_timeouts,
+            "cancelled_requests": self.cancelled_requests,
+            "duration": self.duration.stats(),
+        }
+
+
+query_stats = QueryStats()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info["query_started_at"].pop()
+    query_stats.duration.observe(seconds)
+    request = _current.get()
+    if request is not None:
+        request.record(seconds, statement)
+    if seconds * 1000 >= settings.SQL_SLOW_QUERY_MS:
+        query_stats.slow_queries += 1
+        logger.warning(
+            "slow query ms=%.1f statement=%r",
+            seconds * 1000,
+            statement[:_STATEMENT_PREVIEW],
+            extra={"sql_ms": round(seconds * 1000, 2), "sql_statement": statement[:_STATEMENT_PREVIEW]},
+        )
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute doesn't run for a failed statement
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
+    original = exception_context.original_exception
+    # query_canceled is also what a cancel request gets; only count the timeouts
+    if getattr(original, "sqlstate", None) == "57014" and "statement timeout" in str(original):
+        query_stats.statement_timeouts += 1
+
+
+def instrument(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+class SQLStatsMiddleware:
+    """
+    Collects query count, DB time and the slowest statements for a sample of
+    requests and logs them as one line per request. With SQL_DEBUG_HEADERS every
+    request is tracked and the totals are returned in Server-Timing / X-DB-* headers.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        if not settings.SQL_DEBUG_HEADERS and random.random() >= settings.SQL_STATS_SAMPLE_RATE:
+            return await self.app(scope, receive, send)
+
+        queries = RequestQueries()
+        token = _current.set(queries)
+        started_at = time.perf_counter()
+        status_code = None
+
+        async def send_with_headers(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.SQL_DEBUG_HEADERS:
+                    db_ms = f"{queries.seconds * 1000:.2f}"
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"server-timing", f'db;desc="{queries.count} queries";dur={db_ms}'.encode()),
+                        (b"x-db-query-count", str(queries.count).encode()),
+                        (b"x-db-time-ms", db_ms.encode()),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current.reset(token)
+            summary = queries.summary()
+            logger.info(
+                "request method=%s path=%s status=%s ms=%.1f queries=%d db_ms=%.2f slowest=%s",
+                scope["method"],
+                scope["path"],
+                status_code,
+                (time.perf_counter() - started_at) * 1000,
+                summary["queries"],
+                summary["db_ms"],
+                summary["slowest"],
+                extra={"sql": summary, "path": scope["path"], "status": status_code},
+            )
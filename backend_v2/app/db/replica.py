@@ -0,0 +1,43 @@
+import time
+
+from app.core.config import settings
+
+# Returned after a successful write and sent back by the client on later reads
+PRIMARY_PIN_HEADER = "X-Read-Primary-Until"
+
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def pinned_to_primary(value: str | None) -> bool:
+    """Whether a read carrying this pin header must still go to the primary."""
+    if not value:
+        return False
+    try:
+        until = float(value)
+    except ValueError:
+        return False
+    now = time.time()
+    # Clients can't pin themselves for longer than one write would
+    return now < until <= now + settings.READ_YOUR_WRITES_SECONDS
+
+
+class ReadYourWritesMiddleware:
+    """
+    Stamps successful writes with a short primary pin. The pin travels with the
+    client rather than living in one worker, so any worker honours it.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in _SAFE_METHODS:
+            return await self.app(scope, receive, send)
+
+        async def send_with_pin(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = f"{time.time() + settings.READ_YOUR_WRITES_SECONDS:.3f}"
+                message["headers"] = [*message.get("headers", []), (PRIMARY_PIN_HEADER.lower().encode(), until.encode())]
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
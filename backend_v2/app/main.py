@@ -1,18 +1,65 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
+import logging
+import math
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeout
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.db.session import AsyncSessionLocal
+from app.db.unit_of_work import unit_of_work
 from app.db.init_db import init_db
+from app.crud import crud_user, crud_token
+from app.crud.pagination import InvalidCursor
+from app.core.hashing import password_hasher, PasswordHasherBusy
+from app.core.principal import token_versions
+from app.core.revocation import revoked_sessions
+from app.core.rate_limit import login_throttle, LoginThrottled
+from app.core.permissions import PermissionDenied
+from app.core.loop_monitor import event_loop_monitor
+from app.core.warmup import warmup
+from app.db.instrumentation import SQLStatsMiddleware
+from app.db.replica import PRIMARY_PIN_HEADER, ReadYourWritesMiddleware
+from app.db.timeouts import StatementTimeoutMiddleware, is_statement_timeout
+
+# Only app.* logs at INFO: SQLAlchemy would log every statement if its loggers inherited it
+logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s %(message)s")
+logging.getLogger("app").setLevel(logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def load_auth_state(session) -> None:
+    token_versions.replace(await crud_user.get_token_versions(session))
+    revoked_sessions.load(await crud_token.get_revoked_sessions(session))
+
+async def refresh_auth_state():
+    # Picks up role changes and logouts handled by other workers
+    while True:
+        await asyncio.sleep(settings.AUTH_STATE_REFRESH_SECONDS)
+        try:
+            async with AsyncSessionLocal() as session:
+                await load_auth_state(session)
+        except Exception:
+            logger.exception("Could not refresh auth state")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    async with AsyncSessionLocal() as session:
+    async with unit_of_work() as session:
         await init_db(session)
+        await crud_token.delete_expired_tokens(session)
+        await load_auth_state(session)
+    refresh_task = asyncio.create_task(refresh_auth_state())
+    event_loop_monitor.start()
+    warmup.start(app)
     yield
-    # Shutdown (if needed)
+    # Shutdown
+    warmup.stop()
+    event_loop_monitor.stop()
+    refresh_task.cancel()
+    password_hasher.shutdown()
+    await login_throttle.store.close()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -28,21 +75,62 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[PRIMARY_PIN_HEADER],
 )
+app.add_middleware(SQLStatsMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(StatementTimeoutMiddleware)
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Authentication service is busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+@app.exception_handler(LoginThrottled)
+async def login_throttled_handler(request: Request, exc: LoginThrottled):
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Too many login attempts, please retry later"},
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+    )
 
-from fastapi.staticfiles import StaticFiles
-import os
+@app.exception_handler(PermissionDenied)
+async def permission_denied_handler(request: Request, exc: PermissionDenied):
+    return JSONResponse(
+        status_code=status.HTTP_403_FORBIDDEN,
+        content={"detail": "Not enough permissions"},
+    )
 
-# ... (existing code)
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": "Invalid pagination cursor"},
+    )
+
+@app.exception_handler(DBAPIError)
+async def statement_timeout_handler(request: Request, exc: DBAPIError):
+    if not is_statement_timeout(exc):
+        raise exc
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": "The database took too long to answer"},
+    )
+
+@app.exception_handler(PoolTimeout)
+async def pool_timeout_handler(request: Request, exc: PoolTimeout):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database is busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
-# Mount static files
-static_dir = "static"
-os.makedirs(static_dir, exist_ok=True)
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
-
 @app.get("/")
 async def root():
     return {"message": f"Welcome to {settings.PROJECT_NAME} API"}
@@ -50,3 +138,13 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    # Liveness is /health; this one keeps the worker out of rotation until it is warm
+    if not warmup.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming_up"},
+        )
+    return {"status": "ready", "warmup": warmup.stats()}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
@@ -13,6 +13,11 @@ class Delivery(Base):
     comentario = Column(Text)
     fecha_entrega = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # Serves both per-milestone listings and the (student, milestone) lookup
+        Index("ix_entregas_id_hito_id_estudiante", "id_hito", "id_estudiante"),
+    )
+
     # Relationships
     hito = relationship("Milestone", back_populates="entregas")
     estudiante = relationship("User", back_populates="entregas")
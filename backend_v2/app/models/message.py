@@ -7,8 +7,8 @@ class Message(Base):
     __tablename__ = "mensajes"
 
     id_mensaje = Column(Integer, primary_key=True, index=True)
-    id_remitente = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="SET NULL"))
-    id_destinatario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="SET NULL"))
+    id_remitente = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="SET NULL"), index=True)
+    id_destinatario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="SET NULL"), index=True)
     asunto = Column(String(150))
     contenido = Column(Text)
     fecha_envio = Column(DateTime(timezone=True), server_default=func.now())
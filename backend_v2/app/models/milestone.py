@@ -6,7 +6,7 @@ class Milestone(Base):
     __tablename__ = "hitos"
 
     id_hito = Column(Integer, primary_key=True, index=True)
-    id_proyecto = Column(Integer, ForeignKey("proyectos.id_proyecto", ondelete="CASCADE"))
+    id_proyecto = Column(Integer, ForeignKey("proyectos.id_proyecto", ondelete="CASCADE"), index=True)
     titulo = Column(String(150))
     descripcion = Column(Text)
     fecha_entrega = Column(Date)
@@ -7,7 +7,7 @@ class Notification(Base):
     __tablename__ = "notificaciones"
 
     id_notificacion = Column(Integer, primary_key=True, index=True)
-    id_usuario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"))
+    id_usuario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"), index=True)
     titulo = Column(String(150))
     mensaje = Column(Text)
     fecha = Column(DateTime(timezone=True), server_default=func.now())
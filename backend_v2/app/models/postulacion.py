@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
@@ -7,12 +7,22 @@ class Postulacion(Base):
     __tablename__ = "postulaciones"
 
     id_postulacion = Column(Integer, primary_key=True, index=True)
-    id_iniciativa = Column(Integer, ForeignKey("iniciativas.id_iniciativa", ondelete="CASCADE"))
-    id_estudiante = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"))
+    id_iniciativa = Column(Integer, ForeignKey("iniciativas.id_iniciativa", ondelete="CASCADE"), index=True)
+    id_estudiante = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"), index=True)
     fecha_postulacion = Column(DateTime(timezone=True), server_default=func.now())
     estado = Column(String(30), default="pendiente")  # pendiente | aceptada | rechazada
     mensaje = Column(Text, nullable=True)
 
+    __table_args__ = (
+        # The review queue only ever looks at pending rows, a small slice of the table
+        Index(
+            "ix_postulaciones_pendientes",
+            "fecha_postulacion",
+            postgresql_where=text("estado = 'pendiente'"),
+            sqlite_where=text("estado = 'pendiente'"),
+        ),
+    )
+
     # Relationships
     iniciativa = relationship("Initiative", back_populates="postulaciones")
     estudiante = relationship("User", back_populates="postulaciones")
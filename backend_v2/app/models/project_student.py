@@ -6,7 +6,7 @@ class ProjectStudent(Base):
     __tablename__ = "proyectos_estudiantes"
 
     id_proyecto = Column(Integer, ForeignKey("proyectos.id_proyecto", ondelete="CASCADE"), primary_key=True)
-    id_estudiante = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"), primary_key=True)
+    id_estudiante = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"), primary_key=True, index=True)
     rol_en_proyecto = Column(String(50))
 
     # Relationships
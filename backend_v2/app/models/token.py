@@ -8,8 +8,8 @@ class Token(Base):
 
     id_token = Column(Integer, primary_key=True, index=True)
     id_usuario = Column(Integer, ForeignKey("usuarios.id_usuario", ondelete="CASCADE"))
-    token = Column(String, nullable=False)
-    tipo = Column(String(50), default='auth') # auth | recovery
+    token = Column(String, nullable=False, index=True)  # sha256 of the token for refresh tokens
+    tipo = Column(String(50), default='auth') # auth | recovery | refresh | revoked
     fecha_creacion = Column(DateTime(timezone=True), server_default=func.now())
     fecha_expiracion = Column(DateTime(timezone=True))
 
@@ -20,6 +20,7 @@ class User(Base):
     direccion = Column(String(255))
     identificador_fiscal = Column(String(50))
     id_rol = Column(Integer, ForeignKey("roles.id_rol", ondelete="SET NULL"))
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")  # bumped to invalidate issued tokens
     fecha_registro = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -1,6 +1,8 @@
 from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict
+from app.schemas.initiative import Initiative
+from app.schemas.user import Applicant, UserPublic
 
 # Shared properties
 class PostulacionBase(BaseModel):
@@ -25,4 +27,9 @@ class PostulacionInDBBase(PostulacionBase):
 
 # Additional properties to return via API
 class Postulacion(PostulacionInDBBase):
-    pass
+    estudiante: UserPublic | None = None
+    iniciativa: Initiative | None = None
+
+# Only returned by routes the policy limits to reviewers (see app.core.permissions)
+class PostulacionReview(Postulacion):
+    estudiante: Applicant | None = None
@@ -1,7 +1,7 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 from datetime import date
 from app.schemas.initiative import Initiative
-from app.schemas.user import User
+from app.schemas.user import UserPublic
 
 class ProjectBase(BaseModel):
     id_iniciativa: int
@@ -26,5 +26,7 @@ class ProjectInDBBase(ProjectBase):
     model_config = ConfigDict(from_attributes=True)
 
 class Project(ProjectInDBBase):
-    initiative: Initiative | None = None
-    coordinator: User | None = None
+    # Read from the model's iniciativa/coordinador relationships
+    initiative: Initiative | None = Field(None, validation_alias=AliasChoices("iniciativa", "initiative"))
+    # Served to anonymous visitors too (/projects/public): public fields only
+    coordinator: UserPublic | None = Field(None, validation_alias=AliasChoices("coordinador", "coordinator"))
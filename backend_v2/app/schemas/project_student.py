@@ -1,6 +1,6 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 from app.schemas.project import Project
-from app.schemas.user import User
+from app.schemas.user import UserPublic
 
 class ProjectStudentBase(BaseModel):
     id_proyecto: int
@@ -14,7 +14,7 @@ class ProjectStudentUpdate(ProjectStudentBase):
     rol_en_proyecto: str | None = None
 
 class ProjectStudent(ProjectStudentBase):
-    project: Project | None = None
-    student: User | None = None
+    project: Project | None = Field(None, validation_alias=AliasChoices("proyecto", "project"))
+    student: UserPublic | None = Field(None, validation_alias=AliasChoices("estudiante", "student"))
     
     model_config = ConfigDict(from_attributes=True)
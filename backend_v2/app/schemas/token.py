@@ -3,8 +3,16 @@ from app.schemas.user import User
 
 class Token(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str
     user: User
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
 class TokenData(BaseModel):
     email: str | None = None
+    id_usuario: int | None = None
+    id_rol: int | None = None
+    token_version: int = 0
+    session_id: int | None = None
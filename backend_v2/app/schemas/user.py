@@ -1,5 +1,7 @@
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, computed_field, field_serializer
+from app.core.media import media_url
+from app.core.roles import role_registry
 from app.schemas.role import Role
 
 class UserBase(BaseModel):
@@ -23,15 +25,52 @@ class UserUpdate(BaseModel):
     bio: str | None = None
     sitio_web: str | None = None
 
+class UserRoleUpdate(BaseModel):
+    id_rol: int
+
 class User(UserBase):
     id_usuario: int
     id_rol: int | None
     fecha_registro: datetime
-    role: Role | None = None
+    # Stored as file names, sent as signed URLs (see app.core.media)
+    foto: str | None = None
+    hoja_vida: str | None = None
+
+    @field_serializer("foto", "hoja_vida")
+    def sign_media(self, filename: str | None) -> str | None:
+        return media_url(filename)
+
+    @computed_field
+    @property
+    def role(self) -> Role | None:
+        # From the in-memory registry: no join or extra query per user
+        return role_registry.get(self.id_rol)
     
     class Config:
         from_attributes = True
 
+class UserPublic(BaseModel):
+    """What anyone may see of another user when nested in a response: no contact details or media."""
+    id_usuario: int
+    nombre: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+class Applicant(UserPublic):
+    """A student as seen by whoever may review their postulaciones: public fields and the CV."""
+    hoja_vida: str | None = None
+
+    @field_serializer("hoja_vida")
+    def sign_media(self, filename: str | None) -> str | None:
+        return media_url(filename)
+
+class UserSnapshot(User):
+    """Read-only copy of the authenticated user, cached between requests."""
+
+    class Config:
+        from_attributes = True
+        frozen = True
+
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
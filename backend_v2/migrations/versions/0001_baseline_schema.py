@@ -0,0 +1,249 @@
+"""baseline schema
+
+The schema as create_all built it before migrations existed. Databases created
+that way are stamped at this revision instead of running it (app/db/migrations.py).
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 07:12:53.063419
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('criterios',
+    sa.Column('id_criterio', sa.Integer(), nullable=False),
+    sa.Column('nombre', sa.String(length=100), nullable=True),
+    sa.Column('descripcion', sa.Text(), nullable=True),
+    sa.Column('peso', sa.Numeric(precision=4, scale=2), nullable=True),
+    sa.PrimaryKeyConstraint('id_criterio')
+    )
+    op.create_index(op.f('ix_criterios_id_criterio'), 'criterios', ['id_criterio'], unique=False)
+    op.create_table('roles',
+    sa.Column('id_rol', sa.Integer(), nullable=False),
+    sa.Column('nombre', sa.String(length=50), nullable=False),
+    sa.Column('descripcion', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id_rol'),
+    sa.UniqueConstraint('nombre')
+    )
+    op.create_index(op.f('ix_roles_id_rol'), 'roles', ['id_rol'], unique=False)
+    op.create_table('usuarios',
+    sa.Column('id_usuario', sa.Integer(), nullable=False),
+    sa.Column('nombre', sa.String(length=100), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('password', sa.String(length=255), nullable=False),
+    sa.Column('telefono', sa.String(length=20), nullable=True),
+    sa.Column('github', sa.String(length=255), nullable=True),
+    sa.Column('tecnologias', sa.Text(), nullable=True),
+    sa.Column('foto', sa.String(length=255), nullable=True),
+    sa.Column('hoja_vida', sa.String(length=255), nullable=True),
+    sa.Column('bio', sa.Text(), nullable=True),
+    sa.Column('sitio_web', sa.String(length=255), nullable=True),
+    sa.Column('direccion', sa.String(length=255), nullable=True),
+    sa.Column('identificador_fiscal', sa.String(length=50), nullable=True),
+    sa.Column('id_rol', sa.Integer(), nullable=True),
+    sa.Column('fecha_registro', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['id_rol'], ['roles.id_rol'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id_usuario')
+    )
+    op.create_index(op.f('ix_usuarios_email'), 'usuarios', ['email'], unique=True)
+    op.create_index(op.f('ix_usuarios_id_usuario'), 'usuarios', ['id_usuario'], unique=False)
+    op.create_table('auditoria',
+    sa.Column('id_log', sa.Integer(), nullable=False),
+    sa.Column('tabla_afectada', sa.String(length=50), nullable=True),
+    sa.Column('accion', sa.String(length=50), nullable=True),
+    sa.Column('id_usuario', sa.Integer(), nullable=True),
+    sa.Column('fecha', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('detalles', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['id_usuario'], ['usuarios.id_usuario'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id_log')
+    )
+    op.create_index(op.f('ix_auditoria_id_log'), 'auditoria', ['id_log'], unique=False)
+    op.create_table('iniciativas',
+    sa.Column('id_iniciativa', sa.Integer(), nullable=False),
+    sa.Column('nombre', sa.String(length=150), nullable=False),
+    sa.Column('descripcion', sa.Text(), nullable=False),
+    sa.Column('categoria', sa.String(length=50), nullable=True),
+    sa.Column('impacto', sa.Text(), nullable=True),
+    sa.Column('estado', sa.String(length=30), nullable=True),
+    sa.Column('id_usuario', sa.Integer(), nullable=True),
+    sa.Column('fecha_creacion', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['id_usuario'], ['usuarios.id_usuario'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_iniciativa')
+    )
+    op.create_index(op.f('ix_iniciativas_id_iniciativa'), 'iniciativas', ['id_iniciativa'], unique=False)
+    op.create_table('mensajes',
+    sa.Column('id_mensaje', sa.Integer(), nullable=False),
+    sa.Column('id_remitente', sa.Integer(), nullable=True),
+    sa.Column('id_destinatario', sa.Integer(), nullable=True),
+    sa.Column('asunto', sa.String(length=150), nullable=True),
+    sa.Column('contenido', sa.Text(), nullable=True),
+    sa.Column('fecha_envio', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('leido', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['id_destinatario'], ['usuarios.id_usuario'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['id_remitente'], ['usuarios.id_usuario'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id_mensaje')
+    )
+    op.create_index(op.f('ix_mensajes_id_mensaje'), 'mensajes', ['id_mensaje'], unique=False)
+    op.create_table('notificaciones',
+    sa.Column('id_notificacion', sa.Integer(), nullable=False),
+    sa.Column('id_usuario', sa.Integer(), nullable=True),
+    sa.Column('titulo', sa.String(length=150), nullable=True),
+    sa.Column('mensaje', sa.Text(), nullable=True),
+    sa.Column('fecha', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('leido', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['id_usuario'], ['usuarios.id_usuario'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_notificacion')
+    )
+    op.create_index(op.f('ix_notificaciones_id_notificacion'), 'notificaciones', ['id_notificacion'], unique=False)
+    op.create_table('tokens',
+    sa.Column('id_token', sa.Integer(), nullable=False),
+    sa.Column('id_usuario', sa.Integer(), nullable=True),
+    sa.Column('token', sa.String(), nullable=False),
+    sa.Column('tipo', sa.String(length=50), nullable=True),
+    sa.Column('fecha_creacion', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('fecha_expiracion', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['id_usuario'], ['usuarios.id_usuario'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_token')
+    )
+    op.create_index(op.f('ix_tokens_id_token'), 'tokens', ['id_token'], unique=False)
+    op.create_table('documentos_iniciativa',
+    sa.Column('id_doc', sa.Integer(), nullable=False),
+    sa.Column('id_iniciativa', sa.Integer(), nullable=True),
+    sa.Column('nombre_archivo', sa.String(length=255), nullable=True),
+    sa.Column('ruta_archivo', sa.String(length=255), nullable=True),
+    sa.Column('tipo', sa.String(length=50), nullable=True),
+    sa.ForeignKeyConstraint(['id_iniciativa'], ['iniciativas.id_iniciativa'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_doc')
+    )
+    op.create_index(op.f('ix_documentos_iniciativa_id_doc'), 'documentos_iniciativa', ['id_doc'], unique=False)
+    op.create_table('postulaciones',
+    sa.Column('id_postulacion', sa.Integer(), nullable=False),
+    sa.Column('id_iniciativa', sa.Integer(), nullable=True),
+    sa.Column('id_estudiante', sa.Integer(), nullable=True),
+    sa.Column('fecha_postulacion', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('estado', sa.String(length=30), nullable=True),
+    sa.Column('mensaje', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['id_estudiante'], ['usuarios.id_usuario'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['id_iniciativa'], ['iniciativas.id_iniciativa'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_postulacion')
+    )
+    op.create_index(op.f('ix_postulaciones_id_postulacion'), 'postulaciones', ['id_postulacion'], unique=False)
+    op.create_table('proyectos',
+    sa.Column('id_proyecto', sa.Integer(), nullable=False),
+    sa.Column('id_iniciativa', sa.Integer(), nullable=True),
+    sa.Column('titulo', sa.String(length=150), nullable=False),
+    sa.Column('descripcion', sa.Text(), nullable=True),
+    sa.Column('estado', sa.String(length=30), nullable=True),
+    sa.Column('fecha_inicio', sa.Date(), nullable=True),
+    sa.Column('fecha_fin', sa.Date(), nullable=True),
+    sa.Column('progreso', sa.Integer(), nullable=True),
+    sa.Column('id_coordinador', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['id_coordinador'], ['usuarios.id_usuario'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['id_iniciativa'], ['iniciativas.id_iniciativa'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_proyecto'),
+    sa.UniqueConstraint('id_iniciativa')
+    )
+    op.create_index(op.f('ix_proyectos_id_proyecto'), 'proyectos', ['id_proyecto'], unique=False)
+    op.create_table('comentarios',
+    sa.Column('id_comentario', sa.Integer(), nullable=False),
+    sa.Column('id_usuario', sa.Integer(), nullable=True),
+    sa.Column('id_proyecto', sa.Integer(), nullable=True),
+    sa.Column('contenido', sa.Text(), nullable=False),
+    sa.Column('fecha', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['id_proyecto'], ['proyectos.id_proyecto'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['id_usuario'], ['usuarios.id_usuario'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_comentario')
+    )
+    op.create_index(op.f('ix_comentarios_id_comentario'), 'comentarios', ['id_comentario'], unique=False)
+    op.create_table('evaluaciones',
+    sa.Column('id_eval', sa.Integer(), nullable=False),
+    sa.Column('id_proyecto', sa.Integer(), nullable=True),
+    sa.Column('id_evaluador', sa.Integer(), nullable=True),
+    sa.Column('id_criterio', sa.Integer(), nullable=True),
+    sa.Column('puntuacion', sa.Integer(), nullable=True),
+    sa.Column('observaciones', sa.Text(), nullable=True),
+    sa.CheckConstraint('puntuacion BETWEEN 0 AND 100', name='check_puntuacion_range'),
+    sa.ForeignKeyConstraint(['id_criterio'], ['criterios.id_criterio'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['id_evaluador'], ['usuarios.id_usuario'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['id_proyecto'], ['proyectos.id_proyecto'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_eval')
+    )
+    op.create_index(op.f('ix_evaluaciones_id_eval'), 'evaluaciones', ['id_eval'], unique=False)
+    op.create_table('hitos',
+    sa.Column('id_hito', sa.Integer(), nullable=False),
+    sa.Column('id_proyecto', sa.Integer(), nullable=True),
+    sa.Column('titulo', sa.String(length=150), nullable=True),
+    sa.Column('descripcion', sa.Text(), nullable=True),
+    sa.Column('fecha_entrega', sa.Date(), nullable=True),
+    sa.Column('estado', sa.String(length=30), nullable=True),
+    sa.ForeignKeyConstraint(['id_proyecto'], ['proyectos.id_proyecto'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_hito')
+    )
+    op.create_index(op.f('ix_hitos_id_hito'), 'hitos', ['id_hito'], unique=False)
+    op.create_table('proyectos_estudiantes',
+    sa.Column('id_proyecto', sa.Integer(), nullable=False),
+    sa.Column('id_estudiante', sa.Integer(), nullable=False),
+    sa.Column('rol_en_proyecto', sa.String(length=50), nullable=True),
+    sa.ForeignKeyConstraint(['id_estudiante'], ['usuarios.id_usuario'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['id_proyecto'], ['proyectos.id_proyecto'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_proyecto', 'id_estudiante')
+    )
+    op.create_table('entregas',
+    sa.Column('id_entrega', sa.Integer(), nullable=False),
+    sa.Column('id_hito', sa.Integer(), nullable=True),
+    sa.Column('id_estudiante', sa.Integer(), nullable=True),
+    sa.Column('archivo_url', sa.String(length=255), nullable=False),
+    sa.Column('comentario', sa.Text(), nullable=True),
+    sa.Column('fecha_entrega', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.ForeignKeyConstraint(['id_estudiante'], ['usuarios.id_usuario'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['id_hito'], ['hitos.id_hito'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id_entrega')
+    )
+    op.create_index(op.f('ix_entregas_id_entrega'), 'entregas', ['id_entrega'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_entregas_id_entrega'), table_name='entregas')
+    op.drop_table('entregas')
+    op.drop_table('proyectos_estudiantes')
+    op.drop_index(op.f('ix_hitos_id_hito'), table_name='hitos')
+    op.drop_table('hitos')
+    op.drop_index(op.f('ix_evaluaciones_id_eval'), table_name='evaluaciones')
+    op.drop_table('evaluaciones')
+    op.drop_index(op.f('ix_comentarios_id_comentario'), table_name='comentarios')
+    op.drop_table('comentarios')
+    op.drop_index(op.f('ix_proyectos_id_proyecto'), table_name='proyectos')
+    op.drop_table('proyectos')
+    op.drop_index(op.f('ix_postulaciones_id_postulacion'), table_name='postulaciones')
+    op.drop_table('postulaciones')
+    op.drop_index(op.f('ix_documentos_iniciativa_id_doc'), table_name='documentos_iniciativa')
+    op.drop_table('documentos_iniciativa')
+    op.drop_index(op.f('ix_tokens_id_token'), table_name='tokens')
+    op.drop_table('tokens')
+    op.drop_index(op.f('ix_notificaciones_id_notificacion'), table_name='notificaciones')
+    op.drop_table('notificaciones')
+    op.drop_index(op.f('ix_mensajes_id_mensaje'), table_name='mensajes')
+    op.drop_table('mensajes')
+    op.drop_index(op.f('ix_iniciativas_id_iniciativa'), table_name='iniciativas')
+    op.drop_table('iniciativas')
+    op.drop_index(op.f('ix_auditoria_id_log'), table_name='auditoria')
+    op.drop_table('auditoria')
+    op.drop_index(op.f('ix_usuarios_id_usuario'), table_name='usuarios')
+    op.drop_index(op.f('ix_usuarios_email'), table_name='usuarios')
+    op.drop_table('usuarios')
+    op.drop_index(op.f('ix_roles_id_rol'), table_name='roles')
+    op.drop_table('roles')
+    op.drop_index(op.f('ix_criterios_id_criterio'), table_name='criterios')
+    op.drop_table('criterios')
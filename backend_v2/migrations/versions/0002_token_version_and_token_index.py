@@ -0,0 +1,34 @@
+"""token version column and tokens.token index
+
+Both were added by ALTER statements in init_db before migrations existed, so
+databases stamped at the baseline may already have them.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 07:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if 'token_version' not in {column['name'] for column in inspector.get_columns('usuarios')}:
+        op.add_column('usuarios', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+    if 'ix_tokens_token' not in {index['name'] for index in inspector.get_indexes('tokens')}:
+        op.create_index(op.f('ix_tokens_token'), 'tokens', ['token'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_tokens_token'), table_name='tokens')
+    op.drop_column('usuarios', 'token_version')
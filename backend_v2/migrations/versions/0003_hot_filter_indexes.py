@@ -0,0 +1,63 @@
+"""indexes for hot filters
+
+Foreign keys and status columns the CRUD queries filter on, the (hito, estudiante)
+pair used for deliveries and a partial index over pending postulaciones.
+
+Plain CREATE INDEX (not CONCURRENTLY): migrations run inside a transaction,
+including the one opened by ensure_schema at startup.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs getting a single-column ix_<table>_<column> index
+_COLUMN_INDEXES = [
+    ('comentarios', 'id_proyecto'),
+    ('documentos_iniciativa', 'id_iniciativa'),
+    ('evaluaciones', 'id_proyecto'),
+    ('hitos', 'id_proyecto'),
+    ('iniciativas', 'estado'),
+    ('iniciativas', 'id_usuario'),
+    ('mensajes', 'id_destinatario'),
+    ('mensajes', 'id_remitente'),
+    ('notificaciones', 'id_usuario'),
+    ('postulaciones', 'id_estudiante'),
+    ('postulaciones', 'id_iniciativa'),
+    ('proyectos_estudiantes', 'id_estudiante'),
+]
+
+_PENDING = sa.text("estado = 'pendiente'")
+
+
+def upgrade() -> None:
+    for table, column in _COLUMN_INDEXES:
+        op.create_index(op.f(f'ix_{table}_{column}'), table, [column], unique=False)
+    op.create_index('ix_entregas_id_hito_id_estudiante', 'entregas', ['id_hito', 'id_estudiante'], unique=False)
+    op.create_index(
+        'ix_postulaciones_pendientes',
+        'postulaciones',
+        ['fecha_postulacion'],
+        unique=False,
+        postgresql_where=_PENDING,
+        sqlite_where=_PENDING,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_postulaciones_pendientes', table_name='postulaciones')
+    op.drop_index('ix_entregas_id_hito_id_estudiante', table_name='entregas')
+    for table, column in reversed(_COLUMN_INDEXES):
+        op.drop_index(op.f(f'ix_{table}_{column}'), table_name=table)
@@ -0,0 +1,88 @@
+"""
+Checks that nested response models are loaded with one query per related model,
+whatever the number of rows, and that rows already loaded in the request are not
+fetched again. Runs on an in-memory sqlite database (needs aiosqlite).
+"""
+import asyncio
+from typing import List
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.base import Base
+from app.db.batch_loader import load_relationships
+from app.models.initiative import Initiative
+from app.models.postulacion import Postulacion
+from app.models.project import Project
+from app.models.user import User
+from app.schemas.postulacion import Postulacion as PostulacionSchema
+from app.schemas.project import Project as ProjectSchema
+
+USERS = 10
+INITIATIVES = 30
+
+
+async def _run(check):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        users = [User(nombre=f"u{i}", email=f"u{i}@example.com", password="x") for i in range(USERS)]
+        session.add_all(users)
+        await session.flush()
+        initiatives = [
+            Initiative(nombre=f"i{i}", descripcion="d", id_usuario=users[i % USERS].id_usuario)
+            for i in range(INITIATIVES)
+        ]
+        session.add_all(initiatives)
+        await session.flush()
+        session.add_all(
+            Project(id_iniciativa=initiative.id_iniciativa, titulo=f"p{i}", id_coordinador=users[i % USERS].id_usuario)
+            for i, initiative in enumerate(initiatives)
+        )
+        session.add_all(
+            Postulacion(id_iniciativa=initiative.id_iniciativa, id_estudiante=users[i % USERS].id_usuario)
+            for i, initiative in enumerate(initiatives)
+        )
+        await session.commit()
+
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    try:
+        # A new session, as in a request: nothing is in its identity map yet
+        async with AsyncSession(engine) as session:
+            await check(session, statements)
+    finally:
+        await engine.dispose()
+
+
+def test_one_query_per_related_model():
+    async def check(session, statements):
+        projects = (await session.execute(select(Project))).scalars().all()
+        statements.clear()
+        await load_relationships(projects, List[ProjectSchema])
+        # Initiatives and coordinators, each in a single IN query
+        assert len(statements) == 2
+        for project in (ProjectSchema.model_validate(project) for project in projects):
+            assert project.initiative is not None and project.initiative.id_iniciativa == project.id_iniciativa
+            assert project.coordinator is not None and project.coordinator.id_usuario == project.id_coordinador
+
+    asyncio.run(_run(check))
+
+
+def test_rows_loaded_in_the_request_are_reused():
+    async def check(session, statements):
+        projects = (await session.execute(select(Project))).scalars().all()
+        await load_relationships(projects, List[ProjectSchema])
+        postulaciones = (await session.execute(select(Postulacion))).scalars().all()
+        statements.clear()
+        await load_relationships(postulaciones, List[PostulacionSchema])
+        # Every student and initiative was already loaded for the projects
+        assert statements == []
+        assert all(PostulacionSchema.model_validate(p).estudiante is not None for p in postulaciones)
+
+    asyncio.run(_run(check))
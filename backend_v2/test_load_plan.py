@@ -0,0 +1,70 @@
+"""
+Checks that a load plan fetches exactly what the response model serializes: the
+schema's columns and nothing else (no password), with each nested model loaded up
+front in one query. Runs on an in-memory sqlite database (needs aiosqlite).
+"""
+import asyncio
+from typing import List
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.base import Base
+from app.db.load_plan import load_plan, loading_by
+from app.models.initiative import Initiative
+from app.models.project import Project
+from app.models.user import User
+from app.schemas.page import Page
+from app.schemas.project import Project as ProjectSchema
+
+PROJECTS = 20
+
+
+def test_plan_follows_the_schema():
+    plan = load_plan(Project, Page[ProjectSchema])
+    assert {column.key for column in plan.columns} == set(ProjectSchema.model_fields) - {"initiative", "coordinator"}
+    # Cached per (model, response model)
+    assert load_plan(Project, Page[ProjectSchema]) is plan
+
+
+def test_plan_is_applied_to_selects_of_its_model():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            users = [User(nombre=f"u{i}", email=f"u{i}@example.com", password="x") for i in range(PROJECTS)]
+            session.add_all(users)
+            await session.flush()
+            initiatives = [Initiative(nombre=f"i{i}", descripcion="d", id_usuario=user.id_usuario) for i, user in enumerate(users)]
+            session.add_all(initiatives)
+            await session.flush()
+            session.add_all(
+                Project(id_iniciativa=initiative.id_iniciativa, titulo=f"p{i}", id_coordinador=users[i].id_usuario)
+                for i, initiative in enumerate(initiatives)
+            )
+            await session.commit()
+
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        try:
+            async with AsyncSession(engine) as session:
+                with loading_by(load_plan(Project, List[ProjectSchema])):
+                    projects = (await session.execute(select(Project))).scalars().all()
+        finally:
+            await engine.dispose()
+
+        # Projects, then initiatives and coordinators in one IN query each
+        assert len(statements) == 3
+        assert not any("password" in statement for statement in statements)
+        for project in projects:
+            assert "password" in inspect(project.coordinador).unloaded
+            schema = ProjectSchema.model_validate(project)
+            assert schema.initiative.id_iniciativa == project.id_iniciativa
+            assert schema.coordinator.id_usuario == project.id_coordinador
+
+    asyncio.run(run())
@@ -0,0 +1,82 @@
+"""
+Checks signed media URLs: a URL from media_url serves its file, one whose name,
+signature or expiry was altered is refused with 403, and names that could leave
+the upload directory are never served, even when signed (needs httpx).
+"""
+import asyncio
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from app.core import media
+from app.core.config import settings
+from app.main import app
+
+
+def _signed(filename: str) -> tuple[str, int, str]:
+    url = urlsplit(media.media_url(filename))
+    query = parse_qs(url.query)
+    return url.path, int(query["exp"][0]), query["sig"][0]
+
+
+def _tampered(signature: str) -> str:
+    return signature[:-1] + ("A" if signature[-1] != "A" else "B")
+
+
+def test_signature_covers_name_and_expiry():
+    path, expires, signature = _signed("foto.png")
+    assert path == f"{settings.API_V1_STR}/media/foto.png"
+    assert expires > time.time()
+    assert media.verify("foto.png", expires, signature)
+    assert not media.verify("otra.png", expires, signature)
+    assert not media.verify("foto.png", expires + 1, signature)
+    assert not media.verify("foto.png", expires, _tampered(signature))
+    past = int(time.time()) - 1
+    assert not media.verify("foto.png", past, media._signature("foto.png", past))
+
+
+@pytest.mark.parametrize("filename", ["", "..", "../main.py", "/etc/passwd", "sub/foto.png", ".env", ".foto.png"])
+def test_media_path_rejects_names_outside_the_upload_dir(filename):
+    assert media.media_path(filename) is None
+
+
+def test_media_path_of_a_plain_name():
+    assert media.media_path("foto.png") == f"{media.UPLOAD_DIR}/foto.png"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(media, "UPLOAD_DIR", str(tmp_path))
+    (tmp_path / "foto.png").write_bytes(b"png")
+    (tmp_path / ".env").write_bytes(b"SECRET_KEY=x")
+
+    async def get(url, **params):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.get(url, params=params or None)
+
+    return lambda url, **params: asyncio.run(get(url, **params))
+
+
+def test_endpoint_serves_a_signed_url(client):
+    response = client(media.media_url("foto.png"))
+    assert response.status_code == 200
+    assert response.content == b"png"
+    assert response.headers["cache-control"].startswith("private, max-age=")
+
+
+def test_endpoint_refuses_altered_urls(client):
+    path, expires, signature = _signed("foto.png")
+    other = path.replace("foto.png", "otra.png")
+    assert client(other, exp=expires, sig=signature).status_code == 403
+    assert client(path, exp=expires, sig=_tampered(signature)).status_code == 403
+    past = int(time.time()) - 1
+    assert client(path, exp=past, sig=media._signature("foto.png", past)).status_code == 403
+
+
+def test_endpoint_never_serves_dotfiles(client):
+    # Even with a valid signature for the name
+    path, expires, signature = _signed(".env")
+    assert client(path, exp=expires, sig=signature).status_code == 404
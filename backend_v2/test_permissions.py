@@ -0,0 +1,135 @@
+"""
+Checks the permission policy through the endpoints, on a sqlite database (needs
+aiosqlite and httpx): a role the policy leaves out gets a 403 before any query,
+and a role whose rule has a predicate only matches the rows it allows, so writes
+by a non-owner or non-member affect nothing and answer 404.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+httpx = pytest.importorskip("httpx")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.permissions import PermissionDenied, authorize
+from app.core.principal import Principal
+from app.core.roles import COORDINADOR, EMPRESA, ESTUDIANTE
+from app.core.security import create_access_token
+from app.db import unit_of_work
+from app.db.base import Base
+from app.main import app
+from app.models.initiative import Initiative
+from app.models.milestone import Milestone
+from app.models.project import Project
+from app.models.project_student import ProjectStudent
+from app.models.user import User
+
+# (id, role) of the users created below; OWNER owns the initiative and is a member of its project
+COORDINATOR = (1, COORDINADOR)
+OWNER = (2, ESTUDIANTE)
+OTHER_STUDENT = (3, ESTUDIANTE)
+COMPANY = (4, EMPRESA)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'permissions.db'}")
+    sessions = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(unit_of_work, "AsyncSessionLocal", sessions)
+    # GET /initiatives/{id} reads from the replica, which is the primary when none is configured
+    monkeypatch.setattr("app.api.deps.ReadSessionLocal", sessions)
+
+    async def setup():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add_all(
+                User(id_usuario=user_id, nombre=f"u{user_id}", email=f"u{user_id}@example.com", password="x", id_rol=role)
+                for user_id, role in (COORDINATOR, OWNER, OTHER_STUDENT, COMPANY)
+            )
+            session.add(Initiative(id_iniciativa=1, nombre="original", descripcion="d", id_usuario=OWNER[0]))
+            session.add(Project(id_proyecto=1, id_iniciativa=1, titulo="p", id_coordinador=COORDINATOR[0]))
+            session.add(ProjectStudent(id_proyecto=1, id_estudiante=OWNER[0]))
+            session.add(Milestone(id_hito=1, id_proyecto=1, titulo="h"))
+            await session.commit()
+
+    asyncio.run(setup())
+    yield lambda requests: asyncio.run(_with_client(requests))
+    asyncio.run(engine.dispose())
+
+
+async def _with_client(requests):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=f"http://test{settings.API_V1_STR}"
+    ) as client:
+        return await requests(client)
+
+
+def _auth(user: tuple[int, int]) -> dict:
+    user_id, role = user
+    token = create_access_token({"sub": f"u{user_id}@example.com", "uid": user_id, "rol": role, "ver": 0})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_roles_outside_the_policy_are_denied():
+    principal = Principal(id_usuario=4, email="u4@example.com", id_rol=EMPRESA, token_version=0)
+    with pytest.raises(PermissionDenied):
+        authorize(principal, "create", "milestone")
+    with pytest.raises(PermissionDenied):
+        authorize(Principal(id_usuario=9, email="u9@example.com", id_rol=None, token_version=0), "update", "initiative")
+
+
+def test_only_owner_or_coordinator_update_an_initiative(client):
+    async def requests(client):
+        for user in (OTHER_STUDENT, COMPANY):
+            denied = await client.put("/initiatives/1", json={"nombre": "hijacked"}, headers=_auth(user))
+            assert denied.status_code == 404
+        assert (await client.get("/initiatives/1")).json()["nombre"] == "original"
+
+        for name, user in (("by owner", OWNER), ("by coordinator", COORDINATOR)):
+            updated = await client.put("/initiatives/1", json={"nombre": name, "descripcion": "d"}, headers=_auth(user))
+            assert updated.status_code == 200
+            assert updated.json()["nombre"] == name
+
+    client(requests)
+
+
+def test_only_owner_deletes_an_initiative(client):
+    async def requests(client):
+        assert (await client.delete("/initiatives/1", headers=_auth(OTHER_STUDENT))).status_code == 404
+        assert (await client.get("/initiatives/1")).status_code == 200
+        assert (await client.delete("/initiatives/1", headers=_auth(OWNER))).status_code == 200
+        assert (await client.get("/initiatives/1")).status_code == 404
+
+    client(requests)
+
+
+def test_only_coordinators_create_milestones(client):
+    async def requests(client):
+        body = {"id_proyecto": 1, "titulo": "nuevo"}
+        assert (await client.post("/projects/1/milestones", json=body, headers=_auth(OWNER))).status_code == 403
+        assert (await client.post("/projects/99/milestones", json=body, headers=_auth(COORDINATOR))).status_code == 404
+        created = await client.post("/projects/1/milestones", json=body, headers=_auth(COORDINATOR))
+        assert created.status_code == 200
+        assert created.json()["id_proyecto"] == 1
+
+    client(requests)
+
+
+def test_only_project_members_deliver(client):
+    async def requests(client):
+        body = {"id_hito": 1, "archivo_url": "https://example.com/entrega.zip"}
+        url = "/projects/1/milestones/1/deliveries"
+        assert (await client.post(url, json=body, headers=_auth(COORDINATOR))).status_code == 403
+        assert (await client.post(url, json=body, headers=_auth(OTHER_STUDENT))).status_code == 404
+        # The milestone must belong to the project in the URL
+        assert (await client.post("/projects/2/milestones/1/deliveries", json=body, headers=_auth(OWNER))).status_code == 404
+        delivered = await client.post(url, json=body, headers=_auth(OWNER))
+        assert delivered.status_code == 200
+        assert delivered.json()["id_estudiante"] == OWNER[0]
+
+    client(requests)
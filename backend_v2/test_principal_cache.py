@@ -0,0 +1,111 @@
+"""
+Checks that the authenticated-user cache never serves a stale snapshot: a profile
+update or a role change (which also bumps the token version) evicts it once the
+write commits, and a snapshot loaded while such a write raced with it is not
+stored. Runs the endpoints on a sqlite database (needs aiosqlite and httpx).
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+httpx = pytest.importorskip("httpx")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.cache import TTLCache, principal_cache
+from app.core.config import settings
+from app.core.principal import token_versions
+from app.core.roles import COORDINADOR, EMPRESA, ESTUDIANTE, ROLES, role_registry
+from app.core.security import create_access_token
+from app.crud import crud_role
+from app.db import unit_of_work
+from app.db.base import Base
+from app.main import app
+from app.models.user import User
+
+COORDINATOR_EMAIL = "coordinadora@example.com"
+STUDENT_EMAIL = "estudiante@example.com"
+
+
+def test_a_load_that_raced_with_an_invalidation_is_not_stored():
+    cache = TTLCache(maxsize=10, ttl=60)
+    epoch = cache.epoch()
+    # The user is written (and evicted) while their old row is being read
+    cache.invalidate("key")
+    cache.set("key", "stale", epoch=epoch)
+    assert cache.get("key") is None
+    cache.set("key", "fresh", epoch=cache.epoch())
+    assert cache.get("key") == "fresh"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'principal.db'}")
+    monkeypatch.setattr(
+        unit_of_work, "AsyncSessionLocal", sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    )
+
+    async def setup():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            role_registry.load(await crud_role.seed_roles(session, ROLES))
+            session.add_all([
+                User(id_usuario=1, nombre="Coordinadora", email=COORDINATOR_EMAIL, password="x", id_rol=COORDINADOR),
+                User(id_usuario=2, nombre="Estudiante", email=STUDENT_EMAIL, password="x", id_rol=ESTUDIANTE),
+            ])
+            await session.commit()
+
+    asyncio.run(setup())
+    principal_cache.clear()
+    yield lambda requests: asyncio.run(_with_client(requests))
+    principal_cache.clear()
+    token_versions.replace([])
+    asyncio.run(engine.dispose())
+
+
+async def _with_client(requests):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=f"http://test{settings.API_V1_STR}"
+    ) as client:
+        return await requests(client)
+
+
+def _auth(user_id: int, email: str, role: int, version: int = 0) -> dict:
+    token = create_access_token({"sub": email, "uid": user_id, "rol": role, "ver": version})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_profile_update_evicts_the_snapshot(client):
+    async def requests(client):
+        headers = _auth(2, STUDENT_EMAIL, ESTUDIANTE)
+        assert (await client.get("/users/me", headers=headers)).json()["nombre"] == "Estudiante"
+        assert principal_cache.get(STUDENT_EMAIL) is not None
+
+        updated = await client.put("/users/me", json={"nombre": "Renombrada"}, headers=headers)
+        assert updated.status_code == 200
+        assert principal_cache.get(STUDENT_EMAIL) is None
+        assert (await client.get("/users/me", headers=headers)).json()["nombre"] == "Renombrada"
+
+    client(requests)
+
+
+def test_role_change_evicts_the_snapshot_and_old_tokens(client):
+    async def requests(client):
+        old = _auth(2, STUDENT_EMAIL, ESTUDIANTE)
+        assert (await client.get("/users/me", headers=old)).json()["id_rol"] == ESTUDIANTE
+
+        changed = await client.put(
+            "/users/2/role", json={"id_rol": EMPRESA}, headers=_auth(1, COORDINATOR_EMAIL, COORDINADOR)
+        )
+        assert changed.status_code == 200
+        assert principal_cache.get(STUDENT_EMAIL) is None
+        assert not token_versions.is_current(2, 0)
+        # The token carrying the old role is refused; one with the new version sees the new role
+        assert (await client.get("/users/me", headers=old)).status_code == 401
+        new = _auth(2, STUDENT_EMAIL, EMPRESA, version=1)
+        assert (await client.get("/users/me", headers=new)).json()["id_rol"] == EMPRESA
+
+    client(requests)
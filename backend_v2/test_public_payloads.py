@@ -0,0 +1,115 @@
+"""
+Checks that users nested in responses carry only their public fields: no email,
+phone or media URLs on the anonymous project listing or a student's postulaciones,
+and the CV only on the review queue the policy limits to coordinators. Runs the
+endpoints on a sqlite database (needs aiosqlite and httpx).
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+httpx = pytest.importorskip("httpx")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.roles import COORDINADOR, ESTUDIANTE
+from app.core.security import create_access_token
+from app.db import unit_of_work
+from app.db.base import Base
+from app.main import app
+from app.models.initiative import Initiative
+from app.models.postulacion import Postulacion
+from app.models.project import Project
+from app.models.user import User
+
+PUBLIC_FIELDS = {"id_usuario", "nombre"}
+PRIVATE_VALUES = ("@example.com", "3001234567", "foto.png", "/media/")
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'payloads.db'}")
+    monkeypatch.setattr(
+        unit_of_work, "AsyncSessionLocal", sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    )
+    # /projects/public reads from the replica, which is the primary when none is configured
+    monkeypatch.setattr(
+        "app.api.deps.ReadSessionLocal", sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    )
+
+    async def setup():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            users = [
+                User(
+                    nombre=name, email=f"{name}@example.com", password="x", id_rol=role,
+                    telefono="3001234567", foto="foto.png", hoja_vida=f"cv_{name}.pdf",
+                )
+                for name, role in (("coordinadora", COORDINADOR), ("estudiante", ESTUDIANTE))
+            ]
+            session.add_all(users)
+            await session.flush()
+            coordinator, student = users
+            initiative = Initiative(nombre="i", descripcion="d", id_usuario=coordinator.id_usuario)
+            session.add(initiative)
+            await session.flush()
+            session.add(Project(id_iniciativa=initiative.id_iniciativa, titulo="p", id_coordinador=coordinator.id_usuario))
+            session.add(Postulacion(id_iniciativa=initiative.id_iniciativa, id_estudiante=student.id_usuario))
+            await session.commit()
+
+    asyncio.run(setup())
+    yield lambda requests: asyncio.run(_with_client(requests))
+    asyncio.run(engine.dispose())
+
+
+async def _with_client(requests):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=f"http://test{settings.API_V1_STR}"
+    ) as client:
+        return await requests(client)
+
+
+def _auth(user_id: int, role: int) -> dict:
+    token = create_access_token({"sub": f"user{user_id}@example.com", "uid": user_id, "rol": role, "ver": 0})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_public_projects_show_only_public_coordinator_fields(client):
+    async def requests(client):
+        return await client.get("/projects/public")
+
+    response = client(requests)
+    assert response.status_code == 200
+    [project] = response.json()["items"]
+    assert set(project["coordinator"]) == PUBLIC_FIELDS
+    assert not any(value in response.text for value in PRIVATE_VALUES)
+
+
+def test_students_postulaciones_show_only_public_fields(client):
+    async def requests(client):
+        return await client.get("/postulaciones/me", headers=_auth(2, ESTUDIANTE))
+
+    response = client(requests)
+    assert response.status_code == 200
+    [postulacion] = response.json()
+    assert set(postulacion["estudiante"]) == PUBLIC_FIELDS
+    assert not any(value in response.text for value in PRIVATE_VALUES)
+
+
+def test_only_reviewers_get_the_cv(client):
+    async def requests(client):
+        denied = await client.get("/postulaciones/pending", headers=_auth(2, ESTUDIANTE))
+        allowed = await client.get("/postulaciones/pending", headers=_auth(1, COORDINADOR))
+        return denied, allowed
+
+    denied, allowed = client(requests)
+    assert denied.status_code == 403
+    assert allowed.status_code == 200
+    [postulacion] = allowed.json()
+    assert set(postulacion["estudiante"]) == PUBLIC_FIELDS | {"hoja_vida"}
+    assert postulacion["estudiante"]["hoja_vida"].startswith(f"{settings.API_V1_STR}/media/cv_estudiante.pdf?exp=")
+    assert "@example.com" not in allowed.text and "foto.png" not in allowed.text
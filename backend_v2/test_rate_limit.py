@@ -0,0 +1,138 @@
+"""
+Checks the login throttle's token buckets and admission control, in process, and
+that a refused login answers 429 with Retry-After.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from starlette.requests import Request
+
+from app.core import rate_limit
+from app.core.rate_limit import LoginThrottle, LoginThrottled, MemoryBucketStore, client_ip
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_bucket_refills_and_tells_when_to_retry(clock):
+    async def run():
+        store = MemoryBucketStore()
+        # A burst of 3, then one token every 2 seconds
+        assert [await store.take("k", 3, 0.5) for _ in range(3)] == [0, 0, 0]
+        assert await store.take("k", 3, 0.5) == pytest.approx(2)
+        clock.now += 1.5
+        # Half a second short of the next token
+        assert await store.take("k", 3, 0.5) == pytest.approx(0.5)
+        clock.now += 0.5
+        assert await store.take("k", 3, 0.5) == 0
+        # Never refills past the burst
+        clock.now += 3600
+        assert [await store.take("k", 3, 0.5) for _ in range(4)][3] > 0
+        # Buckets are independent
+        assert await store.take("other", 3, 0.5) == 0
+
+    asyncio.run(run())
+
+
+def _throttle(**overrides) -> LoginThrottle:
+    limits = dict(account_burst=2, account_per_minute=6, ip_burst=2, ip_per_minute=60, max_concurrent=1)
+    return LoginThrottle(MemoryBucketStore(), **{**limits, **overrides})
+
+
+def test_admit_limits_each_account_and_ip(clock):
+    async def run():
+        throttle = _throttle()
+        # The account is the same whatever its case or padding
+        await throttle.admit("ana@example.com", "203.0.113.7")
+        await throttle.admit(" ANA@example.com", "203.0.113.8")
+        with pytest.raises(LoginThrottled) as refused:
+            await throttle.admit("ana@example.com", "203.0.113.9")
+        assert refused.value.retry_after == pytest.approx(10)
+        # One IP trying many accounts
+        await throttle.admit("bob@example.com", "198.51.100.1")
+        await throttle.admit("eva@example.com", "198.51.100.1")
+        with pytest.raises(LoginThrottled):
+            await throttle.admit("joe@example.com", "198.51.100.1")
+        clock.now += 1
+        await throttle.admit("joe@example.com", "198.51.100.1")
+        stats = throttle.stats()
+        assert (stats["rejected_account"], stats["rejected_ip"]) == (1, 1)
+
+    asyncio.run(run())
+
+
+def test_verifications_are_capped():
+    async def run():
+        throttle = _throttle(max_concurrent=2)
+        async with throttle.verification(), throttle.verification():
+            with pytest.raises(LoginThrottled):
+                async with throttle.verification():
+                    pass
+        # Slots are given back, also when the verification fails
+        with pytest.raises(RuntimeError):
+            async with throttle.verification():
+                raise RuntimeError
+        async with throttle.verification(), throttle.verification():
+            assert throttle.stats()["active"] == 2
+        assert throttle.stats()["rejected_concurrency"] == 1
+
+    asyncio.run(run())
+
+
+def test_refused_login_answers_429_with_retry_after(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    from app.api.v1.endpoints import auth
+    from app.core.config import settings
+    from app.main import app
+
+    class Exhausted:
+        async def take(self, key, capacity, refill_per_second):
+            return 2.2
+
+    monkeypatch.setattr(auth, "login_throttle", _throttle())
+    monkeypatch.setattr(auth.login_throttle, "store", Exhausted())
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post(
+                f"{settings.API_V1_STR}/auth/login", data={"username": "ana@example.com", "password": "x"}
+            )
+
+    response = asyncio.run(run())
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "3"
+
+
+def test_memory_store_keeps_at_most_max_keys():
+    async def run():
+        store = MemoryBucketStore(max_keys=100)
+        await store.take("kept", 5, 1)
+        for i in range(1000):
+            await store.take(f"flood:{i}", 5, 1)
+            # Touching a bucket keeps it from being the least recently used
+            await store.take("kept", 5, 1000)
+            assert len(store) <= 100
+        assert "kept" in store._buckets
+        assert "flood:0" not in store._buckets
+
+    asyncio.run(run())
+
+
+def _request(peer: str, forwarded: str | None = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+
+def test_client_ip_is_read_through_trusted_proxies_only(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_trusted_proxies", rate_limit._networks(["10.0.0.0/8"]))
+    # From the proxy: the address it appended, not what the client claims further left
+    assert client_ip(_request("10.0.0.2", "1.1.1.1, 203.0.113.7")) == "203.0.113.7"
+    assert client_ip(_request("10.0.0.2", "203.0.113.7, 10.0.0.9")) == "203.0.113.7"
+    # Straight from a client: its header is ignored
+    assert client_ip(_request("198.51.100.4", "203.0.113.7")) == "198.51.100.4"
+    assert client_ip(_request("10.0.0.2")) == "10.0.0.2"
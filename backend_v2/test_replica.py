@@ -0,0 +1,109 @@
+"""
+Checks read-your-writes routing (needs aiosqlite and httpx): successful writes hand
+out a primary pin that lasts at most READ_YOUR_WRITES_SECONDS, reads carrying a live
+pin go to the primary and every other read to the replica, a pin a client stretched
+or forged is ignored, and without a replica configured reads use the primary.
+"""
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+httpx = pytest.importorskip("httpx")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db import session as db_session
+from app.db import unit_of_work
+from app.db.base import Base
+from app.db.replica import PRIMARY_PIN_HEADER, pinned_to_primary
+from app.main import app
+from app.models.initiative import Initiative
+from app.models.user import User
+
+WINDOW = settings.READ_YOUR_WRITES_SECONDS
+
+
+def test_without_a_replica_reads_use_the_primary():
+    if settings.DATABASE_READ_URL:
+        pytest.skip("a replica is configured in this environment")
+    assert db_session.read_engine is db_session.engine
+    assert db_session.ReadSessionLocal is db_session.AsyncSessionLocal
+
+
+@pytest.mark.parametrize("value", [None, "", "soon", "nan", "inf"])
+def test_malformed_pins_are_ignored(value):
+    assert pinned_to_primary(value) is False
+
+
+@pytest.mark.parametrize(
+    "seconds_from_now, pinned",
+    [
+        (-1, False),
+        (WINDOW / 2, True),
+        # Longer than one write could pin: a client can't pin itself for good
+        (WINDOW + 60, False),
+    ],
+)
+def test_pin_is_bounded_by_the_write_window(seconds_from_now, pinned):
+    assert pinned_to_primary(f"{time.time() + seconds_from_now:.3f}") is pinned
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # Two databases that differ in one row, to tell which one served a read
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    primary_sessions = sessionmaker(primary, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(unit_of_work, "AsyncSessionLocal", primary_sessions)
+    monkeypatch.setattr("app.api.deps.AsyncSessionLocal", primary_sessions)
+    monkeypatch.setattr("app.api.deps.ReadSessionLocal", sessionmaker(replica, class_=AsyncSession, expire_on_commit=False))
+
+    async def setup():
+        for engine, name in ((primary, "primary"), (replica, "replica")):
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+            async with AsyncSession(engine) as session:
+                session.add(User(id_usuario=1, nombre="u", email="u@example.com", password="x"))
+                session.add(Initiative(id_iniciativa=1, nombre=name, descripcion="d", id_usuario=1))
+                await session.commit()
+
+    asyncio.run(setup())
+    yield lambda requests: asyncio.run(_with_client(requests))
+    asyncio.run(primary.dispose())
+    asyncio.run(replica.dispose())
+
+
+async def _with_client(requests):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url=f"http://test{settings.API_V1_STR}"
+    ) as client:
+        return await requests(client)
+
+
+def test_writes_pin_the_client_to_the_primary(client):
+    token = create_access_token({"sub": "u@example.com", "uid": 1, "rol": None, "ver": 0})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async def requests(client):
+        read = await client.get("/initiatives/1")
+        failed = await client.post("/initiatives/", json={}, headers=headers)
+        before = time.time()
+        written = await client.post("/initiatives/", json={"nombre": "n", "descripcion": "d"}, headers=headers)
+        pin = written.headers.get(PRIMARY_PIN_HEADER)
+        pinned = await client.get("/initiatives/1", headers={PRIMARY_PIN_HEADER: pin})
+        stretched = await client.get("/initiatives/1", headers={PRIMARY_PIN_HEADER: f"{time.time() + WINDOW + 60:.3f}"})
+        return read, failed, before, written, pin, pinned, stretched
+
+    read, failed, before, written, pin, pinned, stretched = client(requests)
+    assert read.json()["nombre"] == "replica"
+    assert PRIMARY_PIN_HEADER not in read.headers
+    assert failed.status_code == 422 and PRIMARY_PIN_HEADER not in failed.headers
+    assert written.status_code == 200
+    assert before < float(pin) <= time.time() + WINDOW
+    assert pinned.json()["nombre"] == "primary"
+    assert stretched.json()["nombre"] == "replica"
@@ -0,0 +1,46 @@
+"""
+Checks role seeding on a sqlite database (needs aiosqlite): missing roles are
+inserted with the ids authorization expects, and rows that exist are loaded as
+they are, never overwritten.
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.roles import COORDINADOR, EMPRESA, ESTUDIANTE, ROLES, RoleRegistry
+from app.crud import crud_role
+from app.db.base import Base
+from app.models.role import Role
+
+
+def test_seeding_inserts_missing_roles_only():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            async with AsyncSession(engine) as session:
+                rows = await crud_role.seed_roles(session, ROLES)
+                await session.commit()
+            registry = RoleRegistry()
+            registry.load(rows)
+            assert [role.id_rol for role in registry.all()] == [COORDINADOR, ESTUDIANTE, EMPRESA]
+
+            # An admin edits a description; the next startup keeps it
+            async with AsyncSession(engine) as session:
+                await session.execute(update(Role).where(Role.id_rol == EMPRESA).values(descripcion="editada"))
+                await session.commit()
+            async with AsyncSession(engine) as session:
+                rows = await crud_role.seed_roles(session, ROLES)
+                await session.commit()
+            assert len(rows) == len(ROLES)
+            assert {row.nombre: row.descripcion for row in rows}["empresa"] == "editada"
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
@@ -7,6 +7,11 @@ const api = axios.create({
     },
 });
 
+// Tras una escritura el backend devuelve hasta cuándo leer del primario
+// (la réplica puede ir unos segundos atrasada); se reenvía mientras siga vigente
+const PRIMARY_PIN_HEADER = 'X-Read-Primary-Until';
+let readPrimaryUntil = null;
+
 // Interceptor para agregar el token a las peticiones
 api.interceptors.request.use(
     (config) => {
@@ -14,6 +19,9 @@ api.interceptors.request.use(
         if (token) {
             config.headers.Authorization = `Bearer ${token}`;
         }
+        if (readPrimaryUntil && Date.now() / 1000 < readPrimaryUntil) {
+            config.headers[PRIMARY_PIN_HEADER] = readPrimaryUntil;
+        }
         return config;
     },
     (error) => {
@@ -21,4 +29,52 @@ api.interceptors.request.use(
     }
 );
 
+// El access token dura pocos minutos: al recibir un 401 se renueva una sola vez
+// con el refresh token (compartiendo la petición entre llamadas concurrentes)
+let refreshPromise = null;
+
+const refreshAccessToken = async () => {
+    const refreshToken = localStorage.getItem('refresh_token');
+    if (!refreshToken) {
+        throw new Error('No refresh token');
+    }
+    const response = await axios.post(`${api.defaults.baseURL}/auth/refresh`, {
+        refresh_token: refreshToken,
+    });
+    localStorage.setItem('token', response.data.access_token);
+    localStorage.setItem('refresh_token', response.data.refresh_token);
+    return response.data.access_token;
+};
+
+api.interceptors.response.use(
+    (response) => {
+        const pin = response.headers[PRIMARY_PIN_HEADER.toLowerCase()];
+        if (pin) {
+            readPrimaryUntil = Number(pin);
+        }
+        return response;
+    },
+    async (error) => {
+        const original = error.config;
+        const isAuthRoute = original?.url?.startsWith('/auth/');
+        if (error.response?.status !== 401 || !original || original._retry || isAuthRoute) {
+            return Promise.reject(error);
+        }
+        original._retry = true;
+        try {
+            refreshPromise = refreshPromise || refreshAccessToken();
+            const token = await refreshPromise;
+            original.headers.Authorization = `Bearer ${token}`;
+            return api(original);
+        } catch (refreshError) {
+            localStorage.removeItem('token');
+            localStorage.removeItem('refresh_token');
+            localStorage.removeItem('user');
+            return Promise.reject(error);
+        } finally {
+            refreshPromise = null;
+        }
+    }
+);
+
 export default api;
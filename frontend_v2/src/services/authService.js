@@ -14,6 +14,7 @@ export const authService = {
 
         if (response.data.access_token) {
             localStorage.setItem('token', response.data.access_token);
+            localStorage.setItem('refresh_token', response.data.refresh_token);
             localStorage.setItem('user', JSON.stringify(response.data.user));
         }
         return response.data;
@@ -40,7 +41,15 @@ export const authService = {
     },
 
     logout() {
+        // Revoca la sesión en el servidor; la limpieza local no depende de la respuesta
+        const token = localStorage.getItem('token');
+        if (token) {
+            api.post('/auth/logout', null, {
+                headers: { Authorization: `Bearer ${token}` }
+            }).catch(() => {});
+        }
         localStorage.removeItem('token');
+        localStorage.removeItem('refresh_token');
         localStorage.removeItem('user');
     },
 
@@ -53,6 +62,8 @@ export const authService = {
     isAuthenticated() {
         const token = localStorage.getItem('token');
         if (!token) return false;
+        // Un access token vencido se renueva con el refresh token en la siguiente petición
+        if (localStorage.getItem('refresh_token')) return true;
 
         try {
             const decoded = jwtDecode(token);
@@ -1,9 +1,9 @@
 import api from '../api/axios';
 
 export const initiativeService = {
-    async getAll() {
-        const response = await api.get('/initiatives/');
-        return response.data;
+    async getAll(params) {
+        const response = await api.get('/initiatives/', { params });
+        return response.data.items;
     },
 
     async getById(id) {
@@ -6,9 +6,9 @@ export const projectService = {
         return response.data;
     },
 
-    async getPublicProjects() {
-        const response = await api.get('/projects/public');
-        return response.data;
+    async getPublicProjects(params) {
+        const response = await api.get('/projects/public', { params });
+        return response.data.items;
     },
 
     async getById(id) {